@@ -0,0 +1,97 @@
+# adapters/cache/analysis_result_cache.py
+import hashlib
+import sys
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from nuvia.application.services.bias_detection_service import BiasDetectionService
+from nuvia.application.services.metrics import metrics
+from nuvia.application.use_cases.analyze_article_use_case import AnalysisResult
+from nuvia.domain.value_objects.segment_table import SegmentTable
+from nuvia.adapters.cache.sentence_result_cache import CacheStats
+
+# Custo aproximado de um BiasSegment (objeto + atributos), além das strings
+_SEGMENT_OVERHEAD = 200
+
+
+def analysis_cache_key(detector: BiasDetectionService, source: str, *identity) -> str:
+    """
+    Chave de uma análise completa: origem ("wikipedia", "text"...), o que
+    identifica o conteúdo (título + revisão, ou hash do texto) e a configuração
+    do detector (id, versão do modelo e limiar).
+    """
+    parts = (source, *map(str, identity), detector.detector_id, detector.model_version, repr(detector.threshold))
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def text_fingerprint(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def estimate_result_size(result: AnalysisResult) -> int:
+    """Tamanho aproximado, em bytes, de um AnalysisResult em memória."""
+    size = sys.getsizeof(result) + sys.getsizeof(result.article_title) + 100 * len(result.timings)
+    if isinstance(result.segments, SegmentTable):
+        table = result.segments
+        # O texto de origem fica vivo enquanto o resultado estiver no cache
+        return (size + table.nbytes + sum(map(sys.getsizeof, table.sources))
+                + sum(map(sys.getsizeof, table.reasons)))
+    for seg in result.segments:
+        size += _SEGMENT_OVERHEAD + sys.getsizeof(seg.text) + sys.getsizeof(seg.reason)
+    return size
+
+
+class AnalysisResultCache:
+    """
+    LRU em memória de análises completas, compartilhado por todas as sessões do
+    processo e limitado pelo tamanho aproximado dos resultados (`max_bytes`),
+    não pela quantidade: um artigo enorme ocupa o lugar de muitos pequenos.
+
+    Os AnalysisResult são imutáveis, então o mesmo objeto pode ser devolvido a
+    várias sessões.
+    """
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, Tuple[AnalysisResult, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> Optional[AnalysisResult]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                metrics.increment("nuvia_cache_misses_total", cache="results")
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+        metrics.increment("nuvia_cache_hits_total", cache="results")
+        return entry[0]
+
+    def put(self, key: str, result: AnalysisResult):
+        size = estimate_result_size(result)
+        if size > self.max_bytes:
+            return # Não cabe: guardá-lo apagaria todo o resto
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (result, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,50 @@
+# adapters/cache/analysis_snapshot_store.py
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Optional
+
+from nuvia.application.use_cases.incremental_analysis_use_case import AnalysisSnapshot
+
+
+class AnalysisSnapshotStore:
+    """
+    Guarda em SQLite a última análise de cada artigo (por detector), usada pela
+    reanálise incremental. Os snapshots são gravados como JSON comprimido (zlib).
+
+    Vários processos podem usar o mesmo arquivo (ex.: os workers do nuvia-batch).
+    """
+    def __init__(self, path: Path):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS snapshots ("
+            " title TEXT NOT NULL, detector_key TEXT NOT NULL, data BLOB NOT NULL, updated_at REAL NOT NULL,"
+            " PRIMARY KEY (title, detector_key))"
+        )
+        self._db.commit()
+
+    def get(self, title: str, detector_key: str) -> Optional[AnalysisSnapshot]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT data FROM snapshots WHERE title = ? AND detector_key = ?", (title, detector_key)
+            ).fetchone()
+        if row is None:
+            return None
+        return AnalysisSnapshot.from_dict(json.loads(zlib.decompress(row[0])))
+
+    def put(self, title: str, snapshot: AnalysisSnapshot):
+        data = zlib.compress(json.dumps(snapshot.to_dict(), separators=(",", ":")).encode("utf-8"))
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO snapshots (title, detector_key, data, updated_at) VALUES (?, ?, ?, ?)",
+                (title, snapshot.detector_key, data, time.time()),
+            )
+            self._db.commit()
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,79 @@
+# adapters/cache/cached_bias_detector.py
+from typing import Dict, List, Optional, Sequence, Union
+
+from nuvia.adapters.cache.sentence_result_cache import CacheStats, SentenceResultCache, sentence_cache_key
+from nuvia.application.services.bias_detection_service import BiasDetectionService
+from nuvia.domain.value_objects.bias_segment import BiasSegment
+from nuvia.domain.value_objects.document import Document
+
+
+class CachedBiasDetector(BiasDetectionService):
+    """
+    Envolve qualquer BiasDetectionService com um cache de resultados por sentença.
+
+    Ao reanalisar um artigo (ou uma revisão levemente editada dele), apenas as
+    sentenças que não estão no cache são enviadas ao detector original.
+    Resultados que o detector marca como não confiáveis (ex.: o modelo não
+    carregou) são devolvidos, mas não guardados.
+    """
+    def __init__(self, detector: BiasDetectionService, cache: Optional[SentenceResultCache] = None):
+        self.detector = detector
+        self.cache = cache if cache is not None else SentenceResultCache()
+
+    @property
+    def threshold(self):
+        return self.detector.threshold
+
+    @property
+    def detector_id(self):
+        return self.detector.detector_id
+
+    @property
+    def model_version(self):
+        return self.detector.model_version
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.cache.stats
+
+    def as_document(self, text: Union[str, Document]) -> Document:
+        return self.detector.as_document(text)
+
+    def detect(self, text: Union[str, Document]) -> List[BiasSegment]:
+        return self.detect_document(self.as_document(text))
+
+    def detect_sentences(self, sentences: List[str],
+                         words: Optional[Sequence[List[str]]] = None) -> List[List[BiasSegment]]:
+        keys = [
+            sentence_cache_key(self.detector_id, self.model_version, self.threshold, sent)
+            for sent in sentences
+        ]
+
+        # Uma consulta ao cache para o lote inteiro
+        cached: Dict[str, list] = self.cache.get_many(keys)
+        missing: Dict[str, int] = {}  # chave -> posição (sentenças repetidas rodam uma vez só)
+        for position, key in enumerate(keys):
+            if key not in cached and key not in missing:
+                missing[key] = position
+
+        if missing:
+            positions = list(missing.values())
+            found, reliable = self.detector.detect_sentences_checked(
+                [sentences[p] for p in positions],
+                words=[words[p] for p in positions] if words is not None else None,
+            )
+            new = {
+                key: [[seg.text, seg.reason, seg.score] for seg in segments]
+                for key, segments in zip(missing.keys(), found)
+            }
+            # Um único commit para o lote, só com os resultados confiáveis
+            self.cache.put_many((key, new[key]) for key, ok in zip(missing.keys(), reliable) if ok)
+            cached.update(new)
+
+        return [
+            [BiasSegment(text=text, reason=reason, score=score) for text, reason, score in cached[key]]
+            for key in keys
+        ]
+
+    def summarize_bias(self, segments: List[BiasSegment]) -> str:
+        return self.detector.summarize_bias(segments)
@@ -0,0 +1,154 @@
+# adapters/cache/sentence_result_cache.py
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    disk_hits: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def sentence_cache_key(detector_id: str, model_version: str, threshold: float, sentence: str) -> str:
+    """Chave endereçada por conteúdo: hash de (detector, versão do modelo, limiar, sentença)."""
+    payload = "\x1f".join((detector_id, model_version, repr(threshold), sentence))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SentenceResultCache:
+    """
+    Cache de resultados por sentença em dois níveis:
+    1. LRU em memória, limitado a `max_entries` itens.
+    2. (Opcional) SQLite em disco, limitado a `max_disk_entries` itens, com
+       despejo dos itens acessados há mais tempo.
+
+    Os valores precisam ser serializáveis em JSON. `get_many`/`put_many` fazem
+    uma única consulta e um único commit por lote de sentenças; o limite do
+    disco é verificado a cada `max_disk_entries // 100` inserções (o arquivo
+    pode passar do limite por até esse tanto), não a cada uma.
+    """
+    def __init__(self, max_entries: int = 100_000, db_path: Optional[Path] = None,
+                 max_disk_entries: int = 1_000_000):
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.stats = CacheStats()
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._evict_every = max(1, max_disk_entries // 100)
+        self._inserts_since_evict = 0
+        self._db = None
+        if db_path is not None:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS sentence_results ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL, last_access REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_sentence_results_access ON sentence_results(last_access)"
+            )
+            self._db.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Valores das chaves encontradas (as ausentes ficam de fora do dicionário)."""
+        found: Dict[str, Any] = {}
+        keys = list(dict.fromkeys(keys))
+        with self._lock:
+            on_disk = []
+            for key in keys:
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    found[key] = self._memory[key]
+                else:
+                    on_disk.append(key)
+
+            if on_disk and self._db is not None:
+                rows = []
+                for start in range(0, len(on_disk), 500):  # Limite de parâmetros do SQLite
+                    chunk = on_disk[start:start + 500]
+                    rows += self._db.execute(
+                        f"SELECT key, value FROM sentence_results WHERE key IN ({','.join('?' * len(chunk))})", chunk
+                    ).fetchall()
+                if rows:
+                    now = time.time()
+                    self._db.executemany("UPDATE sentence_results SET last_access = ? WHERE key = ?",
+                                         [(now, key) for key, _ in rows])
+                    self._db.commit()
+                for key, value in rows:
+                    found[key] = json.loads(value)
+                    self._remember(key, found[key])
+                self.stats.disk_hits += len(rows)
+
+            self.stats.hits += len(found)
+            self.stats.misses += len(keys) - len(found)
+        return found
+
+    def put(self, key: str, value: Any):
+        self.put_many([(key, value)])
+
+    def put_many(self, items: Iterable[Tuple[str, Any]]):
+        items = list(items)
+        with self._lock:
+            for key, value in items:
+                self._remember(key, value)
+            if self._db is not None and items:
+                now = time.time()
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO sentence_results (key, value, last_access) VALUES (?, ?, ?)",
+                    [(key, json.dumps(value), now) for key, value in items],
+                )
+                self._inserts_since_evict += len(items)
+                if self._inserts_since_evict >= self._evict_every:
+                    self._inserts_since_evict = 0
+                    self._evict_disk()
+                self._db.commit()
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM sentence_results")
+                self._db.commit()
+
+    def close(self):
+        if self._db is not None:
+            self._db.commit()
+            self._db.close()
+            self._db = None
+
+    def __len__(self):
+        return len(self._memory)
+
+    def _remember(self, key: str, value: Any):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self):
+        (count,) = self._db.execute("SELECT COUNT(*) FROM sentence_results").fetchone()
+        if count <= self.max_disk_entries:
+            return
+        # Remove um lote (10%) de uma vez para não pagar o DELETE a cada inserção
+        excess = count - self.max_disk_entries + max(1, self.max_disk_entries // 10)
+        self._db.execute(
+            "DELETE FROM sentence_results WHERE key IN ("
+            " SELECT key FROM sentence_results ORDER BY last_access LIMIT ?)",
+            (excess,),
+        )
@@ -0,0 +1,328 @@
+# adapters/index/bias_index.py
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from nuvia.application.use_cases.analyze_article_use_case import AnalysisResult
+
+_TERM = re.compile(r"[^\W\d_]+(?:['’-][^\W\d_]+)*")
+_CUE_REASON = re.compile(r"Use of '(?P<category>[^']+)': '(?P<cue>.+)'$")
+
+
+def reason_category(reason: str) -> Tuple[str, Optional[str]]:
+    """
+    Categoria e, quando houver, a palavra que motivou o segmento:
+    "Use of 'Weasel Word': 'reportedly'" -> ("Weasel Word", "reportedly");
+    "Subjective Language (Model Confidence: 0.93)" -> ("Subjective Language", None).
+    """
+    match = _CUE_REASON.match(reason)
+    if match:
+        return match["category"], match["cue"].lower()
+    return re.split(r" \(|:", reason, maxsplit=1)[0].strip(), None
+
+
+def terms(text: str) -> List[str]:
+    """Termos indexados de um texto (palavras em minúsculas, sem repetição)."""
+    return list(dict.fromkeys(_TERM.findall(text.lower())))
+
+
+def _pack(values: np.ndarray) -> bytes:
+    """
+    Comprime um vetor numérico: os bytes são reagrupados por posição (todos os
+    bytes mais significativos juntos, etc.) antes do zlib. Em deltas de ids e
+    em scores, os bytes altos são quase sempre iguais e comprimem muito bem.
+    """
+    values = np.ascontiguousarray(values)
+    planes = values.view(np.uint8).reshape(-1, values.itemsize).T
+    return zlib.compress(planes.tobytes(), 6)
+
+
+def _unpack(data: bytes, dtype, count: int) -> np.ndarray:
+    dtype = np.dtype(dtype)
+    planes = np.frombuffer(zlib.decompress(data), dtype=np.uint8).reshape(dtype.itemsize, count)
+    return np.ascontiguousarray(planes.T).view(dtype).ravel()
+
+
+def _pack_ids(ids: np.ndarray) -> bytes:
+    """Ids crescentes, gravados como deltas (uint32)."""
+    return _pack(np.diff(ids, prepend=0).astype(np.uint32))
+
+
+def _unpack_ids(data: bytes, count: int) -> np.ndarray:
+    return np.cumsum(_unpack(data, np.uint32, count), dtype=np.int64)
+
+
+@dataclass(frozen=True)
+class IndexedSegment:
+    title: str
+    text: str
+    reason: str
+    score: Optional[float]
+    start: Optional[int]
+    end: Optional[int]
+
+
+class BiasIndex:
+    """
+    Índice invertido persistente (SQLite) dos resultados de análise.
+
+    Guarda, para cada artigo indexado, o score geral e os segmentos encontrados
+    (texto, motivo, score e offsets), e listas de postings comprimidas:
+    - ("term", palavra) -> segmentos cujo texto contém a palavra;
+    - ("reason", motivo) e ("category", categoria) -> segmentos por motivo/categoria;
+    - ("cue", palavra) -> segmentos sinalizados por aquela peacock/weasel word.
+
+    Cada chamada a `add_many` grava um bloco novo de postings por chave (os
+    anteriores não são reescritos), e o artigo substitui a versão anterior
+    dele (mesmo título e `detector_key`). As consultas juntam os blocos;
+    `optimize()` funde os blocos de cada chave em um só.
+
+    Os ids de segmento são sequenciais, e o documento e o score de cada
+    segmento também ficam em blocos colunares comprimidos, carregados em
+    memória (numpy) na primeira consulta: top-k e contagens por artigo são
+    operações vetorizadas sobre as postings, sem uma linha de SQL por segmento.
+    """
+    def __init__(self, path: Path):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS documents (
+                id INTEGER PRIMARY KEY,
+                title TEXT NOT NULL,
+                detector_key TEXT NOT NULL,
+                overall_score REAL NOT NULL,
+                segments INTEGER NOT NULL,
+                live INTEGER NOT NULL,
+                indexed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_documents_title ON documents (title, detector_key, live);
+            CREATE INDEX IF NOT EXISTS idx_documents_score ON documents (live, overall_score);
+            CREATE TABLE IF NOT EXISTS segments (
+                id INTEGER PRIMARY KEY,
+                doc INTEGER NOT NULL,
+                start INTEGER,
+                end INTEGER,
+                score REAL,
+                reason TEXT NOT NULL,
+                text TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS columns (
+                first_segment INTEGER PRIMARY KEY,
+                count INTEGER NOT NULL,
+                docs BLOB NOT NULL,
+                scores BLOB NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                field TEXT NOT NULL,
+                value TEXT NOT NULL,
+                block INTEGER NOT NULL,
+                count INTEGER NOT NULL,
+                segments BLOB NOT NULL,
+                PRIMARY KEY (field, value, block)
+            );
+        """)
+        self._db.commit()
+        self._version = None
+        self._docs: Optional[np.ndarray] = None    # Segmento -> documento
+        self._scores: Optional[np.ndarray] = None  # Segmento -> score (NaN sem score)
+        self._live: Optional[np.ndarray] = None    # Documento -> ainda é a versão atual
+
+    def add(self, title: str, result: AnalysisResult, detector_key: str = ""):
+        self.add_many([(title, result)], detector_key)
+
+    def add_many(self, results: Iterable[Tuple[str, AnalysisResult]], detector_key: str = ""):
+        """Indexa vários resultados em uma única transação (e um único bloco de postings)."""
+        postings: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+        rows, docs, scores = [], [], []
+        with self._lock:
+            cursor = self._db.cursor()
+            first = cursor.execute("SELECT COALESCE(MAX(id) + 1, 0) FROM segments").fetchone()[0]
+            now = time.time()
+            for title, result in results:
+                cursor.execute("UPDATE documents SET live = 0 WHERE title = ? AND detector_key = ? AND live = 1",
+                               (title, detector_key))
+                segments = list(result.segments)
+                cursor.execute(
+                    "INSERT INTO documents (title, detector_key, overall_score, segments, live, indexed_at) "
+                    "VALUES (?, ?, ?, ?, 1, ?)",
+                    (title, detector_key, float(result.overall_score), len(segments), now),
+                )
+                doc = cursor.lastrowid
+                for seg in segments:
+                    seg_id = first + len(rows)
+                    rows.append((seg_id, doc, seg.start, seg.end, seg.score, seg.reason, seg.text))
+                    docs.append(doc)
+                    scores.append(np.nan if seg.score is None else seg.score)
+                    category, cue = reason_category(seg.reason)
+                    postings[("reason", seg.reason)].append(seg_id)
+                    postings[("category", category)].append(seg_id)
+                    if cue is not None:
+                        postings[("cue", cue)].append(seg_id)
+                    for term in terms(seg.text):
+                        postings[("term", term)].append(seg_id)
+
+            cursor.executemany("INSERT INTO segments (id, doc, start, end, score, reason, text) "
+                               "VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            if rows:
+                cursor.execute(
+                    "INSERT INTO columns (first_segment, count, docs, scores) VALUES (?, ?, ?, ?)",
+                    (first, len(rows), _pack(np.array(docs, dtype=np.uint32)),
+                     _pack(np.array(scores, dtype=np.float32))),
+                )
+            cursor.executemany(
+                "INSERT INTO postings (field, value, block, count, segments) VALUES (?, ?, ?, ?, ?)",
+                [(field, value, first, len(ids), _pack_ids(np.array(ids, dtype=np.int64)))
+                 for (field, value), ids in postings.items()],
+            )
+            self._db.commit()
+            self._version = None  # Recarrega as colunas na próxima consulta
+
+    # Consultas
+
+    def _columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(documento por segmento, score por segmento, documento vivo), atualizados se o arquivo mudou."""
+        version = self._db.execute("PRAGMA data_version").fetchone()[0], self._db.total_changes
+        if version != self._version:
+            blocks = self._db.execute("SELECT count, docs, scores FROM columns ORDER BY first_segment").fetchall()
+            self._docs = np.concatenate(
+                [np.zeros(0, np.uint32)] + [_unpack(docs, np.uint32, count) for count, docs, _ in blocks])
+            self._scores = np.concatenate(
+                [np.zeros(0, np.float32)] + [_unpack(scores, np.float32, count) for count, _, scores in blocks])
+            live_rows = np.array(self._db.execute("SELECT id, live FROM documents").fetchall(),
+                                 dtype=np.int64).reshape(-1, 2)
+            self._live = np.zeros(int(live_rows[:, 0].max(initial=0)) + 1, dtype=bool)
+            self._live[live_rows[:, 0]] = live_rows[:, 1].astype(bool)
+            self._version = version
+        return self._docs, self._scores, self._live
+
+    def postings(self, field: str, value: str) -> np.ndarray:
+        """Ids (crescentes) dos segmentos de artigos atuais com essa chave."""
+        with self._lock:
+            docs, _, live = self._columns()
+            blocks = self._db.execute(
+                "SELECT count, segments FROM postings WHERE field = ? AND value = ? ORDER BY block", (field, value)
+            ).fetchall()
+        ids = np.concatenate([np.zeros(0, np.int64)] + [_unpack_ids(data, count) for count, data in blocks])
+        return ids[live[docs[ids]]]
+
+    def find(self, about: Optional[str] = None, category: Optional[str] = None,
+             cue: Optional[str] = None, reason: Optional[str] = None) -> np.ndarray:
+        """
+        Segmentos que atendem a todos os filtros: `about` (todas as palavras do
+        texto), `category`, `cue` e `reason`. Sem filtros, todos os segmentos atuais.
+        """
+        keys = [("term", term) for term in terms(about or "")]
+        keys += [(field, value) for field, value in (("category", category), ("cue", cue and cue.lower()),
+                                                     ("reason", reason)) if value]
+        if not keys:
+            with self._lock:
+                docs, _, live = self._columns()
+            return np.flatnonzero(live[docs])
+        lists = sorted((self.postings(field, value) for field, value in keys), key=len)
+        ids = lists[0]
+        for other in lists[1:]:
+            # Listas ordenadas: busca binária da menor na maior, sem reordenar a maior
+            if not len(ids) or not len(other):
+                return ids[:0]
+            positions = np.minimum(np.searchsorted(other, ids), len(other) - 1)
+            ids = ids[other[positions] == ids]
+        return ids
+
+    def top_segments(self, k: int = 100, **filters) -> List[IndexedSegment]:
+        """Os `k` segmentos de maior score entre os que atendem aos filtros de `find`."""
+        ids = self.find(**filters)
+        with self._lock:
+            _, scores, _ = self._columns()
+        ranked = np.nan_to_num(scores[ids], nan=-np.inf)
+        if len(ids) > k:
+            best = np.argpartition(-ranked, k - 1)[:k]
+            ids, ranked = ids[best], ranked[best]
+        ids = ids[np.argsort(-ranked, kind="stable")]
+        return self._segments(ids.tolist())
+
+    def _segments(self, ids: List[int]) -> List[IndexedSegment]:
+        if not ids:
+            return []
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT s.id, d.title, s.text, s.reason, s.score, s.start, s.end FROM segments s "
+                f"JOIN documents d ON d.id = s.doc WHERE s.id IN ({','.join('?' * len(ids))})", ids
+            ).fetchall()
+        by_id = {row[0]: IndexedSegment(*row[1:]) for row in rows}
+        return [by_id[i] for i in ids]
+
+    def top_articles(self, limit: int = 20, **filters) -> List[Tuple[str, int]]:
+        """Artigos com mais segmentos que atendem aos filtros (ex.: `cue="reportedly"`), com a contagem."""
+        ids = self.find(**filters)
+        with self._lock:
+            docs, _, _ = self._columns()
+        counts = np.bincount(docs[ids].astype(np.int64))
+        top = np.flatnonzero(counts)
+        top = top[np.argsort(-counts[top], kind="stable")][:limit].tolist()
+        if not top:
+            return []
+        with self._lock:
+            titles = dict(self._db.execute(
+                f"SELECT id, title FROM documents WHERE id IN ({','.join('?' * len(top))})", top
+            ).fetchall())
+        return [(titles[doc], int(counts[doc])) for doc in top]
+
+    def articles_above(self, min_score: float, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Artigos atuais com score geral maior que `min_score`, do maior para o menor."""
+        query = ("SELECT title, overall_score FROM documents WHERE live = 1 AND overall_score > ? "
+                 "ORDER BY overall_score DESC")
+        params: list = [min_score]
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            return self._db.execute(query, params).fetchall()
+
+    def __len__(self):
+        """Quantidade de segmentos de artigos atuais."""
+        with self._lock:
+            docs, _, live = self._columns()
+        return int(live[docs].sum())
+
+    def optimize(self):
+        """Funde os blocos de postings (e de colunas) gravados por cada `add_many` em um só."""
+        with self._lock:
+            cursor = self._db.cursor()
+            keys = cursor.execute(
+                "SELECT field, value FROM postings GROUP BY field, value HAVING COUNT(*) > 1"
+            ).fetchall()
+            for field, value in keys:
+                blocks = cursor.execute(
+                    "SELECT block, count, segments FROM postings WHERE field = ? AND value = ? ORDER BY block",
+                    (field, value),
+                ).fetchall()
+                ids = np.concatenate([_unpack_ids(data, count) for _, count, data in blocks])
+                cursor.execute("DELETE FROM postings WHERE field = ? AND value = ?", (field, value))
+                cursor.execute(
+                    "INSERT INTO postings (field, value, block, count, segments) VALUES (?, ?, ?, ?, ?)",
+                    (field, value, blocks[0][0], len(ids), _pack_ids(ids)),
+                )
+            blocks = cursor.execute("SELECT first_segment, count, docs, scores FROM columns "
+                                    "ORDER BY first_segment").fetchall()
+            if len(blocks) > 1:
+                docs = np.concatenate([_unpack(d, np.uint32, count) for _, count, d, _ in blocks])
+                scores = np.concatenate([_unpack(s, np.float32, count) for _, count, _, s in blocks])
+                cursor.execute("DELETE FROM columns")
+                cursor.execute("INSERT INTO columns (first_segment, count, docs, scores) VALUES (?, ?, ?, ?)",
+                               (blocks[0][0], len(docs), _pack(docs), _pack(scores)))
+            self._db.commit()
+            self._version = None
+        with self._lock:
+            self._db.execute("VACUUM")
+
+    def close(self):
+        self._db.close()
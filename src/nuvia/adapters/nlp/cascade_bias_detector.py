@@ -0,0 +1,242 @@
+# adapters/nlp/cascade_bias_detector.py
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from nuvia.application.services.bias_detection_service import BiasDetectionService
+from nuvia.application.services.metrics import metrics
+from nuvia.domain.services.phrase_matcher import PhraseMatcher
+from nuvia.domain.value_objects.bias_segment import BiasSegment
+from nuvia.domain.value_objects.document import Document
+from nuvia.adapters.nlp.lexicon_scorer import LexiconScorer
+
+
+@dataclass
+class CascadeStats:
+    sentences: int = 0
+    skipped: int = 0
+    screen_seconds: float = 0.0
+    detector_seconds: float = 0.0
+
+    @property
+    def skipped_fraction(self) -> float:
+        return self.skipped / self.sentences if self.sentences else 0.0
+
+    @property
+    def speedup(self) -> float:
+        """
+        Estimativa do ganho de ponta a ponta: custo de mandar todas as sentenças
+        ao detector (pelo custo médio das que foram) / custo real da cascata.
+        """
+        routed = self.sentences - self.skipped
+        spent = self.screen_seconds + self.detector_seconds
+        if not routed or not spent:
+            return 1.0
+        return self.detector_seconds / routed * self.sentences / spent
+
+
+@dataclass
+class CascadeCalibration:
+    """Resultado de `CascadeBiasDetector.calibrate` (pode ser salvo e recarregado em JSON)."""
+    target_recall: float
+    screen_threshold: float
+    recall: float
+    sentences: int
+    positives: int
+    skipped_fraction: float
+    full_seconds: float
+    screen_seconds: float
+
+    @property
+    def speedup(self) -> float:
+        """Ganho estimado no conjunto de calibração: só o detector / triagem + sentenças encaminhadas."""
+        cascade = self.screen_seconds + self.full_seconds * (1 - self.skipped_fraction)
+        return self.full_seconds / cascade if cascade else 1.0
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "speedup": round(self.speedup, 3)}
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path) -> "CascadeCalibration":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        data.pop("speedup", None)
+        return cls(**data)
+
+
+class CascadeBiasDetector(BiasDetectionService):
+    """
+    Cascata de custo: uma triagem barata decide quais sentenças são negativas
+    com segurança, e só as demais vão para o detector caro (ex.: o
+    HybridBiasDetector, com um forward pass do BERT por sentença).
+
+    A triagem usa o score de subjetividade por léxico (LexiconScorer, o mesmo do
+    NltkBiasDetector). Sentenças com score abaixo de `screen_threshold` são
+    descartadas sem passar pelo detector; as que casam com os léxicos do
+    próprio detector (`lexicon_matcher`, ex.: peacock/weasel words do híbrido)
+    são sempre encaminhadas, pois ele as sinalizaria de qualquer forma.
+
+    O limiar da triagem não é escolhido à mão: `calibrate` roda o detector
+    completo em um conjunto separado e escolhe o maior limiar que ainda mantém
+    o recall desejado em relação à saída dele. Com `screen_threshold=0` (padrão)
+    tudo é encaminhado e o resultado é idêntico ao do detector.
+    """
+    def __init__(self, detector: BiasDetectionService, screen_threshold: float = 0.0, lexicons=None,
+                 always_route: Optional[PhraseMatcher] = None):
+        """
+        Args:
+            detector: O detector caro, que analisa apenas as sentenças encaminhadas.
+            screen_threshold: Score mínimo da triagem para encaminhar a sentença.
+            lexicons: OpinionLexicons da triagem (padrão: os corpora do NLTK, no primeiro uso).
+            always_route: Frases que sempre encaminham a sentença (padrão: o
+                          `lexicon_matcher` do detector, quando existe).
+        """
+        self.detector = detector
+        self.screen_threshold = screen_threshold
+        self.always_route = always_route if always_route is not None else getattr(detector, "lexicon_matcher", None)
+        self.stats = CascadeStats()
+        self._lexicons = lexicons
+        self._scorer: Optional[LexiconScorer] = None
+        self._lock = threading.Lock()
+
+    @property
+    def scorer(self) -> LexiconScorer:
+        if self._scorer is None:
+            if self._lexicons is None:
+                from nuvia.adapters.nlp.nltk_bias_detector import load_lexicons
+                self._lexicons = load_lexicons()
+            self._scorer = LexiconScorer(*self._lexicons)
+        return self._scorer
+
+    @property
+    def threshold(self):
+        return self.detector.threshold
+
+    @property
+    def detector_id(self):
+        return f"Cascade({self.detector.detector_id})"
+
+    @property
+    def model_version(self):
+        # O limiar da triagem muda o resultado: entra na versão (e nas chaves de cache)
+        return f"{self.detector.model_version}+screen@{self.screen_threshold:.6g}"
+
+    @property
+    def tokenizer(self):
+        return self.detector.tokenizer
+
+    def as_document(self, text: Union[str, Document]) -> Document:
+        return self.detector.as_document(text)
+
+    def detect(self, text: Union[str, Document]) -> List[BiasSegment]:
+        return self.detect_document(self.as_document(text))
+
+    def screen(self, sentences: List[str], words: Optional[Sequence[List[str]]] = None) -> np.ndarray:
+        """
+        Score da triagem de cada sentença; sentenças que casam com `always_route`
+        recebem +inf (nunca são descartadas).
+        """
+        tokens = self._words(sentences, words)
+        scores = self.scorer.score_sentences(tokens)
+        if self.always_route is not None:
+            for i, sentence_tokens in enumerate(tokens):
+                if self.always_route.match_tokens(sentence_tokens):
+                    scores[i] = np.inf
+        return scores
+
+    def _words(self, sentences: List[str], words: Optional[Sequence[List[str]]]) -> List[List[str]]:
+        if words is None:
+            tokenizer = self.as_document("").tokenizer
+            return [tokenizer.word_tokenize(sent) for sent in sentences]
+        return [words[i] for i in range(len(sentences))]
+
+    def detect_sentences(self, sentences: List[str],
+                         words: Optional[Sequence[List[str]]] = None) -> List[List[BiasSegment]]:
+        return self.detect_sentences_checked(sentences, words=words)[0]
+
+    def detect_sentences_checked(self, sentences: List[str], words: Optional[Sequence[List[str]]] = None
+                                 ) -> Tuple[List[List[BiasSegment]], List[bool]]:
+        start = time.perf_counter()
+        with metrics.span("screen"):
+            words = self._words(sentences, words)
+            routed = np.flatnonzero(self.screen(sentences, words) >= self.screen_threshold).tolist()
+        screened = time.perf_counter()
+
+        results: List[List[BiasSegment]] = [[] for _ in sentences]
+        reliable = [True] * len(sentences)  # Descartadas pela triagem: resultado definitivo
+        if routed:
+            found, checked = self.detector.detect_sentences_checked(
+                [sentences[i] for i in routed], words=[words[i] for i in routed]
+            )
+            for i, segments, ok in zip(routed, found, checked):
+                results[i] = segments
+                reliable[i] = ok
+        end = time.perf_counter()
+
+        skipped = len(sentences) - len(routed)
+        with self._lock:
+            self.stats.sentences += len(sentences)
+            self.stats.skipped += skipped
+            self.stats.screen_seconds += screened - start
+            self.stats.detector_seconds += end - screened
+        metrics.increment("nuvia_cascade_sentences_total", skipped, route="skipped")
+        metrics.increment("nuvia_cascade_sentences_total", len(routed), route="detector")
+        return results, reliable
+
+    def calibrate(self, held_out: Sequence[Union[str, Document]], target_recall: float = 0.95) -> CascadeCalibration:
+        """
+        Escolhe `screen_threshold` em um conjunto separado (textos ou Documents).
+
+        O detector completo analisa todas as sentenças; as que ele sinaliza são os
+        positivos. O limiar escolhido é o maior score de triagem que ainda
+        encaminha pelo menos `target_recall` dos positivos. O limiar é aplicado
+        ao detector e o relatório traz a fração descartada e o ganho estimado.
+        """
+        sentences: List[str] = []
+        words: List[List[str]] = []
+        for text in held_out:
+            document = self.as_document(text)
+            sentences.extend(document.sentences)
+            words.extend(document.words_for(range(len(document))))
+
+        start = time.perf_counter()
+        scores = self.screen(sentences, words)
+        screen_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        positive = np.array([bool(found) for found in self.detector.detect_sentences(sentences, words=words)],
+                            dtype=bool)
+        full_seconds = time.perf_counter() - start
+
+        threshold = 0.0
+        positive_scores = np.sort(scores[positive])
+        if len(positive_scores):
+            # Candidatos: os scores observados, do maior para o menor; o primeiro que atinge o recall vence
+            for candidate in np.unique(scores[np.isfinite(scores)])[::-1]:
+                kept = len(positive_scores) - np.searchsorted(positive_scores, candidate, side="left")
+                if kept / len(positive_scores) >= target_recall:
+                    threshold = float(candidate)
+                    break
+
+        routed = scores >= threshold
+        self.screen_threshold = threshold
+        return CascadeCalibration(
+            target_recall=target_recall,
+            screen_threshold=threshold,
+            recall=float(routed[positive].mean()) if positive.any() else 1.0,
+            sentences=len(sentences),
+            positives=int(positive.sum()),
+            skipped_fraction=float(1 - routed.mean()) if len(sentences) else 0.0,
+            full_seconds=full_seconds,
+            screen_seconds=screen_seconds,
+        )
+
+    def summarize_bias(self, segments: List[BiasSegment]) -> str:
+        return self.detector.summarize_bias(segments)
@@ -0,0 +1,161 @@
+# adapters/nlp/detector_registry.py
+import gc
+import os
+import resource
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from nuvia.application.services.bias_detection_service import BiasDetectionService
+from nuvia.application.services.metrics import metrics
+from nuvia.adapters.nlp.languages import language_profile
+
+DetectorFactory = Callable[[str, str], BiasDetectionService]
+
+
+def create_language_detector(language: str, kind: str = "hybrid", **options) -> BiasDetectionService:
+    """
+    Detector do tipo `kind` ("hybrid", "embedding" ou "nltk") configurado para o
+    idioma: segmentação (Punkt do idioma), modelo e léxicos de `languages`.
+    """
+    from nuvia.adapters.nlp.tokenizers import PunktTokenizer
+
+    profile = language_profile(language)
+    options.setdefault("tokenizer", PunktTokenizer(profile.nltk_name))
+    if kind == "hybrid":
+        from nuvia.adapters.nlp.hybrid_bias_detector import HybridBiasDetector
+        return HybridBiasDetector(model_name=profile.subjectivity_model, peacock_words=profile.peacock_words,
+                                  weasel_words=profile.weasel_words, **options)
+    if kind == "embedding":
+        from nuvia.adapters.nlp.embedding_bias_detector import EmbeddingBiasDetector
+        return EmbeddingBiasDetector(model_name=profile.embedding_model, **options)
+    if kind == "nltk":
+        if not profile.opinion_lexicon:
+            raise ValueError(f"The 'nltk' detector has no opinion lexicon for '{language}'")
+        from nuvia.adapters.nlp.nltk_bias_detector import NltkBiasDetector
+        return NltkBiasDetector(**options)
+    raise ValueError(f"Unknown detector '{kind}'. Choose one of: hybrid, embedding, nltk")
+
+
+def current_rss_bytes() -> int:
+    """Memória residente atual do processo (no Linux; nos outros sistemas, o pico)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass
+class RegistryStats:
+    hits: int = 0
+    loads: int = 0
+    evictions: int = 0
+
+
+class DetectorRegistry:
+    """
+    Resolve (idioma, tipo de detector) para um detector carregado sob demanda,
+    mantendo os carregados em um LRU limitado por memória.
+
+    O custo de cada detector é medido pela variação da memória residente do
+    processo durante o carregamento (modelo + léxicos + índices). Quando a soma
+    passa de `memory_budget_bytes`, os menos usados recentemente saem do
+    registro; o último carregado nunca sai, mesmo que sozinho ultrapasse o
+    orçamento. Os removidos não são fechados: quem ainda estiver usando um
+    deles termina normalmente, e a memória é liberada quando a última
+    referência cai (o MicroBatchingDetector encerra suas threads nesse momento).
+    """
+    def __init__(self, memory_budget_bytes: int = 4 * 1024 ** 3, factory: DetectorFactory = create_language_detector):
+        """
+        Args:
+            memory_budget_bytes: Memória total dos detectores mantidos carregados.
+            factory: Cria o detector de (idioma, tipo); ex.: envolvendo-o em um MicroBatchingDetector.
+        """
+        self.memory_budget_bytes = memory_budget_bytes
+        self.factory = factory
+        self.stats = RegistryStats()
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[BiasDetectionService, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Um carregamento por vez: a medição de memória de um não se mistura com a do outro
+        self._load_lock = threading.Lock()
+
+    @property
+    def used_bytes(self) -> int:
+        return sum(size for _, size in self._entries.values())
+
+    def loaded(self) -> Dict[Tuple[str, str], int]:
+        """Detectores carregados (do menos para o mais usado recentemente) e a memória de cada um."""
+        with self._lock:
+            return {key: size for key, (_, size) in self._entries.items()}
+
+    def detector(self, language: str, kind: str = "hybrid") -> BiasDetectionService:
+        key = (language, kind)
+        entry = self._get(key)
+        if entry is not None:
+            return entry
+        with self._load_lock:
+            entry = self._get(key, count=False)  # Outra thread pode tê-lo carregado enquanto esperávamos
+            if entry is not None:
+                return entry
+            before = current_rss_bytes()
+            with metrics.span("registry.load"):
+                detector = self.factory(language, kind)
+                if hasattr(detector, "warm_up"):
+                    detector.warm_up()
+            size = max(0, current_rss_bytes() - before)
+            metrics.increment("nuvia_registry_loads_total", language=language, detector=kind)
+            with self._lock:
+                self.stats.loads += 1
+                self._entries[key] = (detector, size)
+                evicted = self._evict()
+        if evicted:
+            del evicted
+            gc.collect()
+        return detector
+
+    def _get(self, key: Tuple[str, str], count: bool = True) -> Optional[BiasDetectionService]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            if count:
+                self.stats.hits += 1
+            return entry[0]
+
+    def _evict(self):
+        evicted = []
+        while len(self._entries) > 1 and self.used_bytes > self.memory_budget_bytes:
+            (language, kind), (detector, _) = self._entries.popitem(last=False)
+            self.stats.evictions += 1
+            metrics.increment("nuvia_registry_evictions_total", language=language, detector=kind)
+            evicted.append(detector)
+        return evicted
+
+    def evict(self, language: str, kind: str = "hybrid"):
+        """Remove um detector do registro (ex.: um idioma que não será mais usado)."""
+        with self._lock:
+            entry = self._entries.pop((language, kind), None)
+        if entry is not None:
+            del entry
+            gc.collect()
+
+
+_default_registry: Optional[DetectorRegistry] = None
+
+
+def model_memory_budget() -> int:
+    """Orçamento de memória dos detectores, em bytes: NUVIA_MODEL_MEMORY_MB (padrão: 4096)."""
+    return int(os.environ.get("NUVIA_MODEL_MEMORY_MB", "4096")) * 1024 * 1024
+
+
+def default_registry() -> DetectorRegistry:
+    """Registro do processo, com o orçamento de `model_memory_budget()`."""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = DetectorRegistry(memory_budget_bytes=model_memory_budget())
+    return _default_registry
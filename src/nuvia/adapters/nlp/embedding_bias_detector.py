@@ -1,36 +1,132 @@
-from sentence_transformers import SentenceTransformer, util
+import hashlib
 from nuvia.application.services.bias_detection_service import BiasDetectionService
+from nuvia.application.services.metrics import SIZE_BUCKETS, metrics
 from nuvia.domain.value_objects.bias_segment import BiasSegment
-from nltk.tokenize import sent_tokenize
-from typing import List
+from nuvia.adapters.nlp import reference_examples
+from nuvia.adapters.nlp.reference_index import ReferenceIndex
+from nuvia.adapters.nlp.resources import configure_model_cache, default_cache_dir
+from typing import List, Optional
+
+MODEL_NAME = "paraphrase-MiniLM-L6-v2"
+
 
 class EmbeddingBiasDetector(BiasDetectionService):
-    def __init__(self, threshold=0.6):
-        self.model = SentenceTransformer("paraphrase-MiniLM-L6-v2")
-        self.biased_refs = self.model.encode(biased_examples, convert_to_tensor=True)
-        self.neutral_refs = self.model.encode(neutral_examples, convert_to_tensor=True)
+    def __init__(self, threshold=0.6, tokenizer=None, biased_examples: Optional[List[str]] = None,
+                 neutral_examples: Optional[List[str]] = None, reference_dtype: str = "float32",
+                 use_ann: bool = False, model=None, model_name: str = MODEL_NAME):
+        """
+        Args:
+            threshold: Diferença mínima de similaridade (enviesada - neutra) para sinalizar a frase.
+            biased_examples / neutral_examples: Corpora de referência (padrão: `reference_examples`).
+            reference_dtype: "float32" ou "float16" para a matriz de referências.
+            use_ann: Busca aproximada (faiss) para corpora de referência muito grandes.
+            model: Encoder já carregado, com o `encode` do SentenceTransformer (ex.: um
+                   substituto nos benchmarks). Suas referências não são guardadas em disco.
+            model_name: Encoder do sentence-transformers (ex.: um multilíngue, ver `languages`).
+        """
+        # Modelo e índices de referência são carregados no primeiro uso
+        self._model = model
+        self.model_name = model_name
+        self._cache_references = model is None
+        self._biased_refs = None
+        self._neutral_refs = None
+        self.biased_examples = biased_examples or reference_examples.biased_examples
+        self.neutral_examples = neutral_examples or reference_examples.neutral_examples
+        self._references_digest: Optional[str] = None
+        self.reference_dtype = reference_dtype
+        self.use_ann = use_ann
         self._threshold = threshold
+        self.tokenizer = tokenizer
         
     @property
     def threshold(self):
         return self._threshold
         
 
+    @property
+    def model_version(self):
+        # Os resultados dependem também das frases de referência: editá-las invalida os caches
+        return f"{self.model_name}+refs-{self.references_digest}"
+
+    @property
+    def references_digest(self) -> str:
+        """Hash curto dos dois corpora de referência."""
+        if self._references_digest is None:
+            payload = "\x1e".join(("\n".join(self.biased_examples), "\n".join(self.neutral_examples)))
+            self._references_digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+        return self._references_digest
+
+    @property
+    def model(self):
+        if self._model is None:
+            configure_model_cache()
+            from sentence_transformers import SentenceTransformer
+            self._model = SentenceTransformer(self.model_name)
+        return self._model
+
+    @property
+    def biased_refs(self) -> ReferenceIndex:
+        if self._biased_refs is None:
+            self._biased_refs = self._reference_index("biased", self.biased_examples)
+        return self._biased_refs
+
+    @property
+    def neutral_refs(self) -> ReferenceIndex:
+        if self._neutral_refs is None:
+            self._neutral_refs = self._reference_index("neutral", self.neutral_examples)
+        return self._neutral_refs
+
+    def warm_up(self):
+        """Carrega o modelo e os índices de referência agora, em vez de no primeiro uso."""
+        return self.biased_refs, self.neutral_refs
+
+    def _encode(self, sentences: List[str]):
+        return self.model.encode(sentences, convert_to_numpy=True, normalize_embeddings=True)
+
+    def _reference_index(self, kind: str, examples: List[str]) -> ReferenceIndex:
+        """
+        Índice das frases de referência, guardado em disco (matriz normalizada e,
+        com `use_ann`, o índice HNSW) para não recodificá-las a cada inicialização.
+        O nome do arquivo inclui um hash das frases, então editar os corpora
+        invalida o cache automaticamente.
+        """
+        digest = hashlib.sha256("\n".join(examples).encode("utf-8")).hexdigest()[:16]
+        path = default_cache_dir() / "embeddings" / f"{self.model_name.replace('/', '--')}-{kind}-{digest}-{self.reference_dtype}.npy"
+        options = {"dtype": self.reference_dtype, "use_ann": self.use_ann}
+        if not self._cache_references:
+            return ReferenceIndex.build(self._encode, examples, **options)
+        if path.exists():
+            metrics.increment("nuvia_cache_hits_total", cache="embeddings")
+            return ReferenceIndex.load(path, **options)
+        metrics.increment("nuvia_cache_misses_total", cache="embeddings")
+        index = ReferenceIndex.build(self._encode, examples, **options)
+        index.save(path)
+        return index
+
     def detect(self, text: str) -> List[BiasSegment]:
-        segments = []
-        sentences = sent_tokenize(text)
-        embeddings = self.model.encode(sentences, convert_to_tensor=True)
+        return self.detect_document(self.as_document(text))
+
+    def detect_sentences(self, sentences: List[str], words=None) -> List[List[BiasSegment]]:
+        results = []
+        if not sentences:
+            return results
+        with metrics.span("inference"):
+            metrics.observe("nuvia_batch_size", len(sentences), buckets=SIZE_BUCKETS, stage="inference")
+            embeddings = self._encode(sentences)
 
-        for i, sent_vec in enumerate(embeddings):
-            sim_biased = util.max_cos_sim(sent_vec, self.biased_refs).item()
-            sim_neutral = util.max_cos_sim(sent_vec, self.neutral_refs).item()
+        # Uma multiplicação de matrizes para todas as sentenças de uma vez
+        with metrics.span("scoring"):
+            bias_scores = self.biased_refs.max_similarity(embeddings) - self.neutral_refs.max_similarity(embeddings)
 
+        for sentence, bias_score in zip(sentences, bias_scores.tolist()):
             # Score é o quanto a frase se parece mais com frases opinionadas do que neutras
-            bias_score = sim_biased - sim_neutral
             if bias_score > self.threshold:
-                reason = f"Embedding bias score: {round(bias_score, 3)}"
-                segments.append(BiasSegment(text=sentences[i], reason=reason))
-        return segments
+                score = round(bias_score, 3)
+                reason = f"Embedding bias score: {score}"
+                results.append([BiasSegment(text=sentence, reason=reason, score=score)])
+            else:
+                results.append([])
+        return results
     
     
     def summarize_bias(self, segments: List[BiasSegment]) -> str:
@@ -1,11 +1,35 @@
-from typing import List
-from transformers import pipeline
-from sentence_transformers import SentenceTransformer, util
-from nltk.tokenize import sent_tokenize,word_tokenize
+import re
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from nltk.tokenize import word_tokenize
 
 from nuvia.application.services.bias_detection_service import BiasDetectionService
+from nuvia.application.services.metrics import SIZE_BUCKETS, metrics
 from nuvia.domain.value_objects.bias_segment import BiasSegment
+from nuvia.domain.value_objects.document import Document, Tokenizer
+from nuvia.domain.services.phrase_matcher import PhraseMatcher
+from nuvia.adapters.nlp.subjectivity_backends import SUBJECTIVITY_MODEL, load_subjectivity_pipeline
+from nuvia.adapters.nlp.resources import ensure_nltk_resource
 
+LONG_SENTENCE_MODES = ("window", "truncate")
+# Sem o tokenizer do modelo: cada palavra/pontuação conta como (pelo menos) um token
+_APPROX_TOKEN = re.compile(r"\w+|[^\w\s]")
+
+
+@dataclass
+class LongSentenceStats:
+    """Sentenças que não cabem na janela do modelo e o tempo gasto com elas."""
+    sentences: int = 0
+    truncated: int = 0
+    windowed: int = 0
+    windows: int = 0
+    seconds: float = 0.0
+
+    @property
+    def mean_latency_ms(self) -> float:
+        return self.seconds * 1000 / self.sentences if self.sentences else 0.0
 
 
 class HybridBiasDetector(BiasDetectionService):
@@ -14,41 +38,108 @@ class HybridBiasDetector(BiasDetectionService):
     1. Um modelo de ML (BERT) para classificação de subjetividade.
     2. Léxicos para identificar "Peacock" e "Weasel words".
     """
-    def __init__(self,threshold=0.4):
+    def __init__(self,threshold=0.4, batch_size: int = 16, sort_by_length: bool = True,
+                 backend: str = "pytorch", cache_dir: Optional[Path] = None,
+                 tokenizer: Optional[Tokenizer] = None, lazy: bool = True,
+                 subjectivity_model: Optional[Callable] = None, max_tokens: int = 512,
+                 long_sentences: str = "window", window_overlap: int = 128, window_aggregation: str = "max",
+                 model_name: Optional[str] = SUBJECTIVITY_MODEL, peacock_words: Optional[Iterable[str]] = None,
+                 weasel_words: Optional[Iterable[str]] = None):
         """
-        Inicializa o detector, carregando o modelo de ML e os léxicos.
+        Inicializa o detector e os léxicos. O modelo de ML é carregado no primeiro
+        uso (ou já aqui, com lazy=False, ou chamando `warm_up()`).
         
         Args:
             _threshold: O limiar de confiança (entre 0 e 1) para 
                                     sinalizar uma sentença como subjetiva.
+            batch_size: Quantidade de sentenças enviadas ao pipeline por forward pass.
+                        Use 1 para o modo sentença a sentença.
+            sort_by_length: Agrupa sentenças de tamanho parecido no mesmo lote
+                            para reduzir o padding.
+            backend: Backend de inferência do modelo ("pytorch", "onnx", "onnx-int8"
+                     ou "torch-int8"). Veja `subjectivity_backends`.
+            cache_dir: Onde guardar os artefatos convertidos dos backends otimizados.
+            tokenizer: Segmentação de sentenças/palavras (padrão: Punkt do NLTK).
+            lazy: Adia o carregamento do modelo até a primeira análise.
+            subjectivity_model: Pipeline já carregado (ou um substituto com a mesma
+                                interface, ex.: nos benchmarks); dispensa o carregamento.
+            max_tokens: Janela do modelo, em tokens (incluindo [CLS] e [SEP]).
+            long_sentences: O que fazer com sentenças maiores que a janela (linhas de
+                            tabela, listas, sentenças sem fim): "truncate" (só o início)
+                            ou "window" (janelas deslizantes, com os scores agregados).
+            window_overlap: Tokens em comum entre janelas consecutivas.
+            window_aggregation: "max" ou "mean" dos scores de subjetividade das janelas.
+            model_name: Modelo de subjetividade do Hugging Face Hub. None desliga a etapa
+                        do modelo (só léxicos), ex.: idiomas sem modelo (ver `languages`).
+            peacock_words / weasel_words: Léxicos alternativos (padrão: as listas em inglês).
         """
+        if long_sentences not in LONG_SENTENCE_MODES:
+            raise ValueError(f"Unknown long sentence mode '{long_sentences}'. "
+                             f"Choose one of: {', '.join(LONG_SENTENCE_MODES)}")
+        if window_aggregation not in ("max", "mean"):
+            raise ValueError(f"Unknown window aggregation '{window_aggregation}'. Choose 'max' or 'mean'")
+        if max_tokens <= 2:
+            raise ValueError(f"max_tokens must be greater than 2 (the window includes [CLS] and [SEP]), "
+                             f"got {max_tokens}")
+        # A sobreposição é limitada à metade da janela; o passo entre janelas precisa ser positivo
+        window_overlap = min(window_overlap, max_tokens // 2)
+        if long_sentences == "window" and not 0 <= window_overlap < max_tokens - 2:
+            raise ValueError(f"window_overlap must be between 0 and max_tokens - 3 ({max_tokens - 3}), "
+                             f"got {window_overlap}; use a larger max_tokens or long_sentences='truncate'")
         print("Initializing HybridBiasDetector...")
-        try:
-            print("Loading subjectivity classification model (this may take a moment)...")
-            # Modelo treinado para classificar texto como SUBJETIVO ou NEUTRO
-            self.subjectivity_model = pipeline(
-                "text-classification",
-                model="cffl/bert-base-styleclassification-subjective-neutral",
-                framework="pt", # 'pt' para PyTorch
-                return_all_scores=True # Garante que a saída seja consistente
-            )
-            print("Model loaded successfully.")
-        except Exception as e:
-            print(f"Error loading Hugging Face model: {e}")
-            print("Please ensure 'torch' and 'transformers' are installed (`pip install torch transformers`)")
-            self.subjectivity_model = None
-            
-        # NLTK downloads (necessário na primeira execução)
+        self.model_name = model_name
+        self._subjectivity_model = subjectivity_model
+        self._model_loaded = subjectivity_model is not None or model_name is None
+        self.cache_dir = cache_dir
+
         # Listas de palavras em INGLÊS
-        self.peacock_words = self._get_peacock_words()
-        self.weasel_words = self._get_weasel_words()
+        self.peacock_words = set(peacock_words) if peacock_words is not None else self._get_peacock_words()
+        self.weasel_words = set(weasel_words) if weasel_words is not None else self._get_weasel_words()
+        # Autômato compilado uma vez: casa palavras e expressões ("it is said") em uma passada
+        self.lexicon_matcher = PhraseMatcher()
+        self.lexicon_matcher.add_many(self.peacock_words, "Peacock Term")
+        self.lexicon_matcher.add_many(self.weasel_words, "Weasel Word")
         self._threshold = threshold
+        self.batch_size = max(1, int(batch_size))
+        self.sort_by_length = sort_by_length
+        self.backend = backend
+        self.tokenizer = tokenizer
+        self.max_tokens = max_tokens
+        self.long_sentences = long_sentences
+        self.window_overlap = window_overlap
+        self.window_aggregation = window_aggregation
+        self.long_stats = LongSentenceStats()
+        if not lazy:
+            self.warm_up()
         
     @property
     def threshold(self):
         return self._threshold
-        
-        print("HybridBiasDetector is ready.")
+
+    @property
+    def subjectivity_model(self):
+        """Pipeline de subjetividade, carregado no primeiro acesso (None se o carregamento falhou)."""
+        if not self._model_loaded:
+            self._model_loaded = True
+            try:
+                print("Loading subjectivity classification model (this may take a moment)...")
+                # Modelo treinado para classificar texto como SUBJETIVO ou NEUTRO
+                self._subjectivity_model = load_subjectivity_pipeline(self.backend, self.model_name,
+                                                                      cache_dir=self.cache_dir)
+                print("Model loaded successfully.")
+            except Exception as e:
+                print(f"Error loading Hugging Face model: {e}")
+                print("Please ensure 'torch' and 'transformers' are installed (`pip install torch transformers`)")
+                if self.backend.startswith("onnx"):
+                    print("ONNX backends also need 'optimum[onnxruntime]' (`pip install clora[onnx]`)")
+                self._subjectivity_model = None
+        return self._subjectivity_model
+
+    def warm_up(self):
+        """Carrega o modelo e os recursos do NLTK agora, em vez de no primeiro uso."""
+        ensure_nltk_resource("punkt_tab")
+        if self.subjectivity_model is not None:
+            print("HybridBiasDetector is ready.")
 
     def _get_peacock_words(self) -> set:
         """Retorna um conjunto de 'Peacock terms' (termos grandiosos)."""
@@ -72,53 +163,229 @@ class HybridBiasDetector(BiasDetectionService):
             "possibly", "reportedly", "seems", "some", "sometimes", "suggests"
         }
 
-    def detect(self, text: str) -> List[BiasSegment]:
+    @property
+    def model_version(self):
+        long_policy = self.long_sentences + (f"-{self.window_aggregation}" if self.long_sentences == "window" else "")
+        if self.model_name is None:
+            return "lexicon-only"
+        return f"{self.model_name}@{self.backend}/{long_policy}{self.max_tokens}"
+
+    def detect(self, text: Union[str, Document]) -> List[BiasSegment]:
         """
         Analisa o texto para detectar diferentes tipos de viés.
         """
-        if self.subjectivity_model is None:
+        return self.detect_document(self.as_document(text))
+
+    def detect_sentences(self, sentences: List[str],
+                         words: Optional[Sequence[List[str]]] = None) -> List[List[BiasSegment]]:
+        """
+        Analisa sentenças já segmentadas. Retorna uma lista de segmentos por sentença.
+        """
+        return self.detect_sentences_checked(sentences, words=words)[0]
+
+    def detect_sentences_checked(self, sentences: List[str], words: Optional[Sequence[List[str]]] = None
+                                 ) -> Tuple[List[List[BiasSegment]], List[bool]]:
+        """
+        Como `detect_sentences`, indicando também quais resultados são confiáveis:
+        sem o modelo carregado, nenhum é; com ele, não são os das sentenças em que
+        o modelo falhou (ficaram só com a etapa de léxicos).
+        """
+        if self.model_name is None:
+            # Sem modelo para o idioma: apenas a etapa de léxicos (é o resultado esperado)
+            model_scores = [None] * len(sentences)
+            reliable = [True] * len(sentences)
+        elif self.subjectivity_model is None:
             print("Detector is not available due to a model loading error.")
+            return [[] for _ in sentences], [False] * len(sentences)
+        else:
+            # Etapa 1: Detecção com Modelo de Machine Learning (em lotes)
+            with metrics.span("inference"):
+                model_scores = self._classify_sentences(sentences)
+            reliable = [scores is not None for scores in model_scores]
+
+        results = []
+        with metrics.span("lexicon"):
+            for i, (sent, subjectivity_dict) in enumerate(zip(sentences, model_scores)):
+                segment = self._model_segment(sent, subjectivity_dict)
+                if segment is None:
+                    # Etapa 2: Detecção com Léxicos (apenas para o que o modelo não sinalizou)
+                    segment = self._lexicon_segment(sent, words[i] if words is not None else None)
+                results.append([segment] if segment is not None else [])
+        return results, reliable
+
+    def _classify_sentences(self, sentences: List[str]) -> List[Optional[Dict]]:
+        """
+        Executa o modelo de subjetividade sobre todas as sentenças, em lotes de
+        `batch_size`. Retorna, na ordem original, o primeiro dicionário de score
+        de cada sentença (ou None quando o modelo falhou para ela).
+
+        Sentenças maiores que a janela do modelo vão para lotes separados (não
+        aumentam o padding das normais) e são truncadas ou divididas em janelas,
+        conforme `long_sentences`.
+        """
+        results: List[Optional[Dict]] = [None] * len(sentences)
+        long = set(self._long_sentences(sentences))
+        normal = [i for i in range(len(sentences)) if i not in long]
+        for i, output in zip(normal, self._run_model(sentences, normal)):
+            results[i] = output[0] if output else None
+        if long:
+            self._classify_long(sentences, sorted(long), results)
+        return results
+
+    def _long_sentences(self, sentences: List[str]) -> List[int]:
+        """Índices das sentenças com mais de `max_tokens` tokens."""
+        # Cada token cobre pelo menos um caractere: só as sentenças longas precisam ser medidas
+        candidates = [i for i, sent in enumerate(sentences) if len(sent) > self.max_tokens - 2]
+        if not candidates:
             return []
+        tokenizer = getattr(self.subjectivity_model, "tokenizer", None)
+        if tokenizer is not None:
+            lengths = [len(ids) for ids in tokenizer([sentences[i] for i in candidates])["input_ids"]]
+        else:
+            lengths = [len(_APPROX_TOKEN.findall(sentences[i])) + 2 for i in candidates]
+        return [i for i, length in zip(candidates, lengths) if length > self.max_tokens]
+
+    def _classify_long(self, sentences: List[str], indices: List[int], results: List[Optional[Dict]]):
+        start = time.perf_counter()
+        with metrics.span("inference.long"):
+            if self.long_sentences == "truncate":
+                outputs = self._run_model(sentences, indices, truncation=True, max_length=self.max_tokens)
+                for i, output in zip(indices, outputs):
+                    results[i] = output[0] if output else None
+                windows = 0
+            else:
+                texts, owners = [], []
+                for i in indices:
+                    for window in self._windows(sentences[i]):
+                        texts.append(window)
+                        owners.append(i)
+                window_scores: Dict[int, List[float]] = {i: [] for i in indices}
+                for owner, output in zip(owners, self._run_model(texts, range(len(texts)))):
+                    score = self._subjective_score(output)
+                    if score is not None:
+                        window_scores[owner].append(score)
+                for i, scores in window_scores.items():
+                    results[i] = self._aggregate(scores)
+                windows = len(texts)
+        elapsed = time.perf_counter() - start
+
+        stats = self.long_stats
+        stats.sentences += len(indices)
+        stats.seconds += elapsed
+        if self.long_sentences == "truncate":
+            stats.truncated += len(indices)
+        else:
+            stats.windowed += len(indices)
+            stats.windows += windows
+        metrics.increment("nuvia_long_sentences_total", len(indices), mode=self.long_sentences)
+
+    def _windows(self, sentence: str) -> Iterator[str]:
+        """Trechos da sentença com até `max_tokens` tokens cada, sobrepostos em `window_overlap`."""
+        tokenizer = getattr(self.subjectivity_model, "tokenizer", None)
+        if tokenizer is not None and getattr(tokenizer, "is_fast", False):
+            offsets = tokenizer(sentence, add_special_tokens=False, return_offsets_mapping=True)["offset_mapping"]
+        else:
+            offsets = [match.span() for match in _APPROX_TOKEN.finditer(sentence)]
+        size = self.max_tokens - 2  # [CLS] e [SEP]
+        step = size - self.window_overlap
+        for first in range(0, len(offsets), step):
+            last = min(first + size, len(offsets)) - 1
+            yield sentence[offsets[first][0]:offsets[last][1]]
+            if last == len(offsets) - 1:
+                break
+
+    @staticmethod
+    def _subjective_score(output: Optional[List[Dict]]) -> Optional[float]:
+        """Probabilidade do rótulo SUBJECTIVE em uma saída do pipeline."""
+        if not output:
+            return None
+        for entry in output:
+            if entry["label"] == "SUBJECTIVE":
+                return entry["score"]
+        return 1 - output[0]["score"]
+
+    def _aggregate(self, scores: List[float]) -> Optional[Dict]:
+        """
+        Score agregado das janelas, no formato das saídas do modelo. A sentença
+        sai SUBJECTIVE quando passa do limiar do detector (o mesmo critério de
+        `_model_segment`), e não com a maioria simples (0.5) entre os rótulos.
+        """
+        if not scores:
+            return None
+        score = max(scores) if self.window_aggregation == "max" else sum(scores) / len(scores)
+        if score > self._threshold:
+            return {"label": "SUBJECTIVE", "score": score}
+        return {"label": "NEUTRAL", "score": 1 - score}
 
-        segments = []
-        sentences = sent_tokenize(text, language='english')
+    def _run_model(self, texts: List[str], indices: Sequence[int], **kwargs) -> List[Optional[List[Dict]]]:
+        """
+        Saída completa do pipeline (lista de dicionários de score, ou None se o
+        modelo falhou) para `texts[i]` de cada índice, na ordem de `indices`.
+        """
+        indices = list(indices)
+        results: Dict[int, Optional[List[Dict]]] = {}
+        order = list(indices)
+        if self.sort_by_length and self.batch_size > 1:
+            # Sentenças de tamanho parecido no mesmo lote desperdiçam menos padding
+            order.sort(key=lambda i: len(texts[i]))
 
-        for sent in sentences:
-            # Etapa 1: Detecção com Modelo de Machine Learning
+        for start in range(0, len(order), self.batch_size):
+            batch = order[start:start + self.batch_size]
+            metrics.observe("nuvia_batch_size", len(batch), buckets=SIZE_BUCKETS, stage="inference")
+            if len(batch) == 1:
+                results[batch[0]] = self._classify_one(texts[batch[0]], **kwargs)
+                continue
             try:
-                model_output = self.subjectivity_model(sent)
-                if model_output and model_output[0]:
-                    subjectivity_dict = model_output[0][0] # Extrai o dicionário correto
-                    
-                    is_subjective = subjectivity_dict["label"] == "SUBJECTIVE"
-                    is_above_threshold = subjectivity_dict["score"] > self._threshold
-
-                    if is_subjective and is_above_threshold:
-                        score = round(subjectivity_dict['score'], 2)
-                        reason = f"Subjective Language (Model Confidence: {score})"
-                        segments.append(BiasSegment(text=sent, reason=reason, score=score))
-                        continue
+                outputs = self.subjectivity_model(
+                    [texts[i] for i in batch], batch_size=len(batch), **kwargs
+                )
             except Exception as e:
-                print(f"Error processing sentence with ML model: {sent}\nError: {e}")
+                # Um erro no lote não deve derrubar as outras sentenças:
+                # refaz o lote sentença a sentença.
+                print(f"Error processing batch with ML model, retrying per sentence.\nError: {e}")
+                for i in batch:
+                    results[i] = self._classify_one(texts[i], **kwargs)
+                continue
+            for i, output in zip(batch, outputs):
+                results[i] = output or None
+        return [results[i] for i in indices]
 
-            # Etapa 2: Detecção com Léxicos
-            tokens = {word.lower() for word in word_tokenize(sent, language='english')}
+    def _classify_one(self, sent: str, **kwargs) -> Optional[List[Dict]]:
+        try:
+            model_output = self.subjectivity_model(sent, **kwargs)
+            if model_output and model_output[0]:
+                return model_output[0] # Scores da única sentença
+        except Exception as e:
+            print(f"Error processing sentence with ML model: {sent}\nError: {e}")
+        return None
 
-            found_peacock_words = tokens.intersection(self.peacock_words)
-            if found_peacock_words:
-                word = found_peacock_words.pop()
-                reason = f"Use of 'Peacock Term': '{word}'"
-                segments.append(BiasSegment(text=sent, reason=reason, score=0.75))
-                continue
+    def _model_segment(self, sent: str, subjectivity_dict: Optional[Dict]) -> Optional[BiasSegment]:
+        if not subjectivity_dict:
+            return None
+        is_subjective = subjectivity_dict["label"] == "SUBJECTIVE"
+        is_above_threshold = subjectivity_dict["score"] > self._threshold
 
-            found_weasel_words = tokens.intersection(self.weasel_words)
-            if found_weasel_words:
-                word = found_weasel_words.pop()
-                reason = f"Use of 'Weasel Word': '{word}'"
-                segments.append(BiasSegment(text=sent, reason=reason, score=0.70))
-                continue
-                
-        return segments
+        if is_subjective and is_above_threshold:
+            score = round(subjectivity_dict['score'], 2)
+            reason = f"Subjective Language (Model Confidence: {score})"
+            return BiasSegment(text=sent, reason=reason, score=score)
+        return None
+
+    def _lexicon_segment(self, sent: str, words: Optional[List[str]] = None) -> Optional[BiasSegment]:
+        if words is None:
+            if self.tokenizer is not None:
+                words = self.tokenizer.word_tokenize(sent)
+            else:
+                ensure_nltk_resource("punkt_tab")
+                words = word_tokenize(sent, language='english')
+        matches = self.lexicon_matcher.match_tokens(words)
+
+        for category, score in (("Peacock Term", 0.75), ("Weasel Word", 0.70)):
+            found = [match.phrase for match in matches if match.category == category]
+            if found:
+                reason = f"Use of '{category}': '{found[0]}'"
+                return BiasSegment(text=sent, reason=reason, score=score)
+        return None
 
     def summarize_bias(self, segments: List[BiasSegment]) -> str:
         """
@@ -0,0 +1,96 @@
+# adapters/nlp/languages.py
+"""
+Recursos por idioma usados pelos detectores.
+
+Cada `LanguageProfile` diz qual modelo de Punkt segmenta o texto, qual modelo
+de subjetividade e qual encoder de sentenças usar, e quais peacock/weasel words
+procurar. O modelo de subjetividade (BERT) só existe em inglês: nos outros
+idiomas o HybridBiasDetector roda apenas a etapa de léxicos, e o
+EmbeddingBiasDetector usa um encoder multilíngue (as frases de referência, em
+inglês, ficam no mesmo espaço vetorial das frases do artigo).
+"""
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Optional
+
+from nuvia.adapters.nlp.subjectivity_backends import SUBJECTIVITY_MODEL
+
+MULTILINGUAL_EMBEDDING_MODEL = "paraphrase-multilingual-MiniLM-L12-v2"
+
+
+@dataclass(frozen=True)
+class LanguageProfile:
+    code: str                           # Código da Wikipedia ("en", "pt"...)
+    nltk_name: str                      # Nome do idioma no NLTK (Punkt, stopwords)
+    subjectivity_model: Optional[str]   # None: o detector híbrido usa só os léxicos
+    embedding_model: str
+    peacock_words: Optional[FrozenSet[str]] = None  # None: as listas padrão (inglês) do detector
+    weasel_words: Optional[FrozenSet[str]] = None
+    opinion_lexicon: bool = False       # Léxico de opinião do NLTK (NltkBiasDetector) disponível
+
+
+LANGUAGES: Dict[str, LanguageProfile] = {
+    "en": LanguageProfile(
+        code="en",
+        nltk_name="english",
+        subjectivity_model=SUBJECTIVITY_MODEL,
+        embedding_model="paraphrase-MiniLM-L6-v2",
+        opinion_lexicon=True,
+    ),
+    "pt": LanguageProfile(
+        code="pt",
+        nltk_name="portuguese",
+        subjectivity_model=None,
+        embedding_model=MULTILINGUAL_EMBEDDING_MODEL,
+        peacock_words=frozenset({
+            "aclamado", "brilhante", "célebre", "de renome mundial", "espetacular", "excelente",
+            "extraordinário", "fantástico", "genial", "icônico", "incrível", "inesquecível", "lendário",
+            "magnífico", "monumental", "notável", "o melhor", "obra-prima", "prestigiado", "renomado",
+            "revolucionário", "visionário",
+        }),
+        weasel_words=frozenset({
+            "acredita-se que", "alegadamente", "alguns", "aparentemente", "diz-se que", "é considerado",
+            "frequentemente", "geralmente", "muitos", "parece", "possivelmente", "provavelmente",
+            "segundo alguns", "supostamente", "talvez",
+        }),
+    ),
+    "es": LanguageProfile(
+        code="es",
+        nltk_name="spanish",
+        subjectivity_model=None,
+        embedding_model=MULTILINGUAL_EMBEDDING_MODEL,
+        peacock_words=frozenset({
+            "aclamado", "brillante", "célebre", "de fama mundial", "el mejor", "espectacular", "excelente",
+            "extraordinario", "fantástico", "genial", "icónico", "increíble", "inolvidable", "legendario",
+            "magnífico", "monumental", "notable", "obra maestra", "prestigioso", "renombrado",
+            "revolucionario", "visionario",
+        }),
+        weasel_words=frozenset({
+            "a menudo", "algunos", "aparentemente", "es considerado", "generalmente", "muchos", "parece",
+            "posiblemente", "presuntamente", "probablemente", "quizás", "se cree que", "se dice que",
+            "según algunos", "supuestamente", "tal vez",
+        }),
+    ),
+    "de": LanguageProfile(
+        code="de",
+        nltk_name="german",
+        subjectivity_model=None,
+        embedding_model=MULTILINGUAL_EMBEDDING_MODEL,
+        peacock_words=frozenset({
+            "außergewöhnlich", "bemerkenswert", "berühmt", "brillant", "fantastisch", "gefeiert", "genial",
+            "großartig", "hervorragend", "ikonisch", "legendär", "meisterwerk", "monumental",
+            "prestigeträchtig", "renommiert", "revolutionär", "spektakulär", "unglaublich",
+            "unvergesslich", "visionär", "weltberühmt",
+        }),
+        weasel_words=frozenset({
+            "angeblich", "anscheinend", "einige", "es heißt", "gilt als", "häufig", "man sagt", "manche",
+            "möglicherweise", "oft", "scheint", "vermeintlich", "viele", "vielleicht", "wahrscheinlich",
+        }),
+    ),
+}
+
+
+def language_profile(language: str) -> LanguageProfile:
+    try:
+        return LANGUAGES[language]
+    except KeyError:
+        raise ValueError(f"Unsupported language '{language}'. Choose one of: {', '.join(LANGUAGES)}") from None
@@ -0,0 +1,84 @@
+# adapters/nlp/lexicon_scorer.py
+from itertools import chain
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+
+class LexiconScorer:
+    """
+    Score de subjetividade por léxico (o do NltkBiasDetector), calculado em lote.
+
+    Cada token distinto é avaliado uma única vez e vira um código pequeno:
+    bit 0 = o token conta no denominador (alfabético e fora das stop words) e os
+    bits seguintes = quantos léxicos contêm o seu lema (0, 1 ou 2: uma palavra
+    nos dois léxicos conta duas vezes, como no cálculo original). As lematizações
+    também ficam em cache, e o mapa lema -> polaridade é montado uma vez.
+
+    Para um documento, os códigos de todos os tokens de todas as sentenças vão
+    para um único vetor, e as contagens por sentença saem de dois `np.bincount`
+    (o equivalente a multiplicar a matriz esparsa sentença × vocabulário pelo
+    vetor de polaridade). O resultado é idêntico ao cálculo token a token:
+    (positivos + negativos) / (tokens mantidos + 1).
+    """
+    def __init__(self, stop_words, positive_words, negative_words, lemmatizer, max_vocabulary: int = 2_000_000):
+        """
+        Args:
+            stop_words, positive_words, negative_words: Os léxicos (conjuntos de palavras).
+            lemmatizer: Objeto com `lemmatize(palavra)` (ex.: WordNetLemmatizer).
+            max_vocabulary: Limite das tabelas em cache; ao ser atingido, elas são esvaziadas.
+        """
+        self.stop_words = stop_words
+        self.lemmatizer = lemmatizer
+        self.max_vocabulary = max_vocabulary
+        # Lema -> em quantos léxicos ele aparece
+        self.polarity: Dict[str, int] = {}
+        for lexicon in (positive_words, negative_words):
+            for word in lexicon:
+                self.polarity[word] = self.polarity.get(word, 0) + 1
+        self._lemmas: Dict[str, str] = {}
+        self._codes = _TokenCodes(self)
+
+    @property
+    def vocabulary_size(self) -> int:
+        return len(self._codes)
+
+    def lemma(self, word: str) -> str:
+        lemma = self._lemmas.get(word)
+        if lemma is None:
+            lemma = self._lemmas[word] = self.lemmatizer.lemmatize(word)
+        return lemma
+
+    def token_code(self, token: str) -> int:
+        lower = token.lower()
+        if lower in self.stop_words or not token.isalpha():
+            return 0
+        return 1 | (self.polarity.get(self.lemma(lower), 0) << 1)
+
+    def score(self, tokens: List[str]) -> float:
+        return float(self.score_sentences([tokens])[0])
+
+    def score_sentences(self, token_lists: Sequence[List[str]]) -> np.ndarray:
+        """Scores (float64) de todas as sentenças, na ordem recebida."""
+        if len(self._codes) > self.max_vocabulary:
+            self._codes.clear()
+            self._lemmas.clear()
+        lengths = np.fromiter(map(len, token_lists), dtype=np.int64, count=len(token_lists))
+        codes = np.fromiter(
+            map(self._codes.__getitem__, chain.from_iterable(token_lists)), dtype=np.int64, count=int(lengths.sum())
+        )
+        sentence = np.repeat(np.arange(len(token_lists)), lengths)
+        kept = np.bincount(sentence, weights=codes & 1, minlength=len(token_lists))
+        hits = np.bincount(sentence, weights=codes >> 1, minlength=len(token_lists))
+        return hits / (kept + 1)
+
+
+class _TokenCodes(dict):
+    """Token -> código; os tokens novos são avaliados na primeira consulta."""
+    def __init__(self, scorer: LexiconScorer):
+        super().__init__()
+        self.scorer = scorer
+
+    def __missing__(self, token: str) -> int:
+        code = self[token] = self.scorer.token_code(token)
+        return code
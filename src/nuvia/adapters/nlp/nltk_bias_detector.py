@@ -1,50 +1,99 @@
 # infrastructure/nlp/nltk_bias_detector.py
-import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
-from nltk.corpus import opinion_lexicon, stopwords
-from nltk.stem import WordNetLemmatizer
+from nltk.tokenize import word_tokenize
 import string
-from typing import List
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Set
 from nuvia.application.services.bias_detection_service import BiasDetectionService
+from nuvia.application.services.metrics import metrics
 from nuvia.domain.value_objects.bias_segment import BiasSegment
-nltk.download("punkt")
-nltk.download("opinion_lexicon")
-nltk.download("stopwords")
-nltk.download("wordnet")
+from nuvia.adapters.nlp.resources import ensure_nltk_resource
+from nuvia.adapters.nlp.lexicon_scorer import LexiconScorer
 
-stop_words = set(stopwords.words("english"))
-positive_words = set(opinion_lexicon.positive())
-negative_words = set(opinion_lexicon.negative())
-lemmatizer = WordNetLemmatizer()
+
+class OpinionLexicons(NamedTuple):
+    stop_words: Set[str]
+    positive_words: Set[str]
+    negative_words: Set[str]
+    lemmatizer: object
+
+
+@lru_cache(maxsize=None)
+def load_lexicons() -> OpinionLexicons:
+    """
+    Carrega os corpora do NLTK no primeiro uso (e não na importação do módulo).
+    Em modo offline (NUVIA_OFFLINE=1) nunca chama `nltk.download`.
+    """
+    for name in ("punkt_tab", "opinion_lexicon", "stopwords", "wordnet"):
+        ensure_nltk_resource(name)
+    from nltk.corpus import opinion_lexicon, stopwords
+    from nltk.stem import WordNetLemmatizer
+
+    return OpinionLexicons(
+        stop_words=set(stopwords.words("english")),
+        positive_words=set(opinion_lexicon.positive()),
+        negative_words=set(opinion_lexicon.negative()),
+        lemmatizer=WordNetLemmatizer(),
+    )
 
 class NltkBiasDetector(BiasDetectionService):
-    def __init__(self,threshold=0.15):
+    def __init__(self,threshold=0.15, tokenizer=None, lexicons: Optional[OpinionLexicons] = None):
+        """
+        Args:
+            threshold: Score mínimo de subjetividade para sinalizar a sentença.
+            tokenizer: Segmentação de sentenças/palavras (padrão: Punkt do NLTK).
+            lexicons: Léxicos a usar (padrão: os corpora do NLTK, carregados no primeiro uso).
+        """
         self._threshold = threshold
+        self.tokenizer = tokenizer
+        self._lexicons = lexicons
+        self._scorer: Optional[LexiconScorer] = None
+
+    @property
+    def lexicons(self) -> OpinionLexicons:
+        if self._lexicons is None:
+            self._lexicons = load_lexicons()
+        return self._lexicons
+
+    @property
+    def scorer(self) -> LexiconScorer:
+        """Motor de score com cache de lemas e de tokens (montado no primeiro uso)."""
+        if self._scorer is None:
+            self._scorer = LexiconScorer(*self.lexicons)
+        return self._scorer
 
     @property
     def threshold(self):
         return self._threshold
         
+    @property
+    def model_version(self):
+        return "opinion_lexicon"
+
     def detect(self,text):
+        return self.detect_document(self.as_document(text))
+
+    def detect_sentences(self, sentences, words=None):
+        scorer = self.scorer  # Carrega os léxicos (e os recursos do NLTK) antes de tokenizar
+        if words is None:
+            # Com léxicos injetados, o punkt_tab não passou por `load_lexicons`
+            ensure_nltk_resource("punkt_tab")
+            words = [word_tokenize(sent) for sent in sentences]
+        with metrics.span("lexicon"):
+            # Todas as sentenças de uma vez (ver LexiconScorer)
+            scores = scorer.score_sentences([words[i] for i in range(len(sentences))]).tolist()
         results = []
-        sentences = sent_tokenize(text)
-        for sent in sentences:
-            tokens = word_tokenize(sent)
-            score = self.detect_subjectivity(tokens)
+        for sent, score in zip(sentences, scores):
             if score > self.threshold:
-                results.append(BiasSegment(text=sent, score=round(score, 3)))
+                score = round(score, 3)
+                reason = f"Lexicon subjectivity score: {score}"
+                results.append([BiasSegment(text=sent, reason=reason, score=score)])
+            else:
+                results.append([])
         return results
     
     def detect_subjectivity(self,tokens):
-        tokens_clean = [
-            lemmatizer.lemmatize(word.lower())
-            for word in tokens
-            if word.lower() not in stop_words and word.isalpha()
-        ]
-        pos_count = sum(1 for w in tokens_clean if w in positive_words)
-        neg_count = sum(1 for w in tokens_clean if w in negative_words)
-        subj_score = (pos_count + neg_count) / (len(tokens_clean) + 1)
-        return subj_score
+        """(positivos + negativos) / (tokens alfabéticos fora das stop words + 1), após lematização."""
+        return self.scorer.score(tokens)
 
     def summarize_bias(self, segments: List[BiasSegment]) -> str:
         if not segments:
@@ -0,0 +1,34 @@
+# adapters/nlp/reference_examples.py
+# Frases de referência usadas pelo EmbeddingBiasDetector.
+# Uma sentença é considerada enviesada quando se parece mais com as frases
+# opinativas abaixo do que com as neutras.
+
+biased_examples = [
+    "This is the most revolutionary technology ever created.",
+    "The product is an absolute masterpiece that everyone must have.",
+    "Critics agree that the film is a breathtaking, unforgettable experience.",
+    "The company's disastrous decision ruined everything.",
+    "Experts say this is clearly the best solution available.",
+    "It is widely considered the greatest achievement of the century.",
+    "The terrible policy was an obvious failure from the start.",
+    "Undoubtedly, this will change the world forever.",
+    "Many people believe the theory is simply wrong.",
+    "The legendary founder was a true visionary genius.",
+    "This outdated approach is a complete waste of time.",
+    "The stunning results prove that the method is superior.",
+]
+
+neutral_examples = [
+    "The company was founded in 1998 in California.",
+    "The film was released in theaters in March 2010.",
+    "The study included 1,200 participants from three countries.",
+    "The algorithm has a time complexity of O(n log n).",
+    "The river is 350 kilometres long and flows into the sea.",
+    "The law was passed by the parliament in 2004.",
+    "The device uses a lithium-ion battery and weighs 200 grams.",
+    "The model was trained on a dataset of 10 million images.",
+    "The population of the city was 85,000 at the 2020 census.",
+    "The conference takes place every two years.",
+    "The paper describes a method for compressing images.",
+    "The building has twelve floors and an underground car park.",
+]
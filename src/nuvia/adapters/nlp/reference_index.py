@@ -0,0 +1,112 @@
+# adapters/nlp/reference_index.py
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import numpy as np
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class ReferenceIndex:
+    """
+    Matriz de embeddings de referência normalizados (float32 ou float16).
+
+    A similaridade de cosseno máxima de todas as sentenças de um documento contra
+    todas as referências é calculada com uma única multiplicação de matrizes
+    (em blocos de referências, para limitar a memória). Para conjuntos muito
+    grandes, um índice aproximado (HNSW do faiss) pode ser usado no lugar; ele é
+    guardado ao lado da matriz (`save`/`load`) para não ser reconstruído a cada carga.
+    """
+    def __init__(self, vectors: np.ndarray, dtype: str = "float32", use_ann: bool = False,
+                 block_size: int = 8192, normalized: bool = False, ann=None):
+        """
+        Args:
+            vectors: Uma linha por frase de referência (não precisa estar normalizada).
+            dtype: "float32" ou "float16" (metade da memória, multiplicação feita em float32).
+            use_ann: Usa busca aproximada (requer `faiss-cpu`).
+            block_size: Quantidade de referências multiplicadas por vez.
+            normalized: As linhas já estão normalizadas (ex.: matriz lida do disco).
+            ann: Índice faiss já construído sobre estes vetores (ex.: lido do disco).
+        """
+        matrix = vectors if normalized else normalize_rows(vectors)
+        self.matrix = matrix if matrix.dtype == np.dtype(dtype) else matrix.astype(dtype)
+        self.block_size = block_size
+        self._ann = ann if ann is not None else (self._build_ann(self.matrix) if use_ann else None)
+
+    @classmethod
+    def build(cls, encode: Callable[[List[str]], np.ndarray], examples: List[str], **kwargs) -> "ReferenceIndex":
+        return cls(encode(examples), **kwargs)
+
+    @classmethod
+    def load(cls, path: Path, use_ann: bool = False, **kwargs) -> "ReferenceIndex":
+        # mmap: a matriz é lida do disco sob demanda, sem copiar tudo para a RAM
+        matrix = np.load(path, mmap_mode="r")
+        ann_path = cls._ann_path(path)
+        if use_ann and ann_path.exists():
+            ann = cls._read_ann(ann_path)
+            if ann is not None:
+                return cls(matrix, normalized=True, ann=ann, **kwargs)
+        # Sem o faiss (ex.: cache gravado em outra máquina), cai na busca exata em blocos
+        index = cls(matrix, normalized=True, use_ann=use_ann, **kwargs)
+        if index._ann is not None:
+            index._save_ann(ann_path)  # Índices gravados antes do faiss estar disponível
+        return index
+
+    def save(self, path: Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.save(path, self.matrix)
+        if self._ann is not None:
+            self._save_ann(self._ann_path(path))
+
+    @staticmethod
+    def _ann_path(path: Path) -> Path:
+        return Path(path).with_suffix(".hnsw")
+
+    @staticmethod
+    def _read_ann(path: Path):
+        try:
+            import faiss
+        except ImportError:
+            return None
+        return faiss.read_index(str(path))
+
+    def _save_ann(self, path: Path):
+        import faiss
+        faiss.write_index(self._ann, str(path))
+
+    def __len__(self):
+        return self.matrix.shape[0]
+
+    def max_similarity(self, queries: np.ndarray) -> np.ndarray:
+        """
+        Para cada linha de `queries`, a maior similaridade de cosseno contra as referências.
+        """
+        queries = normalize_rows(queries)
+        if len(queries) == 0 or len(self) == 0:
+            return np.full(len(queries), -1.0, dtype=np.float32)
+        if self._ann is not None:
+            scores, _ = self._ann.search(queries, 1)
+            return scores[:, 0]
+
+        best = np.full(len(queries), -np.inf, dtype=np.float32)
+        for start in range(0, len(self), self.block_size):
+            block = np.asarray(self.matrix[start:start + self.block_size], dtype=np.float32)
+            np.maximum(best, (queries @ block.T).max(axis=1), out=best)
+        return best
+
+    @staticmethod
+    def _build_ann(matrix: np.ndarray):
+        try:
+            import faiss
+        except ImportError:
+            print("faiss is not installed (`pip install faiss-cpu`); using exact search instead.")
+            return None
+        index = faiss.IndexHNSWFlat(matrix.shape[1], 32, faiss.METRIC_INNER_PRODUCT)
+        index.add(np.ascontiguousarray(matrix, dtype=np.float32))
+        return index
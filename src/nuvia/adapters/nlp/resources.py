@@ -0,0 +1,72 @@
+# adapters/nlp/resources.py
+"""
+Localização e carregamento preguiçoso (lazy) dos artefatos de NLP.
+
+- NUVIA_CACHE_DIR: diretório local onde modelos, corpora do NLTK e embeddings
+  pré-computados ficam guardados (padrão: ~/.cache/nuvia).
+- NUVIA_OFFLINE=1: nunca acessa a rede. Se um artefato não estiver no cache,
+  um erro é levantado em vez de chamar `nltk.download` ou o Hugging Face Hub.
+
+O comando `nuvia-warmup` baixa e serializa tudo de antemão.
+"""
+import os
+from functools import lru_cache
+from pathlib import Path
+
+# Recursos do NLTK usados pelos detectores -> caminho dentro do nltk_data
+NLTK_RESOURCES = {
+    "punkt": "tokenizers/punkt",
+    "punkt_tab": "tokenizers/punkt_tab",
+    "opinion_lexicon": "corpora/opinion_lexicon",
+    "stopwords": "corpora/stopwords",
+    "wordnet": "corpora/wordnet",
+}
+
+
+def default_cache_dir() -> Path:
+    return Path(os.environ.get("NUVIA_CACHE_DIR", Path.home() / ".cache" / "nuvia"))
+
+
+def offline_mode() -> bool:
+    return os.environ.get("NUVIA_OFFLINE", "").lower() in ("1", "true", "yes")
+
+
+def configure_model_cache():
+    """
+    Aponta os caches do Hugging Face para o diretório do nuvia (quando NUVIA_CACHE_DIR
+    foi definido) e ativa o modo offline das bibliotecas quando NUVIA_OFFLINE=1.
+    Precisa rodar antes de carregar qualquer modelo.
+    """
+    if "NUVIA_CACHE_DIR" in os.environ:
+        os.environ.setdefault("HF_HOME", str(default_cache_dir() / "huggingface"))
+    if offline_mode():
+        os.environ["HF_HUB_OFFLINE"] = "1"
+        os.environ["TRANSFORMERS_OFFLINE"] = "1"
+
+
+def _nltk_data_dir() -> Path:
+    return default_cache_dir() / "nltk_data"
+
+
+@lru_cache(maxsize=None)
+def ensure_nltk_resource(name: str) -> None:
+    """
+    Garante que o recurso do NLTK está disponível, procurando primeiro nos
+    diretórios locais. Só baixa se não encontrar e se não estiver em modo offline.
+    """
+    import nltk
+
+    data_dir = str(_nltk_data_dir())
+    if data_dir not in nltk.data.path:
+        nltk.data.path.append(data_dir)
+    try:
+        nltk.data.find(NLTK_RESOURCES[name])
+        return
+    except LookupError:
+        if offline_mode():
+            raise LookupError(
+                f"NLTK resource '{name}' not found and NUVIA_OFFLINE is set. "
+                f"Run `nuvia-warmup` first (looked in: {', '.join(nltk.data.path)})."
+            )
+    print(f"Downloading NLTK resource '{name}'...")
+    nltk.download(name, download_dir=data_dir, quiet=True)
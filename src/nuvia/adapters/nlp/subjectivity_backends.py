@@ -0,0 +1,156 @@
+# adapters/nlp/subjectivity_backends.py
+"""
+Backends de inferência para o modelo de subjetividade usado pelo HybridBiasDetector.
+
+- "pytorch":    pipeline padrão do transformers (comportamento original).
+- "onnx":       modelo exportado uma única vez para ONNX e servido pelo ONNX Runtime.
+- "onnx-int8":  o modelo ONNX acima com quantização dinâmica int8.
+- "torch-int8": quantização dinâmica int8 das camadas Linear no próprio PyTorch.
+
+Os artefatos convertidos ficam em cache no disco (`NUVIA_CACHE_DIR`, por padrão
+~/.cache/nuvia), então a conversão só acontece na primeira execução.
+"""
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional
+
+from nuvia.adapters.nlp.resources import configure_model_cache, default_cache_dir
+
+SUBJECTIVITY_MODEL = "cffl/bert-base-styleclassification-subjective-neutral"
+BACKENDS = ("pytorch", "onnx", "onnx-int8", "torch-int8")
+
+
+def _artifact_dir(cache_dir: Optional[Path], model_name: str, backend: str) -> Path:
+    base = Path(cache_dir) if cache_dir else default_cache_dir()
+    return base / "models" / model_name.replace("/", "--") / backend
+
+
+def load_subjectivity_pipeline(backend: str = "pytorch", model_name: str = SUBJECTIVITY_MODEL,
+                               cache_dir: Optional[Path] = None):
+    """
+    Cria o pipeline de classificação de texto para o backend pedido.
+
+    Args:
+        backend: Um dos valores de BACKENDS.
+        model_name: Modelo do Hugging Face Hub.
+        cache_dir: Diretório onde os artefatos convertidos são guardados.
+
+    Returns:
+        Um `transformers.pipeline` com a mesma interface de chamada para todos os backends.
+    """
+    configure_model_cache()
+    from transformers import AutoTokenizer, pipeline
+
+    if backend == "pytorch":
+        return pipeline(
+            "text-classification",
+            model=model_name,
+            framework="pt", # 'pt' para PyTorch
+            return_all_scores=True # Garante que a saída seja consistente
+        )
+
+    target = _artifact_dir(cache_dir, model_name, backend)
+    if backend == "onnx":
+        model = _load_onnx_model(model_name, target)
+    elif backend == "onnx-int8":
+        model = _load_onnx_int8_model(model_name, cache_dir, target)
+    elif backend == "torch-int8":
+        model = _load_torch_int8_model(model_name, target)
+    else:
+        raise ValueError(f"Unknown inference backend '{backend}'. Choose one of: {', '.join(BACKENDS)}")
+
+    if not (target / "tokenizer_config.json").exists():
+        AutoTokenizer.from_pretrained(model_name).save_pretrained(target)
+    tokenizer = AutoTokenizer.from_pretrained(target)
+    return pipeline("text-classification", model=model, tokenizer=tokenizer, return_all_scores=True)
+
+
+def _load_onnx_model(model_name: str, target: Path):
+    from optimum.onnxruntime import ORTModelForSequenceClassification
+
+    if (target / "model.onnx").exists():
+        return ORTModelForSequenceClassification.from_pretrained(target)
+    print(f"Exporting {model_name} to ONNX (one-time conversion)...")
+    model = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+    model.save_pretrained(target)
+    return model
+
+
+def _load_onnx_int8_model(model_name: str, cache_dir: Optional[Path], target: Path):
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    file_name = "model_quantized.onnx"
+    if not (target / file_name).exists():
+        onnx_model = _load_onnx_model(model_name, _artifact_dir(cache_dir, model_name, "onnx"))
+        print(f"Quantizing {model_name} to int8 (one-time conversion)...")
+        quantizer = ORTQuantizer.from_pretrained(onnx_model)
+        qconfig = AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+        quantizer.quantize(save_dir=target, quantization_config=qconfig)
+    return ORTModelForSequenceClassification.from_pretrained(target, file_name=file_name)
+
+
+def _load_torch_int8_model(model_name: str, target: Path):
+    """
+    Guarda só o `state_dict` quantizado (e o config do modelo): na carga, a
+    arquitetura é recriada a partir do config, quantizada do mesmo jeito e
+    recebe os pesos com `weights_only=True`, sem desserializar objetos
+    arbitrários do cache nem depender da versão em que o módulo foi salvo.
+    """
+    import torch
+    from transformers import AutoConfig, AutoModelForSequenceClassification
+
+    artifact = target / "model_int8.state_dict.pt"
+    if artifact.exists() and (target / "config.json").exists():
+        model = AutoModelForSequenceClassification.from_config(AutoConfig.from_pretrained(target)).eval()
+        quantized = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        quantized.load_state_dict(torch.load(artifact, weights_only=True))
+        return quantized
+    print(f"Quantizing {model_name} to int8 with PyTorch (one-time conversion)...")
+    model = AutoModelForSequenceClassification.from_pretrained(model_name).eval()
+    quantized = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    target.mkdir(parents=True, exist_ok=True)
+    model.config.save_pretrained(target)
+    torch.save(quantized.state_dict(), artifact)
+    return quantized
+
+
+@dataclass
+class BackendAgreement:
+    """Resultado da comparação de rótulos entre um backend e o de referência."""
+    total: int
+    agreeing: int
+    tolerance: float
+    mismatches: List[str] = field(default_factory=list)
+
+    @property
+    def agreement(self) -> float:
+        return self.agreeing / self.total if self.total else 1.0
+
+    @property
+    def passed(self) -> bool:
+        return self.agreement >= 1.0 - self.tolerance
+
+
+def top_labels(outputs) -> List[str]:
+    """Extrai o rótulo de maior score de cada saída do pipeline (return_all_scores=True)."""
+    return [max(scores, key=lambda d: d["score"])["label"] for scores in outputs]
+
+
+def check_backend_agreement(reference_labels: List[str], candidate_labels: List[str],
+                            sentences: List[str], tolerance: float = 0.02) -> BackendAgreement:
+    """
+    Compara os rótulos de um backend candidato com os do backend de referência (PyTorch).
+
+    Args:
+        tolerance: Fração máxima de sentenças com rótulo divergente aceita.
+    """
+    mismatches = [
+        sent for sent, ref, cand in zip(sentences, reference_labels, candidate_labels) if ref != cand
+    ]
+    return BackendAgreement(
+        total=len(sentences),
+        agreeing=len(sentences) - len(mismatches),
+        tolerance=tolerance,
+        mismatches=mismatches,
+    )
@@ -0,0 +1,96 @@
+# adapters/nlp/tokenizers.py
+"""
+Implementações de `Tokenizer` usadas para montar `Document`s.
+
+- PunktTokenizer: mesma segmentação do `sent_tokenize`/`word_tokenize` do NLTK,
+  mas com a instância do Punkt carregada uma única vez por idioma.
+- RegexTokenizer: segmentação por expressões regulares, bem mais rápida e sem
+  dependência de dados do NLTK, ao custo de errar em algumas abreviações.
+"""
+import re
+from functools import lru_cache
+from typing import List, Tuple
+
+from nuvia.adapters.nlp.resources import ensure_nltk_resource
+from nuvia.domain.value_objects.document import Document, Tokenizer
+
+
+@lru_cache(maxsize=None)
+def _punkt(language: str):
+    ensure_nltk_resource("punkt_tab")
+    from nltk.tokenize.punkt import PunktTokenizer as NltkPunktTokenizer
+    return NltkPunktTokenizer(language)
+
+
+class PunktTokenizer(Tokenizer):
+    def __init__(self, language: str = "english"):
+        self.language = language
+
+    @property
+    def name(self) -> str:
+        return f"punkt-{self.language}"
+
+    def span_tokenize(self, text: str) -> List[Tuple[int, int]]:
+        return list(_punkt(self.language).span_tokenize(text))
+
+    def word_tokenize(self, sentence: str) -> List[str]:
+        from nltk.tokenize import word_tokenize
+        # Mesma chamada do detector original (preserve_line=False): o Punkt roda de
+        # novo dentro da sentença e decide quais pontos finais viram tokens separados
+        return word_tokenize(sentence, language=self.language)
+
+
+class RegexTokenizer(Tokenizer):
+    # Fim de sentença: . ! ? (com aspas/parênteses de fechamento opcionais) seguido de espaço
+    SENTENCE_END = re.compile(r"""[.!?]+["')\]]*(?=\s+|$)""")
+    WORD = re.compile(r"\w+(?:[-'’]\w+)*|[^\w\s]")
+    ABBREVIATIONS = {
+        "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "vs", "etc", "e.g", "i.e",
+        "inc", "ltd", "co", "corp", "fig", "no", "vol", "approx", "jan", "feb", "mar",
+        "apr", "jun", "jul", "aug", "sep", "sept", "oct", "nov", "dec", "u.s", "u.k",
+    }
+
+    @property
+    def name(self) -> str:
+        return "regex"
+
+    def span_tokenize(self, text: str) -> List[Tuple[int, int]]:
+        spans = []
+        start = self._skip_space(text, 0)
+        for match in self.SENTENCE_END.finditer(text):
+            end = match.end()
+            if self._is_abbreviation(text, start, match.start()):
+                continue
+            if end > start:
+                spans.append((start, end))
+            start = self._skip_space(text, end)
+        tail_end = len(text.rstrip())
+        if tail_end > start:
+            spans.append((start, tail_end))
+        return spans
+
+    def word_tokenize(self, sentence: str) -> List[str]:
+        return self.WORD.findall(sentence)
+
+    def _is_abbreviation(self, text: str, start: int, dot: int) -> bool:
+        word_start = max(start, text.rfind(" ", start, dot) + 1, text.rfind("\n", start, dot) + 1)
+        word = text[word_start:dot].lower().lstrip("(\"'")
+        # Iniciais ("J. R. R. Tolkien") e abreviações conhecidas não encerram a sentença
+        return text[dot] == "." and (word in self.ABBREVIATIONS or (len(word) == 1 and word.isalpha()))
+
+    @staticmethod
+    def _skip_space(text: str, position: int) -> int:
+        while position < len(text) and text[position].isspace():
+            position += 1
+        return position
+
+
+TOKENIZERS = {
+    "punkt": PunktTokenizer,
+    "regex": RegexTokenizer,
+}
+
+
+def build_document(text: str, tokenizer: str = "punkt") -> Document:
+    """Cria um Document pronto para ser compartilhado entre detectores."""
+    return Document(text, TOKENIZERS[tokenizer]())
@@ -0,0 +1,203 @@
+# adapters/serving/micro_batching_detector.py
+import queue
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence, Union
+
+from nuvia.application.services.bias_detection_service import BiasDetectionService
+from nuvia.application.services.metrics import SIZE_BUCKETS, metrics
+from nuvia.domain.value_objects.bias_segment import BiasSegment
+from nuvia.domain.value_objects.document import Document
+
+
+@dataclass
+class _Job:
+    sentences: List[str]
+    words: Optional[Sequence[List[str]]]
+    future: Future = field(default_factory=Future)
+
+
+@dataclass
+class BatchingStats:
+    batches: int = 0
+    jobs: int = 0
+    sentences: int = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.sentences / self.batches if self.batches else 0.0
+
+
+class _ConcatWords(Sequence):
+    """Concatena as sequências (preguiçosas) de tokens de vários jobs sem tokenizar nada."""
+    def __init__(self, parts: List[Sequence[List[str]]]):
+        self.parts = parts
+        self._length = sum(len(part) for part in parts)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(self._length))]
+        if position < 0:
+            position += self._length
+        for part in self.parts:
+            if position < len(part):
+                return part[position]
+            position -= len(part)
+        raise IndexError(position)
+
+    def __len__(self):
+        return self._length
+
+
+class MicroBatchingDetector(BiasDetectionService):
+    """
+    Compartilha um conjunto fixo de detectores entre muitas requisições concorrentes.
+
+    Cada detector do pool tem uma thread própria. As sentenças enviadas por
+    chamadas simultâneas a `detect_sentences` entram em uma fila única e são
+    agrupadas em micro-lotes: uma thread livre pega o primeiro pedido da fila e
+    espera no máximo `max_wait` segundos por outros, até `max_batch_size`
+    sentenças, antes de chamar o detector uma única vez para todas elas.
+
+    Pedidos grandes são divididos em pedaços de `max_batch_size`, para que um
+    artigo enorme não bloqueie os pedidos pequenos que chegam depois.
+
+    As threads não guardam referência a esta instância: quando a última
+    referência cai (ex.: o DetectorRegistry a descarta), elas são encerradas e
+    os modelos liberados, sem interromper quem ainda a estava usando.
+    """
+    def __init__(self, detector_factory: Callable[[], BiasDetectionService], pool_size: int = 1,
+                 max_batch_size: int = 64, max_wait: float = 0.01):
+        """
+        Args:
+            detector_factory: Cria cada detector do pool (carregado uma única vez).
+            pool_size: Quantidade de cópias do modelo em memória.
+            max_batch_size: Máximo de sentenças por chamada ao detector.
+            max_wait: Tempo máximo, em segundos, que um pedido espera por outros para formar um lote.
+        """
+        self.detectors = [detector_factory() for _ in range(pool_size)]
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.stats = BatchingStats()
+        self._queue: "queue.Queue[Optional[_Job]]" = queue.Queue()
+        self._stats_lock = threading.Lock()
+        self._closed = False
+        self._submit_lock = threading.Lock()
+        self._threads = [
+            threading.Thread(target=_serve, daemon=True, name=f"detector-{i}",
+                             args=(self._queue, detector, max_batch_size, max_wait, self.stats, self._stats_lock))
+            for i, detector in enumerate(self.detectors)
+        ]
+        for thread in self._threads:
+            thread.start()
+        self._finalizer = weakref.finalize(self, _stop, self._queue, len(self._threads))
+
+    @property
+    def threshold(self):
+        return self.detectors[0].threshold
+
+    @property
+    def detector_id(self):
+        return self.detectors[0].detector_id
+
+    @property
+    def model_version(self):
+        return self.detectors[0].model_version
+
+    def warm_up(self):
+        for detector in self.detectors:
+            if hasattr(detector, "warm_up"):
+                detector.warm_up()
+
+    def as_document(self, text: Union[str, Document]) -> Document:
+        return self.detectors[0].as_document(text)
+
+    def detect(self, text: Union[str, Document]) -> List[BiasSegment]:
+        return self.detect_document(self.as_document(text))
+
+    def detect_sentences(self, sentences: List[str],
+                         words: Optional[Sequence[List[str]]] = None) -> List[List[BiasSegment]]:
+        if not sentences:
+            return []
+        jobs = []
+        with self._submit_lock:
+            if self._closed:
+                raise RuntimeError("MicroBatchingDetector is closed")
+            for start in range(0, len(sentences), self.max_batch_size):
+                end = start + self.max_batch_size
+                job = _Job(sentences[start:end], words[start:end] if words is not None else None)
+                self._queue.put(job)
+                jobs.append(job)
+        results = []
+        for job in jobs:
+            results.extend(job.future.result())
+        return results
+
+    def summarize_bias(self, segments: List[BiasSegment]) -> str:
+        return self.detectors[0].summarize_bias(segments)
+
+    def close(self):
+        """Encerra as threads depois de atender os pedidos já enfileirados."""
+        with self._submit_lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._finalizer()
+        for thread in self._threads:
+            thread.join()
+
+
+def _stop(jobs: "queue.Queue[Optional[_Job]]", threads: int):
+    for _ in range(threads):
+        jobs.put(None)
+
+
+def _serve(jobs: "queue.Queue[Optional[_Job]]", detector: BiasDetectionService, max_batch_size: int,
+           max_wait: float, stats: BatchingStats, stats_lock: threading.Lock):
+    while True:
+        job = jobs.get()
+        if job is None:
+            return
+        batch = [job]
+        size = len(job.sentences)
+        deadline = time.monotonic() + max_wait
+        while size < max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                job = jobs.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if job is None:
+                # Repassa o sinal de encerramento depois de atender o lote atual
+                jobs.put(None)
+                break
+            batch.append(job)
+            size += len(job.sentences)
+        _run(detector, batch, stats, stats_lock)
+
+
+def _run(detector: BiasDetectionService, batch: List[_Job], stats: BatchingStats, stats_lock: threading.Lock):
+    sentences = [sentence for job in batch for sentence in job.sentences]
+    words = None
+    if all(job.words is not None for job in batch):
+        words = _ConcatWords([job.words for job in batch])
+    try:
+        found = detector.detect_sentences(sentences, words=words)
+    except Exception as e:
+        for job in batch:
+            job.future.set_exception(e)
+        return
+    with stats_lock:
+        stats.batches += 1
+        stats.jobs += len(batch)
+        stats.sentences += len(sentences)
+    metrics.observe("nuvia_batch_size", len(sentences), buckets=SIZE_BUCKETS, stage="micro-batch")
+    position = 0
+    for job in batch:
+        job.future.set_result(found[position:position + len(job.sentences)])
+        position += len(job.sentences)
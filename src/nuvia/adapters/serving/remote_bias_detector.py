@@ -0,0 +1,83 @@
+# adapters/serving/remote_bias_detector.py
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import requests
+
+from nuvia.application.services.bias_detection_service import BiasDetectionService
+from nuvia.domain.value_objects.bias_segment import BiasSegment
+from nuvia.domain.value_objects.document import Document
+
+
+class RemoteBiasDetector(BiasDetectionService):
+    """
+    Cliente da API HTTP (`nuvia-serve`) com a mesma interface dos detectores locais.
+
+    A tokenização em sentenças é feita localmente (é leve); apenas as sentenças
+    vão para o servidor, que concentra os modelos. Assim, AnalyzeArticleUseCase
+    (inclusive `execute_stream`, com progresso por bloco) funciona sem mudanças.
+    Cada pedido leva o `language`, e o servidor usa o detector desse idioma.
+    """
+    def __init__(self, base_url: str, timeout: float = 120.0, session: Optional[requests.Session] = None,
+                 language: str = "en"):
+        self.base_url = base_url.rstrip("/")
+        self.language = language
+        if language != "en":
+            from nuvia.adapters.nlp.languages import language_profile
+            from nuvia.adapters.nlp.tokenizers import PunktTokenizer
+            self.tokenizer = PunktTokenizer(language_profile(language).nltk_name)
+        self.timeout = timeout
+        self.session = session or requests.Session()
+        self._info: Optional[Dict[str, Any]] = None
+
+    @property
+    def info(self) -> Dict[str, Any]:
+        if self._info is None:
+            self._info = self._request("GET", "/info", params={"language": self.language})
+        return self._info
+
+    @property
+    def threshold(self):
+        return self.info["threshold"]
+
+    @property
+    def detector_id(self):
+        return self.info["detector_id"]
+
+    @property
+    def model_version(self):
+        return self.info["model_version"]
+
+    def warm_up(self):
+        """Confirma que o servidor está no ar (os modelos já são carregados por ele)."""
+        self._info = None
+        return self.info
+
+    def detect(self, text: Union[str, Document]) -> List[BiasSegment]:
+        return self.detect_document(self.as_document(text))
+
+    def detect_sentences(self, sentences: List[str],
+                         words: Optional[Sequence[List[str]]] = None) -> List[List[BiasSegment]]:
+        if not sentences:
+            return []
+        response = self._request("POST", "/detect", {"sentences": list(sentences), "language": self.language})
+        return [
+            [BiasSegment(text=s["text"], reason=s["reason"], score=s["score"]) for s in segments]
+            for segments in response["segments"]
+        ]
+
+    def summarize_bias(self, segments: List[BiasSegment]) -> str:
+        payload = {"segments": [{"text": s.text, "reason": s.reason, "score": s.score} for s in segments],
+                   "language": self.language}
+        return self._request("POST", "/summarize", payload)["summary"]
+
+    def _request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None,
+                 params: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        response = self.session.request(method, self.base_url + path, json=payload, params=params,
+                                        timeout=self.timeout)
+        if response.status_code != 200:
+            try:
+                message = response.json().get("error", response.text)
+            except ValueError:
+                message = response.text
+            raise RuntimeError(f"Analysis service returned {response.status_code}: {message}")
+        return response.json()
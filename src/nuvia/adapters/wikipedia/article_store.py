@@ -0,0 +1,133 @@
+# adapters/wikipedia/article_store.py
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+class ArticleStore:
+    """
+    Armazenamento local (SQLite) dos artigos buscados na Wikipedia.
+
+    - Cada revisão é guardada uma vez por formato de origem, com o texto
+      comprimido (zlib), e indexada por (idioma, título, revision_id, source).
+      `source` diz de onde veio o texto ("extract": API de extracts;
+      "wikitext": wikitext convertido por `strip_wikitext`): os dois textos de
+      uma mesma revisão diferem, e cada caminho do scraper lê só o seu.
+    - Títulos pedidos que diferem do título canônico (redirecionamentos,
+      maiúsculas/minúsculas) são guardados como apelidos.
+    - `fetched_at` registra a última vez que a revisão foi confirmada como a
+      mais recente, usado pelo WikipediaScraper para decidir quando revalidar.
+    """
+    def __init__(self, path: Path):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(articles)")}
+        if columns and "source" not in columns:
+            # Formato antigo: não há como saber de qual caminho veio cada texto; é só um cache
+            self._db.executescript("DROP INDEX IF EXISTS idx_articles_latest; DROP TABLE articles;")
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS articles (
+                language TEXT NOT NULL,
+                title TEXT NOT NULL,
+                revision_id INTEGER NOT NULL,
+                source TEXT NOT NULL,
+                url TEXT,
+                summary BLOB,
+                text BLOB,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (language, title, revision_id, source)
+            );
+            CREATE INDEX IF NOT EXISTS idx_articles_latest ON articles (language, title, source, fetched_at);
+            CREATE TABLE IF NOT EXISTS aliases (
+                language TEXT NOT NULL,
+                alias TEXT NOT NULL,
+                title TEXT NOT NULL,
+                PRIMARY KEY (language, alias)
+            );
+        """)
+        self._db.commit()
+
+    def get(self, title: str, language: str = "en", revision_id: Optional[int] = None,
+            source: str = "extract") -> Optional[Dict[str, Any]]:
+        """
+        Retorna a revisão pedida (ou a mais recente) do artigo no formato `source`,
+        ou None se não estiver guardada.
+        """
+        with self._lock:
+            canonical = self._canonical(title, language)
+            query = ("SELECT title, revision_id, url, summary, text, fetched_at FROM articles "
+                     "WHERE language = ? AND title = ? AND source = ?")
+            params = [language, canonical, source]
+            if revision_id is not None:
+                query += " AND revision_id = ?"
+                params.append(revision_id)
+            row = self._db.execute(query + " ORDER BY fetched_at DESC LIMIT 1", params).fetchone()
+        if row is None:
+            return None
+        title, revision_id, url, summary, text, fetched_at = row
+        return {
+            "title": title,
+            "summary": zlib.decompress(summary).decode("utf-8"),
+            "text": zlib.decompress(text).decode("utf-8"),
+            "url": url,
+            "revision_id": revision_id,
+            "source": source,
+            "fetched_at": fetched_at,
+        }
+
+    def put(self, article: Dict[str, Any], language: str = "en", requested_title: Optional[str] = None):
+        """Guarda o artigo no formato `article["source"]` (padrão: "extract")."""
+        self.put_many([(requested_title, article)], language)
+
+    def put_many(self, articles: Iterable[Tuple[Optional[str], Dict[str, Any]]], language: str = "en"):
+        """Guarda vários pares (título pedido, artigo) com um único commit."""
+        now = time.time()
+        with self._lock:
+            for requested_title, article in articles:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO articles "
+                    "(language, title, revision_id, source, url, summary, text, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        language, article["title"], article["revision_id"], article.get("source", "extract"),
+                        article.get("url"),
+                        zlib.compress(article.get("summary", "").encode("utf-8")),
+                        zlib.compress(article["text"].encode("utf-8")),
+                        now,
+                    ),
+                )
+                if requested_title and requested_title != article["title"]:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO aliases (language, alias, title) VALUES (?, ?, ?)",
+                        (language, requested_title, article["title"]),
+                    )
+            self._db.commit()
+
+    def touch(self, title: str, revision_id: int, language: str = "en", source: str = "extract"):
+        """Marca a revisão como confirmada agora (revalidação sem mudança)."""
+        self.touch_many([(title, revision_id)], language, source)
+
+    def touch_many(self, revisions: Iterable[Tuple[str, int]], language: str = "en", source: str = "extract"):
+        """`touch` de vários pares (título, revision_id) com um único commit."""
+        now = time.time()
+        with self._lock:
+            self._db.executemany(
+                "UPDATE articles SET fetched_at = ? "
+                "WHERE language = ? AND title = ? AND revision_id = ? AND source = ?",
+                [(now, language, self._canonical(title, language), revision_id, source)
+                 for title, revision_id in revisions],
+            )
+            self._db.commit()
+
+    def close(self):
+        self._db.close()
+
+    def _canonical(self, title: str, language: str) -> str:
+        row = self._db.execute(
+            "SELECT title FROM aliases WHERE language = ? AND alias = ?", (language, title)
+        ).fetchone()
+        return row[0] if row else title
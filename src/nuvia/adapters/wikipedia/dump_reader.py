@@ -0,0 +1,226 @@
+# adapters/wikipedia/dump_reader.py
+"""
+Leitura em streaming de dumps XML da Wikipedia (`pages-articles.xml.bz2`).
+
+O arquivo é lido com `iterparse`, e cada <page> é descartada da árvore assim que
+processada, então a memória usada não cresce com o tamanho do dump. A
+descompressão pode rodar em um processo externo (lbzip2/pbzip2/bzip2) e a
+leitura do XML em um processo próprio (`parse_dump_to_queue`), deixando o
+processo principal e os workers livres para a inferência.
+"""
+import bz2
+import contextlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import xml.etree.ElementTree as ET
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, Sequence
+
+from nuvia.adapters.wikipedia.wikitext import categories, normalize_title, strip_wikitext
+from nuvia.adapters.wikipedia.wikipedia_scraper import split_extract
+
+# Descompressores externos, em ordem de preferência (os dois primeiros são paralelos)
+DECOMPRESSORS = ("lbzip2", "pbzip2", "bzip2")
+
+
+@dataclass
+class DumpPage:
+    page_id: int
+    title: str
+    revision_id: Optional[int]
+    wikitext: str
+
+    @property
+    def categories(self):
+        return categories(self.wikitext)
+
+    @property
+    def text(self) -> str:
+        """Texto simples no mesmo formato dos artigos buscados pelo WikipediaScraper."""
+        return split_extract(strip_wikitext(self.wikitext))["text"]
+
+
+@dataclass
+class DumpFilter:
+    """
+    Seleciona as páginas a analisar. Sem critérios, todas as páginas passam;
+    com os dois, basta atender a um deles.
+
+    Args:
+        title_pattern: Expressão regular buscada no título.
+        categories: Nomes de categoria (sem o prefixo "Category:").
+    """
+    title_pattern: Optional[str] = None
+    categories: Sequence[str] = ()
+
+    def __post_init__(self):
+        self._title_re = re.compile(self.title_pattern) if self.title_pattern else None
+        self._categories = {normalize_title(c).lower() for c in self.categories}
+
+    def __getstate__(self):
+        # Padrões compilados são recriados no processo de leitura
+        return {"title_pattern": self.title_pattern, "categories": tuple(self.categories)}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def matches(self, page: DumpPage) -> bool:
+        if self._title_re is None and not self._categories:
+            return True
+        if self._title_re is not None and self._title_re.search(page.title):
+            return True
+        return any(c.lower() in self._categories for c in page.categories)
+
+
+@contextlib.contextmanager
+def open_dump(path: Path, decompressor: str = "auto") -> Iterator[BinaryIO]:
+    """
+    Abre o dump como um fluxo de bytes de XML.
+
+    Args:
+        decompressor: "auto" usa o primeiro descompressor externo disponível (em um
+            processo separado) ou o módulo bz2; "builtin" força o bz2 no próprio
+            processo; ou o nome de um executável compatível com `bzip2 -dc`.
+    """
+    path = Path(path)
+    if path.suffix != ".bz2":
+        with open(path, "rb") as f:
+            yield f
+        return
+
+    command = None
+    if decompressor == "auto":
+        command = next((shutil.which(name) for name in DECOMPRESSORS if shutil.which(name)), None)
+    elif decompressor != "builtin":
+        command = shutil.which(decompressor)
+        if command is None:
+            raise FileNotFoundError(f"Decompressor '{decompressor}' not found on PATH")
+
+    if command is None:
+        with bz2.open(path, "rb") as f:
+            yield f
+        return
+
+    process = subprocess.Popen([command, "-dc", str(path)], stdout=subprocess.PIPE, bufsize=1 << 20)
+    try:
+        yield process.stdout
+    finally:
+        process.stdout.close()
+        process.kill()
+        process.wait()
+
+
+def iter_dump_pages(stream: BinaryIO, namespaces: Sequence[int] = (0,),
+                    skip_redirects: bool = True, after_page_id: Optional[int] = None) -> Iterator[DumpPage]:
+    """
+    Gera as páginas do dump, uma por vez, com memória constante.
+
+    Args:
+        namespaces: Namespaces aceitos (0 = artigos).
+        skip_redirects: Ignora páginas de redirecionamento.
+        after_page_id: Retomada de checkpoint: ignora páginas com id menor ou igual.
+    """
+    context = ET.iterparse(stream, events=("start", "end"))
+    _, root = next(context)
+    ns = root.tag[:root.tag.index("}") + 1] if root.tag.startswith("{") else ""
+    page_tag = f"{ns}page"
+
+    for event, elem in context:
+        if event != "end" or elem.tag != page_tag:
+            continue
+        try:
+            page_id = int(elem.findtext(f"{ns}id"))
+            if after_page_id is not None and page_id <= after_page_id:
+                continue
+            if int(elem.findtext(f"{ns}ns", "0")) not in namespaces:
+                continue
+            if skip_redirects and elem.find(f"{ns}redirect") is not None:
+                continue
+            revision = elem.find(f"{ns}revision")
+            if revision is None:
+                continue
+            revision_id = revision.findtext(f"{ns}id")
+            yield DumpPage(
+                page_id=page_id,
+                title=elem.findtext(f"{ns}title"),
+                revision_id=int(revision_id) if revision_id else None,
+                wikitext=revision.findtext(f"{ns}text") or "",
+            )
+        finally:
+            # Descarta a página (e tudo o que já foi lido antes dela)
+            root.clear()
+
+
+def parse_dump_to_queue(path: Path, out_queue, page_filter: Optional[DumpFilter] = None,
+                        after_page_id: Optional[int] = None, decompressor: str = "auto"):
+    """
+    Alvo do processo de leitura: coloca (page_id, título, revision_id, texto) de
+    cada página selecionada em `out_queue` e, ao final, None. Um erro de leitura
+    é enviado como uma string no lugar do None.
+    """
+    try:
+        with open_dump(path, decompressor) as stream:
+            for page in iter_dump_pages(stream, after_page_id=after_page_id):
+                if page_filter is None or page_filter.matches(page):
+                    out_queue.put((page.page_id, page.title, page.revision_id, page.text))
+    except Exception as e:
+        out_queue.put(f"Failed to read dump: {e!r}")
+        return
+    out_queue.put(None)
+
+
+class DumpCheckpoint:
+    """
+    Guarda o maior page_id até o qual todas as páginas selecionadas já foram
+    processadas. Como os resultados chegam fora de ordem, as páginas terminadas
+    além desse ponto ficam pendentes até que as anteriores terminem.
+
+    A retomada é "pelo menos uma vez": páginas concluídas depois do último
+    checkpoint salvo são analisadas de novo.
+    """
+    def __init__(self, path: Optional[Path] = None, save_every: int = 50):
+        """
+        Args:
+            path: Arquivo do checkpoint. Sem ele, o progresso só é acompanhado em memória.
+            save_every: Quantidade de páginas concluídas entre gravações do arquivo.
+        """
+        self.path = Path(path) if path else None
+        self.save_every = save_every
+        self.last_page_id: Optional[int] = None
+        self.processed = 0
+        if self.path and self.path.exists():
+            state = json.loads(self.path.read_text(encoding="utf-8"))
+            self.last_page_id = state.get("last_page_id")
+            self.processed = state.get("processed", 0)
+        self._issued = deque()
+        self._done = set()
+        self._unsaved = 0
+
+    def issued(self, page_id: int):
+        """Registra uma página enviada para análise (na ordem do dump)."""
+        self._issued.append(page_id)
+
+    def done(self, page_id: int):
+        self._done.add(page_id)
+        self.processed += 1
+        while self._issued and self._issued[0] in self._done:
+            self.last_page_id = self._issued.popleft()
+            self._done.discard(self.last_page_id)
+        self._unsaved += 1
+        if self._unsaved >= self.save_every:
+            self.save()
+
+    def save(self):
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps({"last_page_id": self.last_page_id, "processed": self.processed}),
+                       encoding="utf-8")
+        os.replace(tmp, self.path)
+        self._unsaved = 0
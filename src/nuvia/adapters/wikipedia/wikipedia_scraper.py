@@ -1,32 +1,266 @@
 # infrastructure/wikipedia/wikipedia_scraper.py
-import wikipediaapi
+import asyncio
+import os
+import re
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
 import requests
+from requests.adapters import HTTPAdapter
+
+from nuvia.application.services.metrics import metrics
+from nuvia.adapters.wikipedia.article_store import ArticleStore
+from nuvia.adapters.wikipedia.wikitext import strip_wikitext
+from nuvia.adapters.nlp.resources import default_cache_dir
+
+USER_AGENT = 'BiasDetectorApp (your_email@example.com)'
+# Máximo de títulos por requisição aceito pela API para clientes comuns
+MAX_TITLES_PER_REQUEST = 50
+# Formatos de origem do texto guardado no ArticleStore (ver `ArticleStore`)
+SOURCE_EXTRACT = "extract"
+SOURCE_WIKITEXT = "wikitext"
+# Títulos de seção no formato wiki ("== História ==") retornados pela API de extracts
+_SECTION_HEADING = re.compile(r"^(=+)\s*(.*?)\s*\1\s*$", re.MULTILINE)
+
+_shared_session: Optional[requests.Session] = None
+_default_store: Optional[ArticleStore] = None
+
+
+def shared_session(pool_size: int = 16) -> requests.Session:
+    """
+    Sessão HTTP compartilhada por todos os scrapers do processo, reaproveitando
+    conexões (keep-alive) com a API da Wikipedia.
+    """
+    global _shared_session
+    if _shared_session is None:
+        session = requests.Session()
+        session.headers["User-Agent"] = USER_AGENT
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=2)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _shared_session = session
+    return _shared_session
+
+
+def default_article_store() -> ArticleStore:
+    """ArticleStore do processo, em NUVIA_CACHE_DIR/articles.sqlite."""
+    global _default_store
+    if _default_store is None:
+        _default_store = ArticleStore(default_cache_dir() / "articles.sqlite")
+    return _default_store
+
+
+def default_scraper(language: str = 'en') -> "WikipediaScraper":
+    """
+    Scraper com o store local do processo. NUVIA_WIKIPEDIA_OFFLINE=1 serve apenas
+    artigos já guardados, sem acessar a rede.
+    """
+    offline = os.environ.get("NUVIA_WIKIPEDIA_OFFLINE", "").lower() in ("1", "true", "yes")
+    return WikipediaScraper(language=language, store=default_article_store(), offline=offline)
+
+
+def split_extract(extract: str) -> Dict[str, str]:
+    """
+    Converte o extract em formato wiki no mesmo formato de texto do wikipediaapi:
+    o resumo é o texto antes da primeira seção e os títulos de seção viram linhas simples.
+    """
+    first_heading = _SECTION_HEADING.search(extract)
+    summary = extract[:first_heading.start()] if first_heading else extract
+    text = _SECTION_HEADING.sub(lambda m: m.group(2), extract)
+    return {"summary": summary.strip(), "text": text.strip()}
+
+
+class RateLimiter:
+    """
+    Espaça o início das requisições em pelo menos 1/rate segundos, mesmo com
+    várias corrotinas disparando ao mesmo tempo.
+    """
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        async with self._lock:
+            now = time.monotonic()
+            delay = max(0.0, self._next - now)
+            self._next = max(now, self._next) + self.interval
+        if delay:
+            await asyncio.sleep(delay)
+
 
 class WikipediaScraper:
-    def __init__(self, language: str = 'en'):
-        # Inicializa a API com user agent apropriado
-        self.wiki = wikipediaapi.Wikipedia(
-            user_agent='BiasDetectorApp (your_email@example.com)',
-            language=language,
-            extract_format=wikipediaapi.ExtractFormat.WIKI)
-        
-    def fetch_article(self, title: str) -> str:
-        page = self.wiki.page(title)
-        if page.exists():
-            return {
-                "title": page.title,
-                "summary": page.summary,
-                "text": page.text,
-                "url": page.fullurl
-            }
-        else:
+    def __init__(self, language: str = 'en', store: Optional[ArticleStore] = None,
+                 ttl: float = 24 * 3600, offline: bool = False,
+                 session: Optional[requests.Session] = None, api_url: Optional[str] = None,
+                 timeout: float = 10.0):
+        """
+        Args:
+            language: Idioma da Wikipedia.
+            store: Armazenamento local dos artigos. Sem ele, todo fetch vai à API.
+            ttl: Segundos durante os quais um artigo guardado é servido sem consultar a API.
+                 Depois disso, só o revision_id é revalidado (e o texto só é baixado se mudou).
+            offline: Serve apenas o que está no `store`, sem nenhum acesso à rede.
+            session: Sessão HTTP (padrão: a sessão compartilhada do processo).
+            api_url: Endpoint da API do MediaWiki (útil para testes com um servidor local).
+            timeout: Timeout das requisições, em segundos.
+        """
+        self.language = language
+        self.store = store
+        self.ttl = ttl
+        self.offline = offline
+        self.session = session or shared_session()
+        self.api_url = api_url or f"https://{language}.wikipedia.org/w/api.php"
+        self.timeout = timeout
+
+    def fetch_article(self, title: str) -> Optional[Dict[str, Any]]:
+        with metrics.span("wikipedia.fetch"):
+            return self._fetch_article(title)
+
+    def _fetch_article(self, title: str) -> Optional[Dict[str, Any]]:
+        cached = self.store.get(title, self.language, source=SOURCE_EXTRACT) if self.store else None
+        if cached and (self.offline or time.time() - cached["fetched_at"] < self.ttl):
+            metrics.increment("nuvia_cache_hits_total", cache="articles")
+            return cached
+        metrics.increment("nuvia_cache_misses_total", cache="articles")
+        if self.offline:
             return None
-        
+
+        if cached:
+            # TTL expirado: pergunta apenas pelo revision_id atual (requisição leve)
+            info = self._query_page(title, prop="info")
+            if info is None:
+                return None
+            if info.get("lastrevid") == cached["revision_id"]:
+                self.store.touch(cached["title"], cached["revision_id"], self.language, SOURCE_EXTRACT)
+                return cached
+
+        page = self._query_page(
+            title, prop="extracts|info", explaintext=1, exsectionformat="wiki", inprop="url"
+        )
+        if page is None:
+            return None
+        article = self._to_article(page, SOURCE_EXTRACT)
+        if self.store:
+            self.store.put(article, self.language, requested_title=title)
+        return article
+
+    async def afetch_articles(self, titles: Iterable[str], batch_size: int = MAX_TITLES_PER_REQUEST,
+                              max_concurrency: int = 4, requests_per_second: float = 10.0,
+                              ) -> AsyncIterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Busca vários artigos, agrupando até `batch_size` títulos por requisição.
+
+        Os lotes rodam concorrentemente (no máximo `max_concurrency` requisições em
+        andamento, iniciadas a no máximo `requests_per_second` por segundo) e os
+        resultados são entregues à medida que cada lote termina, como pares
+        (título pedido, artigo). Artigos inexistentes vêm como (título, None).
+
+        O store é respeitado como em `fetch_article`: artigos dentro do TTL saem
+        direto dele, os expirados são revalidados em lote (só revision_id) e apenas
+        os que mudaram ou faltam são baixados.
+
+        O texto vem do wikitext da última revisão (`prop=revisions`), convertido
+        por `strip_wikitext`: a API de extracts só devolve o artigo completo de
+        uma página por requisição. Por isso o store guarda esse texto à parte
+        (source="wikitext"): `fetch_article` e `afetch_articles` devolvem sempre o
+        mesmo texto para uma revisão, independentemente de qual a buscou antes.
+        """
+        batch_size = min(batch_size, MAX_TITLES_PER_REQUEST)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        limiter = RateLimiter(requests_per_second)
+
+        async def run(function, batch):
+            # A requisição e a gravação no store (SQLite) rodam juntas fora do event loop
+            async with semaphore:
+                await limiter.wait()
+                return await asyncio.to_thread(function, batch)
+
+        async def fetch(batch: List[str]):
+            return await run(self._fetch_batch, batch)
+
+        async def revalidate(batch: List[Tuple[str, Dict[str, Any]]]):
+            results, changed = await run(self._revalidate_batch, batch)
+            if changed:
+                results.extend(await fetch(changed))
+            return results
+
+        titles = list(dict.fromkeys(titles))
+        stored = await asyncio.to_thread(self._stored_articles, titles) if self.store else {}
+        missing, stale = [], []
+        for title in titles:
+            cached = stored.get(title)
+            if cached and (self.offline or time.time() - cached["fetched_at"] < self.ttl):
+                metrics.increment("nuvia_cache_hits_total", cache="articles")
+                yield title, cached
+                continue
+            metrics.increment("nuvia_cache_misses_total", cache="articles")
+            if self.offline:
+                yield title, None
+            elif cached:
+                stale.append((title, cached))
+            else:
+                missing.append(title)
+
+        tasks = [revalidate(stale[i:i + batch_size]) for i in range(0, len(stale), batch_size)]
+        tasks += [fetch(missing[i:i + batch_size]) for i in range(0, len(missing), batch_size)]
+        for finished in asyncio.as_completed(tasks):
+            for result in await finished:
+                yield result
+
+    def _stored_articles(self, titles: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Versões guardadas (em formato wikitext) dos títulos que estão no store."""
+        stored = {}
+        for title in titles:
+            cached = self.store.get(title, self.language, source=SOURCE_WIKITEXT)
+            if cached:
+                stored[title] = cached
+        return stored
+
+    def _fetch_batch(self, batch: List[str]) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+        """Baixa o wikitext de um lote de títulos e grava o lote no store com um único commit."""
+        pages = self._query_pages(batch, prop="revisions|info", rvprop="ids|content",
+                                  rvslots="main", inprop="url")
+        results = []
+        for title in batch:
+            page = pages.get(title)
+            results.append((title, self._revision_to_article(page) if page else None))
+        if self.store:
+            self.store.put_many([(title, article) for title, article in results if article], self.language)
+        return results
+
+    def _revalidate_batch(self, batch: List[Tuple[str, Dict[str, Any]]]):
+        """
+        Consulta só o revision_id de um lote de artigos guardados. Retorna os
+        resultados dos que não mudaram (ou sumiram) e os títulos que mudaram.
+        """
+        pages = self._query_pages([title for title, _ in batch], prop="info")
+        results, changed, unchanged = [], [], []
+        for title, cached in batch:
+            page = pages.get(title)
+            if page is None:
+                results.append((title, None))
+            elif page.get("lastrevid") == cached["revision_id"]:
+                unchanged.append((cached["title"], cached["revision_id"]))
+                results.append((title, cached))
+            else:
+                changed.append(title)
+        if unchanged:
+            self.store.touch_many(unchanged, self.language, SOURCE_WIKITEXT)
+        return results, changed
+
+    def fetch_articles(self, titles: Iterable[str], **kwargs) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Versão síncrona de `afetch_articles`: título pedido -> artigo (ou None)."""
+        async def collect():
+            return {title: article async for title, article in self.afetch_articles(titles, **kwargs)}
+        return asyncio.run(collect())
+
     def search_articles(self,keyword, limit=5):
         """
         Usa a Wikipedia Search API via `requests` para retornar títulos relevantes.
         """
-        url = "https://en.wikipedia.org/w/api.php"
+        if self.offline:
+            return []
         params = {
             "action": "query",
             "list": "search",
@@ -35,10 +269,82 @@ class WikipediaScraper:
             "srlimit": limit
         }
 
-        response = requests.get(url, params=params)
+        response = self.session.get(self.api_url, params=params, timeout=self.timeout)
         if response.status_code == 200:
             data = response.json()
             titles = [entry["title"] for entry in data["query"]["search"]]
             return titles
         else:
             return []
+
+    def _query_page(self, title: str, **params) -> Optional[Dict[str, Any]]:
+        params = {"action": "query", "titles": title, "redirects": 1, "format": "json",
+                  "formatversion": 2, **params}
+        with metrics.span("wikipedia.request"):
+            response = self.session.get(self.api_url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        pages = response.json().get("query", {}).get("pages", [])
+        if not pages or pages[0].get("missing") or pages[0].get("invalid"):
+            return None
+        return pages[0]
+
+    def _query_pages(self, titles: List[str], **params) -> Dict[str, Dict[str, Any]]:
+        """
+        Consulta vários títulos de uma vez e devolve título pedido -> página,
+        seguindo normalizações, redirecionamentos e continuações (a API divide o
+        conteúdo das revisões em várias respostas quando ele é grande demais).
+        """
+        params = {"action": "query", "titles": "|".join(titles), "redirects": 1, "format": "json",
+                  "formatversion": 2, **params}
+        pages: Dict[str, Dict[str, Any]] = {}
+        aliases: Dict[str, str] = {}
+        while True:
+            with metrics.span("wikipedia.request"):
+                response = self.session.get(self.api_url, params=params, timeout=self.timeout)
+            response.raise_for_status()
+            data = response.json()
+            query = data.get("query", {})
+            for entry in query.get("normalized", []) + query.get("redirects", []):
+                aliases[entry["from"]] = entry["to"]
+            for page in query.get("pages", []):
+                merged = pages.setdefault(page["title"], {})
+                revisions = merged.get("revisions") or page.get("revisions")
+                merged.update(page)
+                if revisions:
+                    merged["revisions"] = revisions
+            if "continue" not in data:
+                break
+            params = {**params, **data["continue"]}
+
+        resolved = {}
+        for title in titles:
+            canonical, seen = title, set()
+            while canonical in aliases and canonical not in seen:
+                seen.add(canonical)
+                canonical = aliases[canonical]
+            page = pages.get(canonical)
+            if page and not page.get("missing") and not page.get("invalid"):
+                resolved[title] = page
+        return resolved
+
+    @classmethod
+    def _revision_to_article(cls, page: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        revisions = page.get("revisions")
+        if not revisions:
+            return None
+        revision = revisions[0]
+        content = revision.get("slots", {}).get("main", {}).get("content", revision.get("content", ""))
+        return cls._to_article({**page, "lastrevid": revision.get("revid", page.get("lastrevid")),
+                                "extract": strip_wikitext(content)}, SOURCE_WIKITEXT)
+
+    @staticmethod
+    def _to_article(page: Dict[str, Any], source: str = SOURCE_EXTRACT) -> Dict[str, Any]:
+        article = {
+            "title": page["title"],
+            "url": page.get("fullurl"),
+            "revision_id": page.get("lastrevid"),
+            "source": source,
+            "fetched_at": time.time(),
+        }
+        article.update(split_extract(page.get("extract", "")))
+        return article
@@ -0,0 +1,96 @@
+# adapters/wikipedia/wikitext.py
+"""
+Conversão de wikitext (conteúdo bruto das revisões e dos dumps) para texto simples.
+
+A saída segue o mesmo formato dos extracts com `exsectionformat=wiki`: parágrafos
+em texto simples e títulos de seção no formato "== Título ==", de modo que
+`split_extract` produza o mesmo layout de artigo nos dois caminhos. Não é um
+parser completo de wikitext: templates, tabelas, referências e arquivos são
+descartados, e links viram o seu texto visível.
+"""
+import html
+import re
+from typing import List
+
+_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+_REF = re.compile(r"<ref[^>/]*/>|<ref[^>]*>.*?</ref>", re.DOTALL | re.IGNORECASE)
+# Blocos cujo conteúdo não é texto corrido
+_DROPPED_TAGS = re.compile(
+    r"<(gallery|math|score|syntaxhighlight|source|timeline|imagemap|graph)\b[^>]*>.*?</\1>",
+    re.DOTALL | re.IGNORECASE,
+)
+_TAG = re.compile(r"</?[a-zA-Z][^>]*>")
+_TEMPLATE = re.compile(r"\{\{[^{}]*\}\}")
+_TABLE = re.compile(r"\{\|(?:(?!\{\|).)*?\|\}", re.DOTALL)
+_LINK = re.compile(r"\[\[([^\[\]]*)\]\]")
+_EXTERNAL_LINK = re.compile(r"\[(?:https?:)?//[^\s\]]+(?:\s+([^\]]*))?\]")
+_BOLD_ITALIC = re.compile(r"'{2,}")
+_MAGIC_WORD = re.compile(r"__[A-Z]+__")
+_LIST_PREFIX = re.compile(r"^[*#:;]+\s*", re.MULTILINE)
+_HEADING = re.compile(r"^(=+)\s*(.*?)\s*\1\s*$", re.MULTILINE)
+_BLANK_LINES = re.compile(r"\n{3,}")
+_CATEGORY = re.compile(r"\[\[\s*(?:Category|Categoria)\s*:\s*([^\]|]+)(?:\|[^\]]*)?\]\]", re.IGNORECASE)
+
+# Namespaces de links que não fazem parte do texto do artigo
+_HIDDEN_NAMESPACES = ("file", "image", "category", "media", "arquivo", "imagem", "categoria")
+
+
+def _replace_innermost(pattern: re.Pattern, repl, text: str) -> str:
+    """Aplica `pattern` repetidamente, resolvendo estruturas aninhadas de dentro para fora."""
+    while True:
+        text, count = pattern.subn(repl, text)
+        if not count:
+            return text
+
+
+def _link_text(match: re.Match) -> str:
+    target, _, label = match.group(1).partition("|")
+    namespace, sep, _ = target.partition(":")
+    if sep and namespace.strip().lower() in _HIDDEN_NAMESPACES:
+        return ""
+    if sep and not namespace.strip():
+        # [[:Category:X]] é um link visível para a página da categoria
+        target = target.lstrip(":")
+    text = label or target
+    # [[Page|]] ("pipe trick") e links com âncora: mostra só o nome da página
+    return text.split("#")[0] if not label else text
+
+
+def strip_wikitext(wikitext: str) -> str:
+    text = _COMMENT.sub("", wikitext)
+    text = _REF.sub("", text)
+    text = _DROPPED_TAGS.sub("", text)
+    text = _replace_innermost(_TEMPLATE, "", text)
+    text = _replace_innermost(_TABLE, "", text)
+    text = _replace_innermost(_LINK, _link_text, text)
+    text = _EXTERNAL_LINK.sub(lambda m: m.group(1) or "", text)
+    text = _TAG.sub("", text)
+    text = _BOLD_ITALIC.sub("", text)
+    text = _MAGIC_WORD.sub("", text)
+    text = _LIST_PREFIX.sub("", text)
+    text = html.unescape(text)
+
+    lines = []
+    for line in text.split("\n"):
+        line = line.strip()
+        heading = _HEADING.match(line)
+        if heading:
+            # Linha em branco antes do título, como nos extracts da API
+            lines.extend(["", f"{heading.group(1)} {heading.group(2)} {heading.group(1)}"])
+        else:
+            lines.append(re.sub(r"[ \t]{2,}", " ", line))
+    return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
+
+
+def categories(wikitext: str) -> List[str]:
+    """
+    Categorias declaradas explicitamente no wikitext ([[Category:...]]).
+    Categorias adicionadas por templates não aparecem aqui.
+    """
+    return [normalize_title(name) for name in _CATEGORY.findall(wikitext)]
+
+
+def normalize_title(title: str) -> str:
+    """Forma canônica de um título: sublinhados viram espaços e a primeira letra é maiúscula."""
+    title = " ".join(title.replace("_", " ").split())
+    return title[:1].upper() + title[1:]
@@ -1,22 +1,122 @@
 # application/services/bias_detection_service.py
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional, Sequence, Tuple, Union
 from nuvia.domain.value_objects.bias_segment import BiasSegment
+from nuvia.domain.value_objects.document import Document, Tokenizer
+from nuvia.application.services.metrics import metrics
 
 class BiasDetectionService(ABC):
+    # Tokenizer used to build Documents from plain text. Detectors may set their own.
+    tokenizer: Optional[Tokenizer] = None
+
     @property
     @abstractmethod
     def threshold(self) -> float:
         pass
 
+    @property
+    def detector_id(self) -> str:
+        """
+        Stable identifier of the detector, used e.g. to key cached results.
+        """
+        return type(self).__name__
+
+    @property
+    def model_version(self) -> str:
+        """
+        Version of the model/lexicon behind the detector. Changing it invalidates cached results.
+        """
+        return "1"
+
     @abstractmethod
-    def detect(self, text: str) -> List[BiasSegment]:
+    def detect(self, text: Union[str, Document]) -> List[BiasSegment]:
         """
         Detects bias in the given text and returns a list of BiasSegment objects.
-        :param text: The text to analyze.
+        :param text: The text to analyze, or a Document already tokenized.
         :return: A list of BiasSegment objects containing biased segments and their reasons.
         """
         pass
+
+    def as_document(self, text: Union[str, Document]) -> Document:
+        """
+        Wraps plain text in a Document using this detector's tokenizer.
+        Documents are returned as they are, so their tokenization is reused.
+        """
+        if isinstance(text, Document):
+            return text
+        if self.tokenizer is None:
+            # Default segmentation: NLTK Punkt (same as sent_tokenize)
+            from nuvia.adapters.nlp.tokenizers import PunktTokenizer
+            self.tokenizer = PunktTokenizer()
+        return Document(text, self.tokenizer)
+
+    def sentence_spans(self, text: Union[str, Document]) -> List[Tuple[int, int]]:
+        """
+        Splits the text into the sentences this detector works on.
+
+        :param text: The text (or Document) to split.
+        :return: (start, end) character offsets of each sentence, in reading order.
+        """
+        return self.as_document(text).spans
+
+    def split_sentences(self, text: Union[str, Document]) -> List[str]:
+        """
+        Splits the text into the sentences this detector works on.
+
+        :param text: The text (or Document) to split.
+        :return: The sentences, in reading order.
+        """
+        return self.as_document(text).sentences
+
+    def detect_document(self, document: Document, indices: Optional[Sequence[int]] = None) -> List[BiasSegment]:
+        """
+        Detects bias in the sentences of a Document and sets the character
+        offsets (start, end) of each segment found.
+
+        :param document: The tokenized text.
+        :param indices: Indices of the sentences to analyze (default: all of them).
+        :return: A list of BiasSegment objects with offsets into `document.text`.
+        """
+        if indices is None:
+            indices = range(len(document))
+        indices = list(indices)
+        with metrics.span("tokenize"):
+            sentences = [document.sentences[i] for i in indices]
+        found = self.detect_sentences(sentences, words=document.words_for(indices))
+
+        segments = []
+        for i, sentence, sentence_segments in zip(indices, sentences, found):
+            start = document.spans[i][0]
+            for seg in sentence_segments:
+                offset = 0 if seg.text == sentence else sentence.find(seg.text)
+                if offset >= 0:
+                    seg.start = start + offset
+                    seg.end = seg.start + len(seg.text)
+                segments.append(seg)
+        return segments
+
+    def detect_sentences(self, sentences: List[str],
+                         words: Optional[Sequence[List[str]]] = None) -> List[List[BiasSegment]]:
+        """
+        Detects bias in already segmented sentences.
+        Detectors that can process many sentences at once should override this.
+
+        :param sentences: The sentences to analyze.
+        :param words: Optional word tokens of each sentence, when already available.
+        :return: One list of BiasSegment objects per input sentence, in the same order.
+        """
+        return [self.detect(sentence) for sentence in sentences]
+
+    def detect_sentences_checked(self, sentences: List[str], words: Optional[Sequence[List[str]]] = None
+                                 ) -> Tuple[List[List[BiasSegment]], List[bool]]:
+        """
+        Same as `detect_sentences`, plus one flag per sentence telling whether the
+        result is authoritative. Fallback results (e.g. the model failed to load
+        or to score that sentence) are flagged False and must not be cached.
+
+        :return: (segments per sentence, reliable flag per sentence).
+        """
+        return self.detect_sentences(sentences, words=words), [True] * len(sentences)
     
     @abstractmethod
     def summarize_bias(self, text: str) -> str:
@@ -0,0 +1,195 @@
+# application/services/metrics.py
+"""
+Instrumentação leve do pipeline de análise.
+
+- `metrics.span("etapa")`: context manager que mede o tempo de uma etapa
+  (busca na Wikipedia, tokenização, inferência, léxico, score, renderização).
+- `metrics.increment(...)` / `metrics.observe(...)`: contadores (sentenças
+  processadas, acertos de cache) e histogramas (tamanho dos lotes do modelo).
+- `metrics.timings()`: coleta o tempo por etapa de uma análise específica; é o
+  que vai para `AnalysisResult.timings`.
+- `metrics.to_prometheus()`: exporta tudo no formato texto do Prometheus.
+
+Com NUVIA_METRICS=0 o registro fica desligado: `span` devolve um context
+manager vazio compartilhado e os contadores retornam logo na primeira linha.
+Os spans envolvem etapas inteiras (nunca uma sentença), então mesmo ligado o
+custo é de algumas chamadas a `perf_counter` por análise.
+"""
+import bisect
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+
+STAGE_DURATION = "nuvia_stage_duration_seconds"
+
+HELP = {
+    STAGE_DURATION: "Time spent in each stage of the analysis pipeline.",
+    "nuvia_sentences_processed_total": "Sentences analyzed, by detector.",
+    "nuvia_cache_hits_total": "Lookups served from a local cache.",
+    "nuvia_cache_misses_total": "Lookups that missed a local cache.",
+    "nuvia_batch_size": "Sentences per model call (or per micro-batch).",
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # O último é o +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Timings:
+    """Tempo acumulado (em segundos) por etapa de uma análise."""
+    def __init__(self, stages: Optional[Dict[str, float]] = None):
+        self.stages: Dict[str, float] = dict(stages or {})
+
+    def add(self, stage: str, seconds: float):
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+
+_current_timings: ContextVar[Optional[Timings]] = ContextVar("nuvia_timings", default=None)
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("registry", "stage", "start")
+
+    def __init__(self, registry: "MetricsRegistry", stage: str):
+        self.registry = registry
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        self.registry.observe(STAGE_DURATION, elapsed, stage=self.stage)
+        timings = _current_timings.get()
+        if timings is not None:
+            timings.add(self.stage, elapsed)
+        return False
+
+
+class MetricsRegistry:
+    """Contadores e histogramas do processo, seguros entre threads."""
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+
+    def span(self, stage: str):
+        """Mede o tempo do bloco `with` como a etapa `stage`."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, stage)
+
+    def increment(self, name: str, value: float = 1.0, **labels: str):
+        if not self.enabled:
+            return
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, buckets: Sequence[float] = DURATION_BUCKETS, **labels: str):
+        if not self.enabled:
+            return
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    @contextmanager
+    def timings(self, timings: Optional[Timings] = None) -> Iterator[Timings]:
+        """
+        Coleta, em `timings` (ou em um novo), o tempo das etapas executadas dentro
+        do bloco nesta thread/tarefa. Pode ser reaberto com o mesmo objeto para
+        acumular etapas intercaladas com outro código (ex.: análise em blocos).
+        """
+        timings = timings if timings is not None else Timings()
+        if not self.enabled:
+            yield timings
+            return
+        token = _current_timings.set(timings)
+        try:
+            yield timings
+        finally:
+            _current_timings.reset(token)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def to_prometheus(self) -> str:
+        """Exporta os contadores e histogramas no formato texto do Prometheus."""
+        lines: List[str] = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                self._header(lines, name, "counter")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{name}{_labels(key)} {_number(value)}")
+            for name, series in sorted(self._histograms.items()):
+                self._header(lines, name, "histogram")
+                for key, histogram in sorted(series.items()):
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        cumulative += count
+                        lines.append(f"{name}_bucket{_labels(key + (('le', _number(bound)),))} {cumulative}")
+                    lines.append(f"{name}_bucket{_labels(key + (('le', '+Inf'),))} {histogram.count}")
+                    lines.append(f"{name}_sum{_labels(key)} {_number(histogram.sum)}")
+                    lines.append(f"{name}_count{_labels(key)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _header(lines: List[str], name: str, kind: str):
+        if name in HELP:
+            lines.append(f"# HELP {name} {HELP[name]}")
+        lines.append(f"# TYPE {name} {kind}")
+
+
+def _labels(key: LabelKey) -> str:
+    if not key:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in key) + "}"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+# Registro do processo, usado por todo o pipeline
+metrics = MetricsRegistry(enabled=os.environ.get("NUVIA_METRICS", "1") != "0")
@@ -1,21 +1,68 @@
 # application/use_cases/analyze_article_use_case.py
+import asyncio
 from nuvia.domain.entities.article import Article
 from nuvia.application.services.bias_detection_service import BiasDetectionService
+from nuvia.application.services.metrics import Timings, metrics
 
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field, replace
+from typing import AsyncIterator, Dict, Iterator, List, Union
 from nuvia.domain.entities.article import BiasSegment # Importa apenas o que precisa
+from nuvia.domain.value_objects.segment_table import SegmentTable
 
 @dataclass(frozen=True)
 class AnalysisResult:
     """Um objeto para encapsular os resultados da análise de viés."""
-    segments: List[BiasSegment]
+    # Lista de BiasSegment ou, em forma compacta, uma SegmentTable (itera como a lista)
+    segments: Union[List[BiasSegment], SegmentTable]
     overall_score: float
     article_title: str
-    
+    timings: Dict[str, float] = field(default_factory=dict) # Segundos por etapa (vazio sem métricas)
+
+    def compact(self, article_text: str) -> "AnalysisResult":
+        """Cópia com os segmentos em uma SegmentTable que referencia `article_text`."""
+        if isinstance(self.segments, SegmentTable):
+            return self
+        return replace(self, segments=SegmentTable.from_segments(self.segments, article_text))
+
+
+@dataclass(frozen=True)
+class AnalysisProgress:
+    """Resultado parcial emitido por `execute_stream` a cada bloco de sentenças processado."""
+    segments: List[BiasSegment] # Apenas os segmentos encontrados neste bloco
+    overall_score: float        # Score acumulado até aqui (o último é igual ao de `execute`)
+    processed_sentences: int
+    total_sentences: int
+    article_title: str
+    timings: Dict[str, float] = field(default_factory=dict) # Acumulado até este bloco
+    processed_chars: int = 0    # O texto já analisado é article.content[:processed_chars]
+
+    @property
+    def done(self) -> bool:
+        return self.processed_sentences >= self.total_sentences
+
+
+def compute_overall_score(total_score: float, num_words: int) -> float:
+    """
+    Abordagem Híbrida (Recomendada): Soma dos scores normalizada pelo tamanho do texto.
+    Isso penaliza tanto a gravidade quanto a frequência do viés.
+    """
+    if num_words <= 0:
+        return 0.0
+    # Multiplicamos por 1000 para obter um score "por 1000 palavras", que é mais fácil de interpretar.
+    return (total_score / num_words) * 1000
+
+
 class AnalyzeArticleUseCase:
-    def __init__(self, detector: BiasDetectionService):
+    def __init__(self, detector: BiasDetectionService, compact_segments: bool = False):
+        """
+        Args:
+            detector: O detector de viés.
+            compact_segments: Devolve os segmentos em uma SegmentTable (colunar), em vez
+                              de uma lista de objetos; útil quando muitos resultados
+                              ficam em memória ao mesmo tempo.
+        """
         self.detector = detector
+        self.compact_segments = compact_segments
 
     def execute(self, article: Article) -> AnalysisResult:
         """
@@ -27,27 +74,95 @@ class AnalyzeArticleUseCase:
         Returns:
             Um objeto AnalysisResult contendo os segmentos de viés e a pontuação geral.
         """
-        # 1. Detectar os segmentos de viés no conteúdo do artigo
-        segments = self.detector.detect(article.content)
+        with metrics.timings() as timings, metrics.span("analysis"):
+            # 1. Detectar os segmentos de viés no conteúdo do artigo
+            document = self._tokenize(article)
+            segments = self.detector.detect(document)
 
-        # 2. Calcular o 'Overall Bias Score' de forma mais robusta
-        overall_score = 0.0
-        if segments:
-            # Abordagem Híbrida (Recomendada): Soma dos scores normalizada pelo tamanho do texto.
-            # Isso penaliza tanto a gravidade quanto a frequência do viés.
-            num_words = len(article.content.split())
-            if num_words > 0:
-                total_score = sum(seg.score for seg in segments)
-                # Multiplicamos por 1000 para obter um score "por 1000 palavras", que é mais fácil de interpretar.
-                overall_score = (total_score / num_words) * 1000
+            # 2. Calcular o 'Overall Bias Score' de forma mais robusta
+            overall_score = 0.0
+            if segments:
+                with metrics.span("scoring"):
+                    total_score = sum(seg.score for seg in segments)
+                    overall_score = compute_overall_score(total_score, len(article.content.split()))
 
             # Se preferir a média simples (sua abordagem original corrigida):
             # total_score = sum(seg.score for seg in segments)
             # overall_score = total_score / len(segments)
 
         # 3. Criar e retornar um objeto de resultado imutável, sem modificar o 'article' original
-        return AnalysisResult(
+        result = AnalysisResult(
             segments=segments,
             overall_score=overall_score,
-            article_title=article.title
+            article_title=article.title,
+            timings=timings.stages,
         )
+        return result.compact(article.content) if self.compact_segments else result
+
+    def _tokenize(self, article: Article):
+        """Segmenta o artigo (a tokenização dos documentos é preguiçosa; aqui ela é medida)."""
+        with metrics.span("tokenize"):
+            document = self.detector.as_document(article.content)
+            total_sentences = len(document)
+        metrics.increment("nuvia_sentences_processed_total", total_sentences, detector=self.detector.detector_id)
+        return document
+
+    def execute_stream(self, article: Article, chunk_size: int = 32) -> Iterator[AnalysisProgress]:
+        """
+        Variante incremental de `execute`: processa o artigo em blocos de `chunk_size`
+        sentenças e emite um AnalysisProgress por bloco, permitindo que a interface
+        mostre resultados antes do fim da análise.
+
+        Os segmentos não são acumulados aqui; quem consome decide se os guarda.
+        O `overall_score` do último item é igual ao retornado por `execute`.
+
+        Args:
+            article: O objeto Article a ser analisado.
+            chunk_size: Quantidade de sentenças enviadas ao detector por vez.
+        """
+        # O contexto de métricas é reaberto a cada bloco: entre dois `yield` roda
+        # o código de quem consome, que não deve entrar na conta desta análise.
+        timings = Timings()
+        with metrics.timings(timings), metrics.span("analysis"):
+            document = self._tokenize(article)
+            total_sentences = len(document)
+            num_words = len(article.content.split())
+        total_score = 0.0
+
+        if not total_sentences:
+            yield AnalysisProgress([], 0.0, 0, 0, article.title, timings=dict(timings.stages))
+            return
+
+        spans = document.spans
+        for start in range(0, total_sentences, chunk_size):
+            chunk = range(start, min(start + chunk_size, total_sentences))
+            with metrics.timings(timings), metrics.span("analysis"):
+                segments = self.detector.detect_document(document, chunk)
+                with metrics.span("scoring"):
+                    # Soma segmento a segmento, na ordem de `execute`: somar o total de cada
+                    # bloco arredondaria diferente e o score final não bateria
+                    for seg in segments:
+                        total_score += seg.score
+                    overall_score = compute_overall_score(total_score, num_words)
+            yield AnalysisProgress(
+                segments=segments,
+                overall_score=overall_score,
+                processed_sentences=start + len(chunk),
+                total_sentences=total_sentences,
+                article_title=article.title,
+                timings=dict(timings.stages),
+                processed_chars=len(article.content) if chunk.stop == total_sentences else spans[chunk.stop - 1][1],
+            )
+
+    async def aexecute_stream(self, article: Article, chunk_size: int = 32) -> AsyncIterator[AnalysisProgress]:
+        """
+        Versão assíncrona de `execute_stream`. Cada bloco roda em uma thread
+        para não bloquear o event loop durante a inferência.
+        """
+        stream = self.execute_stream(article, chunk_size)
+        sentinel = object()
+        while True:
+            progress = await asyncio.to_thread(next, stream, sentinel)
+            if progress is sentinel:
+                break
+            yield progress
@@ -0,0 +1,268 @@
+# application/use_cases/batch_analysis_use_case.py
+import os
+import queue
+import threading
+import time
+import multiprocessing
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Union
+
+from nuvia.domain.entities.article import Article
+from nuvia.application.services.bias_detection_service import BiasDetectionService
+from nuvia.application.use_cases.analyze_article_use_case import AnalyzeArticleUseCase
+from nuvia.application.use_cases.incremental_analysis_use_case import (
+    AnalysisSnapshotRepository,
+    IncrementalAnalyzeArticleUseCase,
+)
+
+
+@dataclass
+class BatchItem:
+    """Um item do lote: ou já traz o texto, ou apenas o título a ser buscado."""
+    item_id: str
+    title: str
+    text: Optional[str] = None
+    url: Optional[str] = None
+    attempts: int = 0
+    timings: Dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+# Estado de cada processo do pool: o detector é carregado uma única vez por worker.
+_worker_use_case: Optional[Union[AnalyzeArticleUseCase, IncrementalAnalyzeArticleUseCase]] = None
+
+
+def _init_worker(detector_factory: Callable[[], BiasDetectionService], threads_per_worker: int,
+                 snapshot_store_factory: Optional[Callable[[], AnalysisSnapshotRepository]] = None):
+    global _worker_use_case
+    # Evita que cada worker tente usar todos os núcleos (oversubscription)
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ[var] = str(threads_per_worker)
+    if snapshot_store_factory is not None:
+        _worker_use_case = IncrementalAnalyzeArticleUseCase(detector_factory(), snapshot_store_factory())
+    else:
+        _worker_use_case = AnalyzeArticleUseCase(detector_factory())
+
+
+def _analyze_in_worker(title: str, text: str) -> Dict[str, Any]:
+    start = time.perf_counter()
+    result = _worker_use_case.execute(Article(title=title, content=text))
+    output = {
+        "overall_score": result.overall_score,
+        "segments": [
+            {"text": seg.text, "reason": seg.reason, "score": seg.score, "start": seg.start, "end": seg.end}
+            for seg in result.segments
+        ],
+        "analyze_s": time.perf_counter() - start,
+        "stages": result.timings,
+        "pid": os.getpid(),
+    }
+    if isinstance(_worker_use_case, IncrementalAnalyzeArticleUseCase):
+        output["incremental"] = asdict(_worker_use_case.last_stats)
+    return output
+
+
+_DONE = object()
+
+
+class BatchAnalysisUseCase:
+    """
+    Analisa muitos artigos em paralelo usando um pool de processos.
+
+    - Cada processo carrega o detector uma vez (via `detector_factory`, que precisa
+      ser serializável com pickle, ex.: uma classe ou um functools.partial).
+    - A busca dos artigos (`fetcher`) roda em threads no processo principal, em
+      paralelo com a inferência nos workers.
+    - Os resultados são emitidos assim que ficam prontos (fora da ordem de entrada).
+    - Itens que falham, inclusive por queda de um worker, são reenviados até
+      `max_retries` vezes antes de serem reportados como erro. Quando um worker
+      cai, não dá para saber qual item o derrubou: todos os que estavam em voo
+      vão para uma quarentena, sem gastar tentativas, e voltam um de cada vez.
+      Só o item da quarentena que estiver rodando quando o pool cair de novo
+      tem a tentativa contada; um artigo "venenoso" não esgota as tentativas
+      dos itens que rodavam ao seu lado.
+    - Com `snapshot_store_factory`, cada worker usa a reanálise incremental:
+      só as sentenças que mudaram desde a última análise do artigo vão ao detector.
+    """
+    def __init__(self, detector_factory: Callable[[], BiasDetectionService],
+                 fetcher: Optional[Callable[[str], Optional[Dict[str, Any]]]] = None,
+                 workers: Optional[int] = None, fetch_workers: int = 8,
+                 max_retries: int = 2, threads_per_worker: int = 1,
+                 snapshot_store_factory: Optional[Callable[[], AnalysisSnapshotRepository]] = None):
+        self.detector_factory = detector_factory
+        self.snapshot_store_factory = snapshot_store_factory
+        self.fetcher = fetcher
+        self.workers = workers or os.cpu_count() or 1
+        self.fetch_workers = fetch_workers
+        self.max_retries = max_retries
+        self.threads_per_worker = threads_per_worker
+        # Itens prontos em espera: limita a memória a uma janela, não ao lote inteiro
+        self.max_in_flight = self.workers * 2
+
+    def execute(self, items: Iterable[BatchItem]) -> Iterator[Dict[str, Any]]:
+        """
+        Processa os itens e gera um registro (dict serializável em JSON) por item.
+        """
+        ready: "queue.Queue" = queue.Queue(maxsize=self.max_in_flight)
+        feeder = threading.Thread(target=self._feed, args=(items, ready), daemon=True)
+        feeder.start()
+
+        pool = self._new_pool()
+        in_flight = {}
+        exhausted = False
+        quarantine: "deque[BatchItem]" = deque()
+        suspect = None  # O item da quarentena em voo (no máximo um por vez)
+        try:
+            while not exhausted or in_flight or quarantine:
+                # 1. Preenche os workers livres: primeiro um item da quarentena, depois os já buscados
+                if suspect is None and quarantine:
+                    suspect = quarantine.popleft()
+                    in_flight[self._submit(pool, suspect)] = suspect
+                while not exhausted and len(in_flight) < self.max_in_flight:
+                    try:
+                        item = ready.get(block=not in_flight)
+                    except queue.Empty:
+                        break
+                    if item is _DONE:
+                        exhausted = True
+                    elif item.error:
+                        yield self._error_record(item)
+                    else:
+                        in_flight[self._submit(pool, item)] = item
+
+                if not in_flight:
+                    continue
+
+                # 2. Coleta o que terminou
+                done, _ = wait(in_flight, timeout=0.1, return_when=FIRST_COMPLETED)
+                retry = []
+                crashed = []
+                for future in done:
+                    item = in_flight.pop(future)
+                    try:
+                        output = future.result()
+                    except BrokenProcessPool as e:
+                        item.error = f"Worker crashed: {e}"
+                        crashed.append(item)
+                        continue
+                    except Exception as e:
+                        item.error = repr(e)
+                        retry.append(item)
+                    else:
+                        yield self._ok_record(item, output)
+                    if item is suspect:
+                        suspect = None
+
+                if crashed:
+                    # Um worker caiu: o pool inteiro fica inutilizável. Recria e reenvia tudo.
+                    print("Worker process crashed, restarting the process pool...")
+                    for item in in_flight.values():
+                        item.error = "Worker crashed"
+                        crashed.append(item)
+                    in_flight.clear()
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    pool = self._new_pool()
+                    for item in crashed:
+                        if item is suspect:
+                            # Único item da quarentena em voo na queda: a tentativa conta
+                            if item.attempts > self.max_retries:
+                                yield self._error_record(item)
+                            else:
+                                quarantine.appendleft(item)
+                        else:
+                            item.attempts -= 1
+                            quarantine.append(item)
+                    suspect = None
+
+                for item in retry:
+                    if item.attempts > self.max_retries:
+                        yield self._error_record(item)
+                    else:
+                        in_flight[self._submit(pool, item)] = item
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.detector_factory, self.threads_per_worker, self.snapshot_store_factory),
+        )
+
+    def _submit(self, pool: ProcessPoolExecutor, item: BatchItem):
+        item.attempts += 1
+        item.timings["submitted_at"] = time.perf_counter()
+        return pool.submit(_analyze_in_worker, item.title, item.text)
+
+    def _feed(self, items: Iterable[BatchItem], ready: "queue.Queue"):
+        """Busca os artigos (quando necessário) em threads e os entrega prontos para análise."""
+        slots = threading.BoundedSemaphore(self.max_in_flight + self.fetch_workers)
+
+        def fetch(item: BatchItem):
+            try:
+                start = time.perf_counter()
+                for attempt in range(self.max_retries + 1):
+                    try:
+                        content = self.fetcher(item.title)
+                        break
+                    except Exception as e:
+                        if attempt == self.max_retries:
+                            item.error = f"Fetch failed: {e!r}"
+                            return item
+                item.timings["fetch_s"] = time.perf_counter() - start
+                if not content:
+                    item.error = "Article not found"
+                else:
+                    item.title, item.text, item.url = content["title"], content["text"], content.get("url")
+                return item
+            finally:
+                ready.put(item)
+                slots.release()
+
+        with ThreadPoolExecutor(max_workers=self.fetch_workers) as fetch_pool:
+            for item in items:
+                if item.text is not None:
+                    ready.put(item)
+                    continue
+                if self.fetcher is None:
+                    item.error = "No text and no fetcher configured"
+                    ready.put(item)
+                    continue
+                slots.acquire()
+                fetch_pool.submit(fetch, item)
+        ready.put(_DONE)
+
+    def _ok_record(self, item: BatchItem, output: Dict[str, Any]) -> Dict[str, Any]:
+        elapsed = time.perf_counter() - item.timings.pop("submitted_at")
+        record = {
+            "id": item.item_id,
+            "title": item.title,
+            "url": item.url,
+            "status": "ok",
+            "attempts": item.attempts,
+            "overall_score": output["overall_score"],
+            "segments": output["segments"],
+            "timings": {
+                "fetch_s": item.timings.get("fetch_s", 0.0),
+                "queue_s": max(0.0, elapsed - output["analyze_s"]),
+                "analyze_s": output["analyze_s"],
+                "stages": output["stages"],
+            },
+            "worker_pid": output["pid"],
+        }
+        if "incremental" in output:
+            record["incremental"] = output["incremental"]
+        return record
+
+    def _error_record(self, item: BatchItem) -> Dict[str, Any]:
+        return {
+            "id": item.item_id,
+            "title": item.title,
+            "status": "error",
+            "attempts": item.attempts,
+            "error": item.error,
+        }
@@ -0,0 +1,227 @@
+# application/use_cases/incremental_analysis_use_case.py
+import hashlib
+import re
+from dataclasses import asdict, dataclass, field, replace
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional, Protocol, Tuple
+
+from nuvia.domain.entities.article import Article
+from nuvia.domain.value_objects.bias_segment import BiasSegment
+from nuvia.application.services.bias_detection_service import BiasDetectionService
+from nuvia.application.services.metrics import metrics
+from nuvia.application.use_cases.analyze_article_use_case import AnalysisResult, compute_overall_score
+
+# Seções = blocos de texto separados por linhas em branco (parágrafos e títulos)
+_SECTION_BREAK = re.compile(r"\n[ \t]*\n")
+
+
+def fingerprint(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+@dataclass
+class SentenceSnapshot:
+    fingerprint: str
+    start: int  # Offset da sentença dentro da seção
+    # Segmentos encontrados: [texto, motivo, score, início, fim], com offsets relativos à sentença
+    segments: List[list]
+
+
+@dataclass
+class SectionSnapshot:
+    fingerprint: str
+    sentences: List[SentenceSnapshot]
+
+
+@dataclass
+class AnalysisSnapshot:
+    """
+    Resultado de uma análise guardado com as impressões digitais (hashes) de
+    cada seção e de cada sentença, para que a próxima revisão do artigo só
+    precise analisar o que mudou.
+    """
+    detector_key: str
+    total_score: float
+    sections: List[SectionSnapshot] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AnalysisSnapshot":
+        sections = [
+            SectionSnapshot(
+                fingerprint=section["fingerprint"],
+                sentences=[SentenceSnapshot(**sentence) for sentence in section["sentences"]],
+            )
+            for section in data["sections"]
+        ]
+        return cls(detector_key=data["detector_key"], total_score=data["total_score"], sections=sections)
+
+
+@dataclass(frozen=True)
+class IncrementalStats:
+    sections: int
+    reused_sections: int
+    sentences: int
+    analyzed_sentences: int  # Sentenças enviadas ao detector
+
+
+class AnalysisSnapshotRepository(Protocol):
+    def get(self, title: str, detector_key: str) -> Optional[AnalysisSnapshot]: ...
+
+    def put(self, title: str, snapshot: AnalysisSnapshot) -> None: ...
+
+
+class IncrementalAnalyzeArticleUseCase:
+    """
+    Reanálise incremental de artigos editados.
+
+    A nova revisão é tokenizada inteira (como em `AnalyzeArticleUseCase.execute`),
+    mas o detector só recebe as sentenças que não existiam na análise anterior:
+    1. As seções são comparadas pelo hash com as da análise anterior (diff com
+       SequenceMatcher); seções iguais são reaproveitadas por inteiro.
+    2. Nas seções que mudaram, cada sentença cujo hash já existia na análise
+       anterior reaproveita os segmentos dela.
+    3. O `total_score` é recalculado a partir dos segmentos, na ordem do texto
+       (a mesma soma de `execute`; atualizá-lo por diferenças acumularia erros
+       de arredondamento entre revisões).
+
+    O resultado é o mesmo de `AnalyzeArticleUseCase.execute` para detectores
+    que analisam cada sentença de forma independente (todos os deste projeto).
+    """
+    def __init__(self, detector: BiasDetectionService, store: Optional[AnalysisSnapshotRepository] = None):
+        self.detector = detector
+        self.store = store
+        self.last_snapshot: Optional[AnalysisSnapshot] = None
+        self.last_stats: Optional[IncrementalStats] = None
+
+    @property
+    def detector_key(self) -> str:
+        # Uma análise anterior só vale para o mesmo detector, versão e limiar
+        return f"{self.detector.detector_id}|{self.detector.model_version}|{self.detector.threshold!r}"
+
+    def execute(self, article: Article, previous: Optional[AnalysisSnapshot] = None) -> AnalysisResult:
+        """
+        Analisa o artigo reaproveitando a análise anterior.
+
+        Args:
+            article: O objeto Article a ser analisado.
+            previous: Snapshot da análise anterior. Se omitido, é buscado no `store`.
+
+        Returns:
+            Um AnalysisResult igual ao de uma análise completa. O snapshot novo fica
+            em `last_snapshot` (e é gravado no `store`) e as estatísticas em `last_stats`.
+        """
+        with metrics.timings() as timings, metrics.span("analysis"):
+            result = self._execute(article, previous)
+        return replace(result, timings=timings.stages)
+
+    def _execute(self, article: Article, previous: Optional[AnalysisSnapshot]) -> AnalysisResult:
+        if previous is None and self.store is not None:
+            previous = self.store.get(article.title, self.detector_key)
+        if previous is not None and previous.detector_key != self.detector_key:
+            previous = None
+        old_sections = previous.sections if previous else []
+
+        with metrics.span("tokenize"):
+            document = self.detector.as_document(article.content)
+            sections = self._split_sections(article.content, document.spans)
+        new_fingerprints = [fingerprint(article.content[start:end]) for start, end, _ in sections]
+
+        # 1. Diff das seções: as iguais são reaproveitadas
+        snapshots: List[Optional[SectionSnapshot]] = [None] * len(sections)
+        matched_old = set()
+        matcher = SequenceMatcher(None, [s.fingerprint for s in old_sections], new_fingerprints, autojunk=False)
+        for tag, i1, i2, j1, _ in matcher.get_opcodes():
+            if tag == "equal":
+                for k in range(i2 - i1):
+                    snapshots[j1 + k] = old_sections[i1 + k]
+                    matched_old.add(i1 + k)
+
+        # 2. Seções alteradas: sentenças conhecidas reaproveitam os segmentos, as novas vão ao detector
+        known = {
+            sentence.fingerprint: sentence.segments
+            for section in old_sections for sentence in section.sentences
+        }
+        pending: List[Tuple[SentenceSnapshot, int]] = []
+        for position, (start, _, indices) in enumerate(sections):
+            if snapshots[position] is not None:
+                continue
+            sentences = []
+            for i in indices:
+                sentence_fp = fingerprint(document.sentences[i])
+                snapshot = SentenceSnapshot(sentence_fp, document.spans[i][0] - start, known.get(sentence_fp))
+                if snapshot.segments is None:
+                    pending.append((snapshot, i))
+                sentences.append(snapshot)
+            snapshots[position] = SectionSnapshot(new_fingerprints[position], sentences)
+
+        if pending:
+            indices = [i for _, i in pending]
+            found = self.detector.detect_sentences(
+                [document.sentences[i] for i in indices], words=document.words_for(indices)
+            )
+            for (snapshot, i), segments in zip(pending, found):
+                snapshot.segments = [self._relative(seg, document.sentences[i]) for seg in segments]
+
+        segments = []
+        for (start, _, _), section in zip(sections, snapshots):
+            for sentence in section.sentences:
+                offset = start + sentence.start
+                for text, reason, score, seg_start, seg_end in sentence.segments:
+                    segments.append(BiasSegment(
+                        text=text, reason=reason, score=score,
+                        start=offset + seg_start if seg_start is not None else None,
+                        end=offset + seg_end if seg_end is not None else None,
+                    ))
+        # 3. Score: a mesma soma, na mesma ordem, de uma análise completa
+        total_score = sum(seg.score for seg in segments)
+
+        self.last_snapshot = AnalysisSnapshot(self.detector_key, total_score, snapshots)
+        self.last_stats = IncrementalStats(
+            sections=len(sections),
+            reused_sections=len(matched_old),
+            sentences=len(document),
+            analyzed_sentences=len(pending),
+        )
+        if self.store is not None:
+            self.store.put(article.title, self.last_snapshot)
+        metrics.increment("nuvia_sentences_processed_total", len(pending), detector=self.detector.detector_id)
+        metrics.increment("nuvia_cache_hits_total", len(document) - len(pending), cache="snapshots")
+        metrics.increment("nuvia_cache_misses_total", len(pending), cache="snapshots")
+
+        overall_score = 0.0
+        if segments:
+            overall_score = compute_overall_score(total_score, len(article.content.split()))
+        return AnalysisResult(segments=segments, overall_score=overall_score, article_title=article.title)
+
+    @staticmethod
+    def _split_sections(text: str, spans: List[Tuple[int, int]]) -> List[Tuple[int, int, List[int]]]:
+        """
+        Agrupa as sentenças nas seções onde começam. Cada seção vai do início da
+        sua primeira sentença ao fim da última, então uma sentença que atravessa
+        uma linha em branco faz parte do hash da seção a que foi atribuída.
+        """
+        breaks = [m.end() for m in _SECTION_BREAK.finditer(text)]
+        sections: List[Tuple[int, int, List[int]]] = []
+        current = None
+        b = 0
+        for i, (start, end) in enumerate(spans):
+            while b < len(breaks) and breaks[b] <= start:
+                b += 1
+            if b == current:
+                first, _, indices = sections[-1]
+                indices.append(i)
+                sections[-1] = (first, end, indices)
+            else:
+                sections.append((start, end, [i]))
+                current = b
+        return sections
+
+    @staticmethod
+    def _relative(segment: BiasSegment, sentence: str) -> list:
+        offset = 0 if segment.text == sentence else sentence.find(segment.text)
+        if offset < 0:
+            return [segment.text, segment.reason, segment.score, None, None]
+        return [segment.text, segment.reason, segment.score, offset, offset + len(segment.text)]
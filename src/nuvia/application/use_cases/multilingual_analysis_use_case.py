@@ -0,0 +1,40 @@
+# application/use_cases/multilingual_analysis_use_case.py
+from typing import AsyncIterator, Callable, Iterator
+
+from nuvia.domain.entities.article import Article
+from nuvia.application.services.bias_detection_service import BiasDetectionService
+from nuvia.application.use_cases.analyze_article_use_case import (
+    AnalysisProgress,
+    AnalysisResult,
+    AnalyzeArticleUseCase,
+)
+
+
+class MultilingualAnalyzeArticleUseCase:
+    """
+    Analisa cada Article com o detector do seu idioma (`article.language`).
+
+    `detector_for` resolve o idioma para um detector, normalmente
+    `DetectorRegistry.detector`, que carrega os modelos sob demanda e descarrega
+    os idiomas menos usados. A análise em si é a do AnalyzeArticleUseCase.
+    """
+    def __init__(self, detector_for: Callable[[str], BiasDetectionService], compact_segments: bool = False):
+        """
+        Args:
+            detector_for: Função idioma -> detector (ex.: `lambda lang: registry.detector(lang, "hybrid")`).
+            compact_segments: Ver AnalyzeArticleUseCase.
+        """
+        self.detector_for = detector_for
+        self.compact_segments = compact_segments
+
+    def _use_case(self, article: Article) -> AnalyzeArticleUseCase:
+        return AnalyzeArticleUseCase(self.detector_for(article.language), compact_segments=self.compact_segments)
+
+    def execute(self, article: Article) -> AnalysisResult:
+        return self._use_case(article).execute(article)
+
+    def execute_stream(self, article: Article, chunk_size: int = 32) -> Iterator[AnalysisProgress]:
+        return self._use_case(article).execute_stream(article, chunk_size)
+
+    def aexecute_stream(self, article: Article, chunk_size: int = 32) -> AsyncIterator[AnalysisProgress]:
+        return self._use_case(article).aexecute_stream(article, chunk_size)
@@ -0,0 +1,49 @@
+# benchmarks/article_store.py
+"""
+Benchmark do ArticleStore contra um servidor MediaWiki local com latência simulada.
+
+Mede, para o mesmo conjunto de títulos: busca a frio (API), busca com o store
+válido (TTL), revalidação após o TTL (só revision_id) e modo offline.
+
+Uso:
+    python -m nuvia.benchmarks.article_store --articles 200 --latency 0.05
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from nuvia.adapters.wikipedia.article_store import ArticleStore
+from nuvia.adapters.wikipedia.wikipedia_scraper import WikipediaScraper
+from nuvia.benchmarks.corpus import sample_sentences
+from nuvia.benchmarks.mock_mediawiki import MockMediaWiki
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the local article store.")
+    parser.add_argument("--articles", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    body = " ".join(sample_sentences(400))
+    pages = {f"Article {i}": f"{body}\n\n== Section ==\n{body}" for i in range(args.articles)}
+
+    with MockMediaWiki(pages, latency=args.latency) as wiki, tempfile.TemporaryDirectory() as tmp:
+        store = ArticleStore(Path(tmp) / "articles.sqlite")
+        scenarios = [
+            ("cold (API)", WikipediaScraper(store=store, api_url=wiki.api_url)),
+            ("warm (store, TTL valid)", WikipediaScraper(store=store, api_url=wiki.api_url)),
+            ("revalidate (TTL expired)", WikipediaScraper(store=store, api_url=wiki.api_url, ttl=0)),
+            ("offline", WikipediaScraper(store=store, api_url=wiki.api_url, offline=True)),
+        ]
+        for name, scraper in scenarios:
+            before = wiki.request_count
+            start = time.perf_counter()
+            for title in pages:
+                assert scraper.fetch_article(title) is not None
+            elapsed = time.perf_counter() - start
+            print(f"{name:<26} {elapsed:7.2f}s  {wiki.request_count - before:5d} requests")
+
+
+if __name__ == "__main__":
+    main()
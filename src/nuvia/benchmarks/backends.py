@@ -0,0 +1,67 @@
+# benchmarks/backends.py
+"""
+Benchmark dos backends de inferência do modelo de subjetividade.
+
+Cada backend roda em um processo novo, para que o pico de memória (RSS) medido
+seja só dele. Os rótulos de cada backend são comparados com os do PyTorch.
+
+Uso:
+    python -m nuvia.benchmarks.backends --sentences 512 --batch-size 16
+"""
+import argparse
+import multiprocessing
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from nuvia.adapters.nlp.subjectivity_backends import (
+    BACKENDS,
+    check_backend_agreement,
+    load_subjectivity_pipeline,
+    top_labels,
+)
+from nuvia.benchmarks.corpus import sample_sentences
+
+
+def _run_backend(backend, sentences, batch_size):
+    model = load_subjectivity_pipeline(backend)
+    model(sentences[:batch_size], batch_size=batch_size)  # aquecimento
+    start = time.perf_counter()
+    outputs = model(sentences, batch_size=batch_size)
+    elapsed = time.perf_counter() - start
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return top_labels(outputs), elapsed, peak_rss_mb
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark subjectivity model backends.")
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=BACKENDS)
+    parser.add_argument("--sentences", type=int, default=512)
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--tolerance", type=float, default=0.02,
+                        help="Maximum fraction of labels allowed to differ from the PyTorch backend.")
+    args = parser.parse_args()
+
+    sentences = sample_sentences(args.sentences)
+    backends = ["pytorch"] + [b for b in args.backends if b != "pytorch"]
+    context = multiprocessing.get_context("spawn")
+
+    reference_labels = None
+    reference_rate = None
+    print(f"{'backend':<12} {'sent/s':>10} {'speedup':>8} {'peak RSS (MB)':>14} {'agreement':>10}")
+    for backend in backends:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            labels, elapsed, peak_rss_mb = pool.submit(
+                _run_backend, backend, sentences, args.batch_size
+            ).result()
+        rate = len(sentences) / elapsed
+        if reference_labels is None:
+            reference_labels, reference_rate = labels, rate
+        agreement = check_backend_agreement(reference_labels, labels, sentences, args.tolerance)
+        status = "" if agreement.passed else "  FAILED"
+        print(f"{backend:<12} {rate:>10.1f} {rate / reference_rate:>7.2f}x "
+              f"{peak_rss_mb:>14.0f} {agreement.agreement:>9.1%}{status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# benchmarks/bias_index.py
+"""
+Benchmark do índice invertido (BiasIndex) com milhões de segmentos.
+
+Indexa artigos sintéticos (sentenças de exemplo numeradas, com motivos no
+formato do HybridBiasDetector) em lotes, funde os blocos com `optimize()` e
+mede a latência das consultas típicas.
+
+Uso:
+    python -m nuvia.benchmarks.bias_index --segments 2000000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from nuvia.adapters.index.bias_index import BiasIndex
+from nuvia.application.use_cases.analyze_article_use_case import AnalysisResult
+from nuvia.benchmarks.corpus import SAMPLE_SENTENCES
+from nuvia.domain.value_objects.bias_segment import BiasSegment
+
+REASONS = [
+    "Use of 'Weasel Word': 'reportedly'",
+    "Use of 'Weasel Word': 'often'",
+    "Use of 'Peacock Term': 'revolutionary'",
+    "Use of 'Peacock Term': 'best'",
+]
+
+
+def synthetic_results(articles: int, segments_per_article: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    for a in range(articles):
+        segments = []
+        for i in range(segments_per_article):
+            sentence = f"{SAMPLE_SENTENCES[(a + i) % len(SAMPLE_SENTENCES)][:-1]} ({a}.{i})."
+            if rng.random() < 0.5:
+                score = round(float(rng.uniform(0.4, 1.0)), 2)
+                reason = f"Subjective Language (Model Confidence: {score})"
+            else:
+                reason = REASONS[int(rng.integers(len(REASONS)))]
+                score = 0.75 if "Peacock" in reason else 0.70
+            segments.append(BiasSegment(sentence, reason, score, 100 * i, 100 * i + len(sentence)))
+        title = f"Article {a}"
+        yield title, AnalysisResult(segments=segments, overall_score=float(rng.gamma(2.0, 2.0)), article_title=title)
+
+
+def timed(label, query, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = query()
+        times.append(time.perf_counter() - start)
+    print(f"{label:<52} {np.median(times) * 1000:8.1f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the persistent bias index.")
+    parser.add_argument("--segments", type=int, default=1_000_000)
+    parser.add_argument("--segments-per-article", type=int, default=50)
+    parser.add_argument("--batch", type=int, default=2000, help="Articles per add_many call.")
+    parser.add_argument("--path", help="Index file (default: a temporary file).")
+    args = parser.parse_args()
+
+    path = args.path or os.path.join(tempfile.mkdtemp(), "index.sqlite")
+    index = BiasIndex(path)
+    articles = args.segments // args.segments_per_article
+    results = synthetic_results(articles, args.segments_per_article)
+
+    start = time.perf_counter()
+    for _ in range(0, articles, args.batch):
+        index.add_many([next(results) for _ in range(min(args.batch, articles - _))], detector_key="bench")
+    built = time.perf_counter() - start
+    start = time.perf_counter()
+    index.optimize()
+    optimized = time.perf_counter() - start
+    print(f"indexed {args.segments} segments in {built:.1f}s (+{optimized:.1f}s optimize), "
+          f"{os.path.getsize(path) / 2 ** 20:.0f} MB on disk")
+
+    timed("open + load columns (first query)", lambda: len(BiasIndex(path)), repeat=1)
+    timed("articles using 'reportedly' most (top 20)", lambda: index.top_articles(cue="reportedly"))
+    timed("top 100 most subjective segments", lambda: index.top_segments(100))
+    timed("top 100 most subjective segments about 'intelligence'",
+          lambda: index.top_segments(100, about="intelligence"))
+    timed("top 100 'Peacock Term' segments about 'the model'",
+          lambda: index.top_segments(100, about="the model", category="Peacock Term"))
+    timed("articles with overall_score > 5", lambda: index.articles_above(5.0))
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
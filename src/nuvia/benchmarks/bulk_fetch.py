@@ -0,0 +1,66 @@
+# benchmarks/bulk_fetch.py
+"""
+Benchmark da busca em lote (`afetch_articles`) contra a busca um a um
+(`fetch_article`), usando o servidor MediaWiki local com latência simulada.
+
+Uso:
+    python -m nuvia.benchmarks.bulk_fetch --articles 200 --latency 0.2
+"""
+import argparse
+import asyncio
+import time
+
+from nuvia.adapters.wikipedia.wikipedia_scraper import WikipediaScraper
+from nuvia.benchmarks.corpus import sample_sentences
+from nuvia.benchmarks.mock_mediawiki import MockMediaWiki
+
+
+async def consume(scraper: WikipediaScraper, titles, **kwargs):
+    first = None
+    found = 0
+    start = time.perf_counter()
+    async for _, article in scraper.afetch_articles(titles, **kwargs):
+        if first is None:
+            first = time.perf_counter() - start
+        found += article is not None
+    return found, first
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bulk article fetching.")
+    parser.add_argument("--articles", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--rate", type=float, default=10.0, help="Requests per second.")
+    parser.add_argument("--content-limit", type=int,
+                        help="Pages with content per response (forces continuations).")
+    args = parser.parse_args()
+
+    body = " ".join(sample_sentences(100))
+    pages = {f"Article {i}": f"'''Article {i}''' {body}\n\n== Section ==\n[[Link|{body}]]"
+             for i in range(args.articles)}
+    titles = list(pages)
+
+    with MockMediaWiki(pages, latency=args.latency, content_limit=args.content_limit) as wiki:
+        scraper = WikipediaScraper(api_url=wiki.api_url)
+
+        start = time.perf_counter()
+        serial = sum(scraper.fetch_article(title) is not None for title in titles)
+        elapsed = time.perf_counter() - start
+        print(f"{'one by one':<12} {elapsed:7.2f}s  {wiki.request_count:5d} requests  "
+              f"{serial} articles")
+
+        before = wiki.request_count
+        wiki.max_in_flight = 0
+        start = time.perf_counter()
+        found, first = asyncio.run(consume(
+            scraper, titles, max_concurrency=args.concurrency, requests_per_second=args.rate
+        ))
+        elapsed = time.perf_counter() - start
+        print(f"{'bulk':<12} {elapsed:7.2f}s  {wiki.request_count - before:5d} requests  "
+              f"{found} articles  (first result after {first:.2f}s, "
+              f"max {wiki.max_in_flight} in flight)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# benchmarks/cascade.py
+"""
+Calibra e mede a cascata (triagem por léxico + HybridBiasDetector).
+
+1. Calibra o limiar da triagem em um artigo separado para o recall desejado,
+   em relação à saída do detector completo.
+2. Analisa outro artigo com o detector completo e com a cascata e mostra a
+   fração de sentenças descartadas, o recall obtido e o ganho de ponta a ponta.
+
+Com `--models stub` (padrão) o modelo é um stub que concorda com os léxicos e
+custa `--latency-ms` por sentença; `--models real` usa o BERT e os corpora do NLTK.
+
+Uso:
+    python -m nuvia.benchmarks.cascade --target-recall 0.95
+    python -m nuvia.benchmarks.cascade --models real --save-calibration cascade.json
+"""
+import argparse
+import json
+import time
+
+from nuvia.adapters.nlp.cascade_bias_detector import CascadeBiasDetector
+from nuvia.adapters.nlp.hybrid_bias_detector import HybridBiasDetector
+from nuvia.adapters.nlp.tokenizers import RegexTokenizer
+from nuvia.benchmarks.fixtures import StubSubjectivityPipeline, stub_lexicons, synthetic_article
+
+
+def build_cascade(models: str, latency_ms: float) -> CascadeBiasDetector:
+    if models == "real":
+        return CascadeBiasDetector(HybridBiasDetector(lazy=False))
+    lexicons = stub_lexicons()
+    model = StubSubjectivityPipeline(
+        cue_words=lexicons.positive_words | lexicons.negative_words | {"undoubtedly", "widely"},
+        latency_ms=latency_ms,
+    )
+    detector = HybridBiasDetector(tokenizer=RegexTokenizer(), subjectivity_model=model)
+    return CascadeBiasDetector(detector, lexicons=lexicons)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibrate and benchmark the detection cascade.")
+    parser.add_argument("--models", choices=("stub", "real"), default="stub")
+    parser.add_argument("--target-recall", type=float, default=0.95)
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="Simulated model cost per sentence (stub).")
+    parser.add_argument("--held-out", default="medium", help="Synthetic article size used for calibration.")
+    parser.add_argument("--evaluate", default="huge", help="Synthetic article size used for the measurement.")
+    parser.add_argument("--save-calibration", help="Write the calibration to this JSON file.")
+    args = parser.parse_args()
+
+    cascade = build_cascade(args.models, args.latency_ms)
+    calibration = cascade.calibrate([synthetic_article(args.held_out)], target_recall=args.target_recall)
+    print("calibration:", json.dumps(calibration.to_dict(), indent=2))
+    if args.save_calibration:
+        calibration.save(args.save_calibration)
+
+    document = cascade.as_document(synthetic_article(args.evaluate))
+    len(document)  # Segmenta antes de medir
+
+    start = time.perf_counter()
+    full = cascade.detector.detect(document)
+    full_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    screened = cascade.detect(document)
+    cascade_seconds = time.perf_counter() - start
+
+    found = {(seg.start, seg.reason) for seg in screened}
+    recall = sum((seg.start, seg.reason) in found for seg in full) / len(full) if full else 1.0
+    print(f"{len(document)} sentences: skipped {cascade.stats.skipped_fraction:.1%}, "
+          f"recall {recall:.3f} ({len(screened)}/{len(full)} segments)")
+    print(f"full detector {full_seconds * 1000:9.1f} ms")
+    print(f"cascade       {cascade_seconds * 1000:9.1f} ms  ({full_seconds / cascade_seconds:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# benchmarks/cold_start.py
+"""
+Mede o tempo de partida a frio: cada etapa roda em um interpretador Python novo.
+
+- import da aplicação Streamlit (o que acontece a cada `nuvia`/container novo);
+- criação do HybridBiasDetector;
+- primeira análise (inclui o carregamento preguiçoso do modelo).
+
+Uso:
+    python -m nuvia.benchmarks.cold_start --repeat 3
+    NUVIA_OFFLINE=1 python -m nuvia.benchmarks.cold_start
+"""
+import argparse
+import subprocess
+import sys
+import time
+
+STAGES = {
+    "import streamlit_app": "import nuvia.interface.streamlit_app",
+    "construct detector": (
+        "from nuvia.adapters.nlp.hybrid_bias_detector import HybridBiasDetector; HybridBiasDetector()"
+    ),
+    "first analysis": (
+        "from nuvia.adapters.nlp.hybrid_bias_detector import HybridBiasDetector; "
+        "HybridBiasDetector().detect('This is a remarkable and truly important result.')"
+    ),
+}
+
+
+def time_snippet(code: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], check=True, capture_output=True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold start time of nuvia.")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    baseline = min(time_snippet("pass") for _ in range(args.repeat))
+    print(f"{'python startup':<22} {baseline:6.2f}s")
+    for name, code in STAGES.items():
+        best = min(time_snippet(code) for _ in range(args.repeat))
+        print(f"{name:<22} {best:6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+# benchmarks/corpus.py
+"""Sentenças fixas usadas pelos benchmarks (rodam offline, sem Wikipedia)."""
+from typing import List
+
+SAMPLE_SENTENCES = [
+    "Artificial intelligence is the capability of computational systems to perform tasks associated with human intelligence.",
+    "The field was founded as an academic discipline in 1956.",
+    "It is widely considered the most revolutionary technology ever created.",
+    "Some critics argue that the results are often exaggerated by the press.",
+    "The model was trained on 45 terabytes of text collected from the web.",
+    "This breathtaking achievement will undoubtedly change the world forever.",
+    "Researchers reportedly found that the system could be easily fooled.",
+    "The conference is held annually in December.",
+    "Many experts believe that general intelligence may arrive within decades.",
+    "The algorithm runs in polynomial time with respect to the input size.",
+    "His seminal paper remains a masterpiece of the field.",
+    "The dataset contains 1.2 million labelled images across 1,000 classes.",
+    "Unfortunately, the terrible design made the product a complete disaster.",
+    "The company was acquired in 2014 for an undisclosed amount.",
+    "It is said that the approach is the best way to solve the problem.",
+    "The network has twelve layers and 110 million parameters.",
+]
+
+
+def sample_sentences(count: int) -> List[str]:
+    """Repete as sentenças de exemplo até atingir `count` itens."""
+    repeats = count // len(SAMPLE_SENTENCES) + 1
+    return (SAMPLE_SENTENCES * repeats)[:count]
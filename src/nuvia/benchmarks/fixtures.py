@@ -0,0 +1,140 @@
+# benchmarks/fixtures.py
+"""
+Corpora fixos e modelos substitutos (stubs) da suíte de benchmarks.
+
+- Artigos sintéticos determinísticos em três tamanhos (small/medium/huge),
+  montados a partir de `corpus.SAMPLE_SENTENCES`, em parágrafos e com seções.
+- Um artigo de fixture escrito à mão, com o tipo de linguagem que os
+  detectores procuram.
+- Stubs determinísticos do pipeline de subjetividade, do encoder de sentenças e
+  dos léxicos do NLTK: medem o custo de todo o código ao redor dos modelos
+  sem baixar nada (a suíte roda offline).
+"""
+import hashlib
+import re
+import time
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from nuvia.benchmarks.corpus import SAMPLE_SENTENCES
+from nuvia.domain.repositories.biased_words_repository import BiasedWordsRepository
+
+# Tamanho dos artigos sintéticos, em sentenças
+ARTICLE_SIZES = {"small": 20, "medium": 200, "huge": 2000}
+
+FIXTURE_ARTICLE = """Artificial intelligence (AI) is the capability of computational systems to perform tasks typically associated with human intelligence, such as learning, reasoning and perception.
+
+History
+The field was founded as an academic discipline in 1956. It is widely considered the most revolutionary technology ever created, and its pioneers are often described as visionary. Funding arrived in waves, and periods of disappointment were later called "AI winters".
+
+Techniques
+Modern systems are trained on large datasets. Some critics argue that the results are often exaggerated by the press, while supporters claim that the breathtaking progress of deep learning will undoubtedly change the world forever. The network in a typical language model has billions of parameters.
+
+Reception
+Many experts believe that general intelligence may arrive within decades. It is said that the approach is the best way to solve the problem, although the evidence is arguably thin. The terrible design of some early products made them a complete disaster."""
+
+
+def synthetic_article(size: str) -> str:
+    """
+    Artigo determinístico com `ARTICLE_SIZES[size]` sentenças, em parágrafos de
+    6 sentenças e uma seção a cada 5 parágrafos. As sentenças são numeradas
+    para serem únicas, como em um artigo real.
+    """
+    paragraphs = []
+    count = ARTICLE_SIZES[size]
+    for p, start in enumerate(range(0, count, 6)):
+        if p % 5 == 0:
+            paragraphs.append(f"Section {p // 5 + 1}")
+        sentences = [
+            f"{SAMPLE_SENTENCES[i % len(SAMPLE_SENTENCES)][:-1]} ({i})."
+            for i in range(start, min(start + 6, count))
+        ]
+        paragraphs.append(" ".join(sentences))
+    return "\n\n".join(paragraphs)
+
+
+def _unit_hash(text: str, salt: str = "") -> float:
+    digest = hashlib.blake2b((salt + text).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2 ** 64
+
+
+class StubSubjectivityPipeline:
+    """
+    Substituto do pipeline `text-classification` do Hugging Face: mesmo formato
+    de saída (com `return_all_scores=True`), score derivado do hash da sentença.
+
+    Com `cue_words`, sentenças que contêm alguma delas saem sempre subjetivas e
+    as demais neutras (como um modelo que concorda com os léxicos, para medir a
+    cascata); `latency_ms` simula o custo do forward pass por sentença.
+    """
+    def __init__(self, cue_words: Iterable[str] = (), latency_ms: float = 0.0):
+        self.cue_words = {word.lower() for word in cue_words}
+        self.latency_ms = latency_ms
+
+    def __call__(self, inputs, batch_size: int = 1, **kwargs):
+        single = isinstance(inputs, str)
+        outputs = []
+        for text in [inputs] if single else inputs:
+            subjective = _unit_hash(text)
+            if self.cue_words:
+                cued = any(word in self.cue_words for word in re.findall(r"[a-z]+", text.lower()))
+                subjective = 0.5 + subjective / 2 if cued else subjective / 2
+            if self.latency_ms:
+                time.sleep(self.latency_ms / 1000)
+            labels = [{"label": "SUBJECTIVE", "score": subjective}, {"label": "OBJECTIVE", "score": 1 - subjective}]
+            outputs.append(sorted(labels, key=lambda d: d["score"], reverse=True))
+        return outputs
+
+
+class StubSentenceEncoder:
+    """Substituto do SentenceTransformer: vetores pseudoaleatórios fixos por sentença."""
+    def __init__(self, dimension: int = 384):
+        self.dimension = dimension
+
+    def encode(self, sentences: List[str], convert_to_numpy: bool = True, normalize_embeddings: bool = True,
+               **kwargs) -> np.ndarray:
+        vectors = np.stack([
+            np.random.default_rng(int(_unit_hash(s) * 2 ** 32)).standard_normal(self.dimension)
+            for s in sentences
+        ]).astype(np.float32)
+        if normalize_embeddings:
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors
+
+
+class _IdentityLemmatizer:
+    def lemmatize(self, word: str) -> str:
+        return word
+
+
+def stub_lexicons():
+    """Léxicos pequenos no formato de `nltk_bias_detector.OpinionLexicons`."""
+    from nuvia.adapters.nlp.nltk_bias_detector import OpinionLexicons
+
+    return OpinionLexicons(
+        stop_words={"the", "a", "an", "is", "was", "of", "in", "to", "and", "that", "it", "by", "with", "for"},
+        positive_words={"revolutionary", "breathtaking", "seminal", "masterpiece", "best", "remarkable", "visionary"},
+        negative_words={"terrible", "disaster", "exaggerated", "fooled", "unfortunately", "critics"},
+        lemmatizer=_IdentityLemmatizer(),
+    )
+
+
+class FixtureWordsRepository(BiasedWordsRepository):
+    """Repositório em memória com as categorias de palavras usadas pelo BiasAnalysisService."""
+    def __init__(self, categories: Optional[Dict[str, Dict]] = None):
+        self.categories = categories or {
+            "Peacock Term": {
+                "words": ["revolutionary", "breathtaking", "seminal", "masterpiece", "visionary",
+                          "best", "world-class", "critically acclaimed"],
+                "explanation": "Promotional wording that praises the subject without attribution.",
+            },
+            "Weasel Word": {
+                "words": ["reportedly", "arguably", "it is said", "many experts believe", "some critics argue",
+                          "often", "may"],
+                "explanation": "Vague attribution that makes a claim sound supported.",
+            },
+        }
+
+    def get_categories(self) -> Dict[str, Dict]:
+        return self.categories
@@ -0,0 +1,81 @@
+# benchmarks/highlight.py
+"""
+Benchmark da montagem do texto destacado: implementação antiga (find + replace por
+segmento) contra a montagem em uma passada de `interface.highlighting`.
+
+Uso:
+    python -m nuvia.benchmarks.highlight --chars 100000 --segments 1000
+"""
+import argparse
+import html
+import time
+
+from nuvia.benchmarks.corpus import SAMPLE_SENTENCES
+from nuvia.domain.value_objects.bias_segment import BiasSegment
+from nuvia.interface.highlighting import render_highlighted
+
+
+def build_article(chars: int, segments: int):
+    """Gera um artigo sintético e `segments` segmentos com offsets, espalhados pelo texto."""
+    sentences, spans = [], []
+    position = 0
+    i = 0
+    while position < chars:
+        # Numera as sentenças para que sejam únicas, como em um artigo real
+        sentence = f"{SAMPLE_SENTENCES[i % len(SAMPLE_SENTENCES)][:-1]} (note {i})."
+        sentences.append(sentence)
+        spans.append((position, position + len(sentence)))
+        position += len(sentence) + 1
+        i += 1
+    text = " ".join(sentences)
+    step = max(1, len(spans) // segments)
+    found = [
+        BiasSegment(text=text[start:end], reason="Benchmark", score=0.5, start=start, end=end)
+        for start, end in spans[::step][:segments]
+    ]
+    return text, found
+
+
+def legacy_render(full_text, segments):
+    """Cópia da implementação anterior (O(segmentos x tamanho do texto))."""
+    sorted_segments = sorted(segments, key=lambda s: full_text.find(s.text))
+    display_text = full_text
+    for seg in reversed(sorted_segments):
+        if seg.text in display_text:
+            replacement = f'<span class="tooltip">{seg.text}<span class="tooltiptext">{seg.reason}</span></span>'
+            display_text = display_text.replace(seg.text, replacement, 1)
+    return display_text
+
+
+def single_pass_render(full_text, segments):
+    return render_highlighted(
+        full_text, segments,
+        lambda text_html, seg: f'<span class="tooltip">{text_html}<span class="tooltiptext">{html.escape(seg.reason)}</span></span>'
+    )
+
+
+def timed(func, *args, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark highlighted text rendering.")
+    parser.add_argument("--chars", type=int, default=100_000)
+    parser.add_argument("--segments", type=int, default=1_000)
+    args = parser.parse_args()
+
+    text, segments = build_article(args.chars, args.segments)
+    legacy = timed(legacy_render, text, segments)
+    single_pass = timed(single_pass_render, text, segments)
+    print(f"article: {len(text)} chars, {len(segments)} segments")
+    print(f"legacy find/replace: {legacy * 1000:9.1f} ms")
+    print(f"single pass:         {single_pass * 1000:9.1f} ms  ({legacy / single_pass:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
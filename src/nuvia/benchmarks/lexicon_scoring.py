@@ -0,0 +1,101 @@
+# benchmarks/lexicon_scoring.py
+"""
+Benchmark do score por léxico do NltkBiasDetector em corpora grandes.
+
+- token a token (legado): lematiza e consulta os léxicos a cada token, sentença por sentença;
+- LexiconScorer: cache de lemas/tokens + contagem em lote com `np.bincount`.
+
+O corpus mistura as sentenças de exemplo com palavras sintéticas em
+distribuição de Zipf (vocabulário grande, como em artigos reais). Os scores das
+duas implementações são comparados e precisam ser idênticos.
+
+Uso:
+    python -m nuvia.benchmarks.lexicon_scoring --tokens 1000000
+    python -m nuvia.benchmarks.lexicon_scoring --lexicons nltk   # corpora do NLTK + WordNet
+"""
+import argparse
+import string
+import time
+from typing import List
+
+import numpy as np
+
+from nuvia.adapters.nlp.lexicon_scorer import LexiconScorer
+from nuvia.adapters.nlp.tokenizers import RegexTokenizer
+from nuvia.benchmarks.corpus import sample_sentences
+from nuvia.benchmarks.fixtures import stub_lexicons
+
+
+def legacy_score(tokens, lexicons) -> float:
+    """O cálculo original de NltkBiasDetector.detect_subjectivity."""
+    stop_words, positive_words, negative_words, lemmatizer = lexicons
+    tokens_clean = [
+        lemmatizer.lemmatize(word.lower())
+        for word in tokens
+        if word.lower() not in stop_words and word.isalpha()
+    ]
+    pos_count = sum(1 for w in tokens_clean if w in positive_words)
+    neg_count = sum(1 for w in tokens_clean if w in negative_words)
+    return (pos_count + neg_count) / (len(tokens_clean) + 1)
+
+
+def _pseudo_word(n: int) -> str:
+    letters = []
+    n += 1
+    while n:
+        n, r = divmod(n - 1, 26)
+        letters.append(string.ascii_lowercase[r])
+    return "".join(letters)
+
+
+def build_corpus(total_tokens: int, vocabulary: int = 50_000, seed: int = 0) -> List[List[str]]:
+    """Sentenças tokenizadas somando ~`total_tokens` tokens."""
+    rng = np.random.default_rng(seed)
+    tokenizer = RegexTokenizer()
+    base = [tokenizer.word_tokenize(s) for s in sample_sentences(64)]
+    sentences, count, i = [], 0, 0
+    while count < total_tokens:
+        extra = rng.zipf(1.3, size=8) % vocabulary
+        tokens = base[i % len(base)] + [_pseudo_word(int(n)) for n in extra]
+        sentences.append(tokens)
+        count += len(tokens)
+        i += 1
+    return sentences
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark lexicon subjectivity scoring.")
+    parser.add_argument("--tokens", type=int, default=1_000_000)
+    parser.add_argument("--sentences-per-document", type=int, default=500)
+    parser.add_argument("--lexicons", choices=("stub", "nltk"), default="stub")
+    args = parser.parse_args()
+
+    if args.lexicons == "nltk":
+        from nuvia.adapters.nlp.nltk_bias_detector import load_lexicons
+        lexicons = load_lexicons()
+    else:
+        lexicons = stub_lexicons()
+    corpus = build_corpus(args.tokens)
+    tokens = sum(map(len, corpus))
+    print(f"{len(corpus)} sentences, {tokens} tokens, lexicons: {args.lexicons}")
+
+    start = time.perf_counter()
+    reference = [legacy_score(sentence, lexicons) for sentence in corpus]
+    legacy = time.perf_counter() - start
+    print(f"{'token by token':<22} {legacy * 1000:9.1f} ms  {tokens / legacy / 1e6:6.2f} M tokens/s")
+
+    scorer = LexiconScorer(*lexicons)
+    step = args.sentences_per_document
+    for label in ("LexiconScorer (cold)", "LexiconScorer (warm)"):
+        start = time.perf_counter()
+        scores = np.concatenate([scorer.score_sentences(corpus[i:i + step]) for i in range(0, len(corpus), step)])
+        elapsed = time.perf_counter() - start
+        print(f"{label:<22} {elapsed * 1000:9.1f} ms  {tokens / elapsed / 1e6:6.2f} M tokens/s"
+              f"  ({legacy / elapsed:.1f}x faster)")
+        if scores.tolist() != reference:
+            raise SystemExit("LexiconScorer scores differ from the token-by-token reference")
+    print(f"vocabulary cached: {scorer.vocabulary_size} tokens; scores identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+# benchmarks/mock_mediawiki.py
+"""
+Servidor HTTP local que imita o subconjunto da API do MediaWiki usado pelo
+WikipediaScraper. Conta as requisições recebidas (e o pico de requisições
+simultâneas) e pode simular latência, permitindo medir e testar o scraper sem
+acessar a Wikipedia.
+
+Uso:
+    with MockMediaWiki({"Python": "Python is a language.\\n\\n== History ==\\nCreated in 1991."}) as wiki:
+        scraper = WikipediaScraper(api_url=wiki.api_url)
+        scraper.fetch_article("Python")
+        print(wiki.request_count)
+"""
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Union
+from urllib.parse import parse_qs, urlparse
+
+
+class MockMediaWiki:
+    def __init__(self, pages: Dict[str, Union[str, dict]], latency: float = 0.0,
+                 redirects: Optional[Dict[str, str]] = None, content_limit: Optional[int] = None):
+        """
+        Args:
+            pages: título -> texto (formato wiki dos extracts) ou dict com "text", "revid"
+                   e, opcionalmente, "wikitext" (padrão: o próprio texto).
+            latency: Atraso artificial de cada resposta, em segundos.
+            redirects: título de redirecionamento -> título do artigo.
+            content_limit: Máximo de páginas com conteúdo de revisão por resposta;
+                           o resto fica para a continuação (`rvcontinue`), como na API real.
+        """
+        self.pages = {}
+        for i, (title, page) in enumerate(pages.items(), start=1):
+            page = {"text": page} if isinstance(page, str) else dict(page)
+            page.setdefault("revid", 1000 + i)
+            page.setdefault("pageid", i)
+            self.pages[title] = page
+        self.latency = latency
+        self.redirects = dict(redirects or {})
+        self.content_limit = content_limit
+        self.requests = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = None
+
+    @property
+    def request_count(self) -> int:
+        return sum(self.requests.values())
+
+    @property
+    def api_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/w/api.php"
+
+    def edit(self, title: str, text: str):
+        """Simula uma nova revisão do artigo."""
+        page = self.pages[title]
+        page["text"] = text
+        page["revid"] += 1
+
+    def __enter__(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                params = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+                with mock._lock:
+                    mock.in_flight += 1
+                    mock.max_in_flight = max(mock.max_in_flight, mock.in_flight)
+                try:
+                    if mock.latency:
+                        time.sleep(mock.latency)
+                    body = json.dumps(mock.handle(params)).encode("utf-8")
+                finally:
+                    with mock._lock:
+                        mock.in_flight -= 1
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def handle(self, params: Dict[str, str]) -> dict:
+        if params.get("list") == "search":
+            with self._lock:
+                self.requests["search"] += 1
+            keyword = params.get("srsearch", "").lower()
+            limit = int(params.get("srlimit", 10))
+            hits = [{"title": t} for t in self.pages if keyword in t.lower()][:limit]
+            return {"query": {"search": hits}}
+
+        prop = params.get("prop", "")
+        props = set(prop.split("|"))
+        with self._lock:
+            self.requests[prop] += 1
+
+        titles = params.get("titles", "").split("|")
+        query = {}
+        if params.get("redirects"):
+            followed = [{"from": t, "to": self.redirects[t]} for t in titles if t in self.redirects]
+            if followed:
+                query["redirects"] = followed
+            titles = list(dict.fromkeys(self.redirects.get(t, t) for t in titles))
+        pages = [self._page(title, props) for title in titles]
+        query["pages"] = pages
+
+        result = {"query": query}
+        if "revisions" in props:
+            # Só as páginas a partir de `rvcontinue` recebem conteúdo nesta resposta
+            offset = int(params.get("rvcontinue", 0))
+            existing = [p for p in pages if not p.get("missing")]
+            limit = self.content_limit or len(existing)
+            for i, page in enumerate(existing):
+                if not offset <= i < offset + limit:
+                    del page["revisions"]
+            if offset + limit < len(existing):
+                result["continue"] = {"rvcontinue": str(offset + limit), "continue": "||"}
+        return result
+
+    def _page(self, title: str, props: set) -> dict:
+        page = self.pages.get(title)
+        if page is None:
+            return {"title": title, "missing": True}
+        result = {
+            "pageid": page["pageid"],
+            "ns": 0,
+            "title": title,
+            "lastrevid": page["revid"],
+            "fullurl": f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}",
+        }
+        if "extracts" in props:
+            result["extract"] = page["text"]
+        if "revisions" in props:
+            result["revisions"] = [{
+                "revid": page["revid"],
+                "slots": {"main": {"contentmodel": "wikitext", "content": page.get("wikitext", page["text"])}},
+            }]
+        return result
@@ -0,0 +1,298 @@
+# benchmarks/suite.py
+"""
+Suíte de benchmarks e verificação de regressões (`nuvia-bench`).
+
+Para cada caso (detectores, análise por léxico e renderização do relatório)
+mede, em um processo novo:
+- partida a frio: imports + construção + primeira análise de um artigo pequeno;
+- latência p50/p95 e sentenças/s por tamanho de artigo (small/medium/huge);
+- pico de memória (RSS) do processo.
+
+Com `--models stub` (padrão) os modelos são substituídos por stubs
+determinísticos e tudo roda offline; `--models real` usa os modelos de verdade
+(do cache local, ver `nuvia-warmup`).
+
+Uso:
+    nuvia-bench --save-baseline benchmarks/baseline.json
+    nuvia-bench --compare benchmarks/baseline.json --tolerance 0.2   # sai com código 1 se houver regressão
+    nuvia-bench --cases hybrid nltk --sizes small medium --repeat 10 -o results.json
+"""
+import argparse
+import json
+import multiprocessing
+import platform
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+from nuvia.benchmarks.fixtures import (
+    ARTICLE_SIZES,
+    FIXTURE_ARTICLE,
+    FixtureWordsRepository,
+    StubSentenceEncoder,
+    StubSubjectivityPipeline,
+    stub_lexicons,
+    synthetic_article,
+)
+
+# Métricas comparadas com o baseline: nome -> True se "maior é pior"
+CASE_METRICS = {"cold_start_s": True, "peak_rss_mb": True}
+SIZE_METRICS = {"p50_ms": True, "p95_ms": True, "sentences_per_s": False}
+# Diferenças absolutas abaixo disso são ruído de medição, mesmo que grandes em proporção
+NOISE_FLOOR = {"p50_ms": 0.5, "p95_ms": 0.5, "cold_start_s": 0.05, "peak_rss_mb": 5.0}
+
+Runner = Callable[[str], Any]
+
+
+def _regex_tokenizer():
+    from nuvia.adapters.nlp.tokenizers import RegexTokenizer
+    return RegexTokenizer()
+
+
+def _detector_runner(detector) -> Tuple[Runner, Callable[[str], int]]:
+    from nuvia.application.use_cases.analyze_article_use_case import AnalyzeArticleUseCase
+    from nuvia.domain.entities.article import Article
+
+    use_case = AnalyzeArticleUseCase(detector)
+    return (lambda text: use_case.execute(Article("Benchmark", text)),
+            lambda text: len(detector.as_document(text)))
+
+
+def build_hybrid(models: str):
+    from nuvia.adapters.nlp.hybrid_bias_detector import HybridBiasDetector
+    if models == "stub":
+        return _detector_runner(HybridBiasDetector(tokenizer=_regex_tokenizer(),
+                                                   subjectivity_model=StubSubjectivityPipeline()))
+    return _detector_runner(HybridBiasDetector())
+
+
+def build_embedding(models: str):
+    from nuvia.adapters.nlp.embedding_bias_detector import EmbeddingBiasDetector
+    if models == "stub":
+        return _detector_runner(EmbeddingBiasDetector(tokenizer=_regex_tokenizer(), model=StubSentenceEncoder()))
+    return _detector_runner(EmbeddingBiasDetector())
+
+
+def build_nltk(models: str):
+    from nuvia.adapters.nlp.nltk_bias_detector import NltkBiasDetector
+    if models == "stub":
+        return _detector_runner(NltkBiasDetector(tokenizer=_regex_tokenizer(), lexicons=stub_lexicons()))
+    return _detector_runner(NltkBiasDetector())
+
+
+def _count_sentences(text: str) -> int:
+    return len(_regex_tokenizer().span_tokenize(text))
+
+
+def build_lexicon(models: str):
+    from nuvia.domain.services.bias_analysis_service import BiasAnalysisService
+
+    service = BiasAnalysisService(FixtureWordsRepository())
+    return service.analyze_text, _count_sentences
+
+
+def _report_inputs(text: str):
+    """Resultado fixo para os casos de renderização: um segmento a cada 3 sentenças."""
+    from nuvia.application.use_cases.analyze_article_use_case import AnalysisResult
+    from nuvia.domain.value_objects.bias_segment import BiasSegment
+
+    spans = _regex_tokenizer().span_tokenize(text)
+    segments = [
+        BiasSegment(text=text[start:end], reason="Benchmark", score=0.5 + (i % 5) / 10, start=start, end=end)
+        for i, (start, end) in enumerate(spans[::3])
+    ]
+    return AnalysisResult(segments=segments, overall_score=1.0, article_title="Benchmark")
+
+
+def build_render_html(models: str):
+    import html
+    from nuvia.interface.highlighting import render_highlighted, score_color
+
+    def render(text: str):
+        result = _report_inputs(text)
+        return render_highlighted(
+            text, result.segments,
+            lambda text_html, seg: (f'<span style="background-color: {score_color(seg.score, 0.4)}">'
+                                    f'{text_html}<span class="tooltiptext">{html.escape(seg.reason)}</span></span>'),
+        )
+    return render, _count_sentences
+
+
+def build_render_report(models: str):
+    """Só o HTML do relatório (template Jinja2 em streaming), sem o WeasyPrint."""
+    import io
+    from nuvia.interface.report import write_report_html
+
+    def render(text: str):
+        out = io.StringIO()
+        write_report_html(_report_inputs(text), text, out)
+        return out
+    return render, _count_sentences
+
+
+def build_render_pdf(models: str):
+    from nuvia.interface.report import create_pdf_report
+    import weasyprint  # noqa: F401  (falha aqui, e não na primeira medição, se não estiver instalado)
+
+    return (lambda text: create_pdf_report(_report_inputs(text), text)), _count_sentences
+
+
+CASES: Dict[str, Callable[[str], Tuple[Runner, Callable[[str], int]]]] = {
+    "hybrid": build_hybrid,
+    "embedding": build_embedding,
+    "nltk": build_nltk,
+    "lexicon": build_lexicon,
+    "render-html": build_render_html,
+    "render-report": build_render_report,
+    "render-pdf": build_render_pdf,
+}
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa em KiB; macOS, em bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_case(name: str, models: str, sizes: List[str], repeat: int) -> Dict[str, Any]:
+    """Roda um caso inteiro (deve ser chamado em um processo novo)."""
+    start = time.perf_counter()
+    try:
+        run, count_sentences = CASES[name](models)
+    except (ImportError, OSError) as e:
+        # OSError: o WeasyPrint levanta isso quando faltam as bibliotecas do sistema (Pango)
+        return {"status": "skipped", "reason": f"missing dependency: {e}"}
+    run(FIXTURE_ARTICLE)
+    result: Dict[str, Any] = {"status": "ok", "cold_start_s": time.perf_counter() - start, "sizes": {}}
+
+    for size in sizes:
+        text = synthetic_article(size)
+        sentences = count_sentences(text)
+        run(text)  # aquecimento (caches, lazy loading)
+        latencies = []
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            run(text)
+            latencies.append(time.perf_counter() - t0)
+        result["sizes"][size] = {
+            "sentences": sentences,
+            "p50_ms": float(np.percentile(latencies, 50)) * 1000,
+            "p95_ms": float(np.percentile(latencies, 95)) * 1000,
+            "sentences_per_s": sentences * len(latencies) / sum(latencies),
+        }
+    result["peak_rss_mb"] = _peak_rss_mb()
+    return result
+
+
+def run_suite(cases: List[str], models: str = "stub", sizes: List[str] = None, repeat: int = 5) -> Dict[str, Any]:
+    sizes = sizes or list(ARTICLE_SIZES)
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for name in cases:
+        # Um processo por caso: partida a frio e pico de memória medidos isoladamente
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            try:
+                results[name] = pool.submit(run_case, name, models, sizes, repeat).result()
+            except Exception as e:
+                results[name] = {"status": "error", "reason": repr(e)}
+        print_case(name, results[name])
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "models": models,
+            "repeat": repeat,
+            "python": platform.python_version(),
+            "machine": f"{platform.system()} {platform.machine()}",
+        },
+        "cases": results,
+    }
+
+
+def print_case(name: str, result: Dict[str, Any]):
+    if result["status"] != "ok":
+        print(f"{name:<12} {result['status']}: {result['reason']}")
+        return
+    print(f"{name:<12} cold start {result['cold_start_s']:6.2f}s   peak RSS {result['peak_rss_mb']:7.0f} MB")
+    for size, metrics in result["sizes"].items():
+        print(f"  {size:<8} {metrics['sentences']:>6} sentences  p50 {metrics['p50_ms']:9.2f} ms  "
+              f"p95 {metrics['p95_ms']:9.2f} ms  {metrics['sentences_per_s']:10.0f} sent/s")
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    Compara dois resultados e devolve as regressões: métricas que pioraram mais
+    que `tolerance` (fração) e mais que o piso de ruído da métrica.
+    """
+    if baseline["meta"].get("models") != current["meta"].get("models"):
+        print(f"Warning: comparing '{current['meta'].get('models')}' models against a "
+              f"'{baseline['meta'].get('models')}' baseline")
+
+    def check(label: str, metric: str, old: float, new: float, higher_is_worse: bool, noise: bool = False):
+        change = (new - old) / old if old else 0.0
+        worse = change > tolerance if higher_is_worse else change < -tolerance
+        if worse and (noise or abs(new - old) < NOISE_FLOOR.get(metric, 0.0)):
+            worse = False
+        flag = "REGRESSION" if worse else ""
+        print(f"  {label:<28} {metric:<16} {old:12.2f} -> {new:12.2f}  {change:+7.1%}  {flag}")
+        if worse:
+            regressions.append(f"{label} {metric}: {old:.2f} -> {new:.2f} ({change:+.1%})")
+
+    regressions: List[str] = []
+    for name, old_case in baseline["cases"].items():
+        new_case = current["cases"].get(name)
+        if old_case.get("status") != "ok" or not new_case or new_case.get("status") != "ok":
+            continue
+        for metric, higher_is_worse in CASE_METRICS.items():
+            check(name, metric, old_case[metric], new_case[metric], higher_is_worse)
+        for size, old_metrics in old_case["sizes"].items():
+            new_metrics = new_case["sizes"].get(size)
+            if new_metrics is None:
+                continue
+            # Vazão de artigos muito rápidos: o piso de ruído é o da latência
+            noise = abs(new_metrics["p50_ms"] - old_metrics["p50_ms"]) < NOISE_FLOOR["p50_ms"]
+            for metric, higher_is_worse in SIZE_METRICS.items():
+                check(f"{name}/{size}", metric, old_metrics[metric], new_metrics[metric], higher_is_worse,
+                      noise=noise and metric == "sentences_per_s")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the nuvia benchmark suite and check for regressions.")
+    parser.add_argument("--cases", nargs="+", default=list(CASES), choices=list(CASES))
+    parser.add_argument("--models", default="stub", choices=["stub", "real"],
+                        help="stub: deterministic offline stand-ins for the models; real: the actual models.")
+    parser.add_argument("--sizes", nargs="+", default=list(ARTICLE_SIZES), choices=list(ARTICLE_SIZES))
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per article size.")
+    parser.add_argument("-o", "--output", help="Write the results to this JSON file.")
+    parser.add_argument("--save-baseline", metavar="PATH", help="Store the results as the new baseline.")
+    parser.add_argument("--compare", metavar="PATH", help="Baseline JSON to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed relative slowdown before a metric is flagged (default: 0.2 = 20%%).")
+    args = parser.parse_args()
+
+    results = run_suite(args.cases, args.models, args.sizes, args.repeat)
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {path}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"\nComparison with {args.compare} (tolerance {args.tolerance:.0%}):")
+        regressions = compare(baseline, results, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s):")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\nNo regressions.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# benchmarks/synthetic_dump.py
+"""
+Gera dumps XML sintéticos no formato `pages-articles.xml.bz2` (com redirecionamentos,
+páginas fora do namespace de artigos e categorias) e mede a leitura em streaming.
+
+Uso:
+    python -m nuvia.benchmarks.synthetic_dump --pages 2000 20000
+    python -m nuvia.benchmarks.synthetic_dump --write dump.xml.bz2 --pages 500
+"""
+import argparse
+import bz2
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from nuvia.adapters.wikipedia.dump_reader import DumpFilter, iter_dump_pages, open_dump
+from nuvia.benchmarks.corpus import sample_sentences
+
+_HEADER = """<mediawiki xmlns="http://www.mediawiki.org/xml/export-0.11/" version="0.11" xml:lang="en">
+  <siteinfo>
+    <sitename>Wikipedia</sitename>
+    <namespaces><namespace key="0" case="first-letter" /><namespace key="14" case="first-letter">Category</namespace></namespaces>
+  </siteinfo>
+"""
+
+
+def _page(page_id: int, title: str, wikitext: str, ns: int = 0, redirect: str = None) -> str:
+    redirect_tag = f'    <redirect title="{escape(redirect)}" />\n' if redirect else ""
+    return (
+        f"  <page>\n    <title>{escape(title)}</title>\n    <ns>{ns}</ns>\n    <id>{page_id}</id>\n"
+        f"{redirect_tag}"
+        f"    <revision>\n      <id>{page_id * 10}</id>\n      <model>wikitext</model>\n"
+        f"      <text bytes=\"{len(wikitext)}\" xml:space=\"preserve\">{escape(wikitext)}</text>\n"
+        f"    </revision>\n  </page>\n"
+    )
+
+
+def synthetic_wikitext(i: int, sentences: int = 40, category: str = "Artificial intelligence") -> str:
+    body = sample_sentences(sentences)
+    half = len(body) // 2
+    return (
+        f"{{{{Short description|Synthetic article {i}}}}}\n"
+        f"'''Article {i}''' is about [[machine learning|learning machines]]. {' '.join(body[:half])}"
+        f"<ref>{{{{cite web|url=https://example.com/{i}}}}}</ref>\n\n"
+        f"== History ==\n{' '.join(body[half:])}\n\n"
+        f"[[Category:{category}]]\n"
+    )
+
+
+def write_synthetic_dump(path: Path, pages: int = 1000, ai_every: int = 5, sentences: int = 40) -> Path:
+    """
+    Escreve um dump com `pages` artigos. Um a cada `ai_every` está na categoria
+    "Artificial intelligence"; a cada 10 páginas há um redirecionamento e uma
+    página de categoria (namespace 14), que o leitor deve ignorar.
+    """
+    path = Path(path)
+    opener = bz2.open if path.suffix == ".bz2" else open
+    with opener(path, "wt", encoding="utf-8") as f:
+        f.write(_HEADER)
+        page_id = 0
+        for i in range(pages):
+            page_id += 1
+            category = "Artificial intelligence" if i % ai_every == 0 else "History"
+            f.write(_page(page_id, f"Article {i}", synthetic_wikitext(i, sentences, category)))
+            if i % 10 == 0:
+                page_id += 1
+                f.write(_page(page_id, f"Redirect {i}", f"#REDIRECT [[Article {i}]]", redirect=f"Article {i}"))
+                page_id += 1
+                f.write(_page(page_id, f"Category:Topic {i}", "A category page.", ns=14))
+        f.write("</mediawiki>\n")
+    return path
+
+
+def measure(path: Path, page_filter: DumpFilter, decompressor: str):
+    tracemalloc.start()
+    start = time.perf_counter()
+    selected = total = 0
+    with open_dump(path, decompressor) as stream:
+        for page in iter_dump_pages(stream):
+            total += 1
+            if page_filter.matches(page):
+                selected += 1
+                page.text
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return total, selected, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic Wikipedia dumps and benchmark streaming reads.")
+    parser.add_argument("--pages", type=int, nargs="+", default=[2000, 20000])
+    parser.add_argument("--write", help="Only write a dump with --pages[0] articles to this path.")
+    parser.add_argument("--decompressor", default="auto")
+    args = parser.parse_args()
+
+    if args.write:
+        print(write_synthetic_dump(Path(args.write), args.pages[0]))
+        return
+
+    page_filter = DumpFilter(categories=["Artificial intelligence"])
+    with tempfile.TemporaryDirectory() as tmp:
+        for pages in args.pages:
+            path = write_synthetic_dump(Path(tmp) / f"dump-{pages}.xml.bz2", pages)
+            total, selected, elapsed, peak = measure(path, page_filter, args.decompressor)
+            print(f"{pages:>7} pages  {path.stat().st_size / 1e6:6.1f} MB bz2  {elapsed:6.2f}s  "
+                  f"{total / elapsed:8.0f} pages/s  {selected} selected  "
+                  f"peak Python memory {peak / 1e6:5.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# benchmarks/tokenizers.py
+"""
+Benchmark da segmentação de texto quando vários detectores analisam o mesmo artigo.
+
+- nltk (legado): cada detector chama sent_tokenize + word_tokenize por conta própria.
+- Document/punkt: o texto é segmentado uma vez e compartilhado entre os detectores.
+- Document/regex: idem, usando o RegexTokenizer.
+
+Uso:
+    python -m nuvia.benchmarks.tokenizers --sentences 5000 --detectors 3
+"""
+import argparse
+import time
+
+from nuvia.adapters.nlp.tokenizers import TOKENIZERS
+from nuvia.benchmarks.corpus import sample_sentences
+from nuvia.domain.value_objects.document import Document
+
+
+def legacy(text, detectors):
+    from nltk.tokenize import sent_tokenize, word_tokenize
+    for _ in range(detectors):
+        for sent in sent_tokenize(text):
+            word_tokenize(sent)
+
+
+def shared_document(text, detectors, tokenizer):
+    document = Document(text, tokenizer)
+    for _ in range(detectors):
+        for i in range(len(document)):
+            document.words(i)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sentence/word tokenization.")
+    parser.add_argument("--sentences", type=int, default=5000)
+    parser.add_argument("--detectors", type=int, default=3)
+    args = parser.parse_args()
+
+    text = " ".join(sample_sentences(args.sentences))
+
+    start = time.perf_counter()
+    legacy(text, args.detectors)
+    reference = time.perf_counter() - start
+    print(f"{'nltk (legacy)':<18} {reference * 1000:9.1f} ms")
+
+    for name, tokenizer_class in TOKENIZERS.items():
+        tokenizer = tokenizer_class()
+        start = time.perf_counter()
+        shared_document(text, args.detectors, tokenizer)
+        elapsed = time.perf_counter() - start
+        print(f"{'Document/' + name:<18} {elapsed * 1000:9.1f} ms  ({reference / elapsed:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,9 +3,10 @@ from typing import List
 from nuvia.domain.value_objects.bias_segment import BiasSegment
 
 class Article:
-    def __init__(self, title: str, content: str):
+    def __init__(self, title: str, content: str, language: str = "en"):
         self.title = title
         self.content = content
+        self.language = language # Código da Wikipedia ("en", "pt"...): escolhe o detector
         self.bias_segments: List[BiasSegment] = []
         self.total_score = 0.0
 
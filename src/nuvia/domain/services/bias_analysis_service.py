@@ -1,7 +1,8 @@
 # domain/services/biased_words_repository.py
 from typing import List, Dict, Any
 # Imports the INTERFACE, not the implementation
-from nuvia.domain.repositories import BiasedWordsRepository
+from nuvia.domain.repositories.biased_words_repository import BiasedWordsRepository
+from nuvia.domain.services.phrase_matcher import PhraseMatch, PhraseMatcher
 
 class BiasAnalysisService:
     def __init__(self, repo: BiasedWordsRepository):
@@ -12,25 +13,34 @@ class BiasAnalysisService:
         self.repo = repo
         # We load the data once for optimization
         self.categories = self.repo.get_categories()
+        # Compiles all categories into a single automaton (single and multi-word entries)
+        self.matcher = PhraseMatcher()
+        for category_name, category_data in self.categories.items():
+            self.matcher.add_many(category_data["words"], category_name)
+
+    def find_occurrences(self, text: str) -> List[PhraseMatch]:
+        """
+        Returns every occurrence of a biased word or phrase, with its category
+        and character offsets, scanning the text only once.
+        """
+        return self.matcher.find_all(text)
 
     def analyze_text(self, text: str) -> List[Dict[str, Any]]:
         """
         The main business logic: analyzes the text for biased words.
         """
         results = []
-        words_in_text = set(text.lower().replace(',', '').replace('.', '').split())
-
-        for category_name, category_data in self.categories.items():
-            biased_words_in_category = category_data["words"]
-            
-            # Finds the intersection between the words in the text and the category's words
-            found_words = words_in_text.intersection(biased_words_in_category)
+        seen = set()
 
-            for word in found_words:
-                results.append({
-                    "word": word,
-                    "category": category_name,
-                    "explanation": category_data["explanation"]
-                })
+        for match in self.find_occurrences(text):
+            key = (match.phrase, match.category)
+            if key in seen:
+                continue
+            seen.add(key)
+            results.append({
+                "word": match.phrase,
+                "category": match.category,
+                "explanation": self.categories[match.category]["explanation"]
+            })
         
-        return results
\ No newline at end of file
+        return results
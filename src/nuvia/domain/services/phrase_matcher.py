@@ -0,0 +1,135 @@
+# domain/services/phrase_matcher.py
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class PhraseMatch:
+    phrase: str
+    category: Optional[str]
+    start: int  # Character offsets into the text (or token offsets for match_tokens)
+    end: int
+
+
+class PhraseMatcher:
+    """
+    Aho-Corasick automaton over word tokens.
+
+    Phrases (single words or multi-word expressions such as "it is said") are
+    compiled once into a trie with failure links. The text is then scanned a
+    single time, token by token, so matching runs in time linear in the text
+    length plus the number of matches, regardless of how many phrases are
+    loaded. Because the alphabet is the set of tokens, every match starts and
+    ends on a word boundary.
+    """
+    TOKEN = re.compile(r"\w+(?:[-'’]\w+)*")
+
+    def __init__(self, phrases: Iterable[str] = (), category: Optional[str] = None,
+                 hyphen_variants: bool = True):
+        """
+        :param hyphen_variants: Also register "a number of" for an entry like
+                                "a-number-of", so both spellings match.
+        """
+        self.hyphen_variants = hyphen_variants
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[Tuple[str, Optional[str], int]]] = [[]]
+        # Nearest node on the failure chain that has outputs (the "dictionary suffix link")
+        self._output_link: List[int] = [0]
+        self._compiled = False
+        self.add_many(phrases, category)
+
+    def add(self, phrase: str, category: Optional[str] = None):
+        tokens = self._tokens(phrase)
+        if not tokens:
+            return
+        self._insert(phrase, tokens, category)
+        if self.hyphen_variants and any("-" in token for token in tokens):
+            spaced = [part for token in tokens for part in token.split("-") if part]
+            self._insert(phrase, spaced, category)
+
+    def add_many(self, phrases: Iterable[str], category: Optional[str] = None):
+        for phrase in phrases:
+            self.add(phrase, category)
+
+    def __len__(self):
+        return len(self._goto)
+
+    def find_all(self, text: str) -> List[PhraseMatch]:
+        """All (possibly overlapping) matches in the text, with character offsets, in order of their end."""
+        return list(self.iter_matches(text))
+
+    def iter_matches(self, text: str) -> Iterator[PhraseMatch]:
+        starts: List[int] = []
+        ends: List[int] = []
+        tokens = []
+        for match in self.TOKEN.finditer(text):
+            starts.append(match.start())
+            ends.append(match.end())
+            tokens.append(match.group().lower())
+        for phrase, category, first, last in self._scan(tokens):
+            yield PhraseMatch(phrase, category, starts[first], ends[last])
+
+    def match_tokens(self, tokens: Sequence[str]) -> List[PhraseMatch]:
+        """Matches over already tokenized text. Offsets are token indices (end exclusive)."""
+        return [
+            PhraseMatch(phrase, category, first, last + 1)
+            for phrase, category, first, last in self._scan([token.lower() for token in tokens])
+        ]
+
+    def _scan(self, tokens: Sequence[str]) -> Iterator[Tuple[str, Optional[str], int, int]]:
+        if not self._compiled:
+            self._build()
+        goto, fail, outputs, output_link = self._goto, self._fail, self._outputs, self._output_link
+        node = 0
+        for position, token in enumerate(tokens):
+            while node and token not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(token, 0)
+            hit = node if outputs[node] else output_link[node]
+            while hit:
+                for phrase, category, length in outputs[hit]:
+                    yield phrase, category, position - length + 1, position
+                hit = output_link[hit]
+
+    def _insert(self, phrase: str, tokens: List[str], category: Optional[str]):
+        node = 0
+        for token in tokens:
+            child = self._goto[node].get(token)
+            if child is None:
+                child = len(self._goto)
+                self._goto[node][token] = child
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+                self._output_link.append(0)
+            node = child
+        entry = (phrase, category, len(tokens))
+        if entry not in self._outputs[node]:
+            self._outputs[node].append(entry)
+        self._compiled = False
+
+    def _build(self):
+        """Computes failure and output links with a breadth-first traversal of the trie."""
+        queue = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            self._output_link[child] = 0
+            queue.append(child)
+        while queue:
+            node = queue.popleft()
+            for token, child in self._goto[node].items():
+                state = self._fail[node]
+                while state and token not in self._goto[state]:
+                    state = self._fail[state]
+                fallback = self._goto[state].get(token, 0)
+                self._fail[child] = fallback if fallback != child else 0
+                target = self._fail[child]
+                self._output_link[child] = target if self._outputs[target] else self._output_link[target]
+                queue.append(child)
+        self._compiled = True
+
+    def _tokens(self, phrase: str) -> List[str]:
+        return [token.lower() for token in self.TOKEN.findall(phrase)]
@@ -1,6 +1,13 @@
 # domain/value_objects/bias_segment.py
 class BiasSegment:
-    def __init__(self, text: str,reason: str, score: float = None, ):
+    # Sem __dict__ por instância: análises de corpora inteiros guardam milhões destes
+    __slots__ = ("text", "reason", "score", "start", "end")
+
+    def __init__(self, text: str,reason: str, score: float = None, start: int = None, end: int = None):
         self.text = text
         self.score = score
         self.reason = reason
+        # Posição do trecho no texto analisado (offsets de caractere), quando conhecida
+        self.start = start
+        self.end = end
+
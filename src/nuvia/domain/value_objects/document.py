@@ -0,0 +1,82 @@
+# domain/value_objects/document.py
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+class Tokenizer(ABC):
+    """
+    Interface for sentence and word segmentation.
+    Implementations live in the adapters layer (e.g. NLTK Punkt or regex based).
+    """
+    @property
+    def name(self) -> str:
+        return type(self).__name__
+
+    @abstractmethod
+    def span_tokenize(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Should return the (start, end) character offsets of each sentence.
+        """
+        pass
+
+    @abstractmethod
+    def word_tokenize(self, sentence: str) -> List[str]:
+        """
+        Should return the word tokens of a single sentence.
+        """
+        pass
+
+
+class Document:
+    """
+    A text that is tokenized only once.
+    Sentences, their character spans and word tokens are computed on first use
+    and cached, so several detectors can analyze the same Document without
+    re-tokenizing it.
+    """
+    def __init__(self, text: str, tokenizer: Tokenizer):
+        self.text = text
+        self.tokenizer = tokenizer
+        self._spans: Optional[List[Tuple[int, int]]] = None
+        self._sentences: Optional[List[str]] = None
+        self._words: Dict[int, List[str]] = {}
+
+    @property
+    def spans(self) -> List[Tuple[int, int]]:
+        if self._spans is None:
+            self._spans = self.tokenizer.span_tokenize(self.text)
+        return self._spans
+
+    @property
+    def sentences(self) -> List[str]:
+        if self._sentences is None:
+            self._sentences = [self.text[start:end] for start, end in self.spans]
+        return self._sentences
+
+    def words(self, index: int) -> List[str]:
+        """Word tokens of the sentence at `index`."""
+        words = self._words.get(index)
+        if words is None:
+            words = self._words[index] = self.tokenizer.word_tokenize(self.sentences[index])
+        return words
+
+    def words_for(self, indices: Sequence[int]) -> "Sequence[List[str]]":
+        """Lazy sequence with the word tokens of the given sentences (tokenized only when accessed)."""
+        return _LazyWords(self, indices)
+
+    def __len__(self):
+        return len(self.spans)
+
+
+class _LazyWords(Sequence):
+    def __init__(self, document: Document, indices: Sequence[int]):
+        self.document = document
+        self.indices = list(indices)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return _LazyWords(self.document, self.indices[position])
+        return self.document.words(self.indices[position])
+
+    def __len__(self):
+        return len(self.indices)
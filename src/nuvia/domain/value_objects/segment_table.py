@@ -0,0 +1,192 @@
+# domain/value_objects/segment_table.py
+from typing import Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+from nuvia.domain.value_objects.bias_segment import BiasSegment
+
+
+def _offset_dtype(text_length: int) -> np.dtype:
+    return np.dtype(np.uint32 if text_length < 2 ** 32 else np.uint64)
+
+
+def _code_dtype(distinct: int) -> np.dtype:
+    """Smallest unsigned type for codes 0..distinct-1 (uint8, uint16 or uint32)."""
+    return np.min_scalar_type(max(distinct - 1, 0))
+
+
+class SegmentTable:
+    """
+    Columnar storage for many BiasSegments.
+
+    Instead of one object per segment (plus a copy of its sentence and of its
+    reason string), a table keeps parallel arrays:
+    - `doc`: index of the source text in `sources` (the segment text is
+      `sources[doc][start:end]`, so sentences are never copied);
+    - `start` / `end`: character offsets into that source;
+    - `score`: float32 (NaN when the detector gave no score);
+    - `reason`: small-int code into the `reasons` list of distinct strings.
+
+    Iterating yields regular BiasSegment objects, built on demand, so code that
+    consumes `AnalysisResult.segments` works unchanged.
+    """
+    def __init__(self, sources: List[str], doc: np.ndarray, start: np.ndarray, end: np.ndarray,
+                 score: np.ndarray, reason: np.ndarray, reasons: List[str]):
+        self.sources = sources
+        self.doc = doc
+        self.start = start
+        self.end = end
+        self.score = score
+        self.reason = reason
+        self.reasons = reasons
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[BiasSegment], text: str) -> "SegmentTable":
+        """
+        Builds a table from segments found in `text`.
+
+        Segments without offsets are located by their text, searching forward
+        from the previous segment. Segments that do not occur in `text` are
+        dropped, as in the highlighted rendering.
+        """
+        starts, ends, scores, codes = [], [], [], []
+        reason_codes = {}
+        cursor = 0
+        for seg in segments:
+            start, end = seg.start, seg.end
+            if start is None or end is None or text[start:end] != seg.text:
+                start = text.find(seg.text, cursor)
+                if start < 0:
+                    start = text.find(seg.text)
+                if start < 0 or not seg.text:
+                    continue
+                end = start + len(seg.text)
+            cursor = end
+            starts.append(start)
+            ends.append(end)
+            scores.append(np.nan if seg.score is None else seg.score)
+            codes.append(reason_codes.setdefault(seg.reason, len(reason_codes)))
+        return cls(
+            sources=[text],
+            doc=np.zeros(len(starts), dtype=np.uint8),
+            start=np.array(starts, dtype=_offset_dtype(len(text))),
+            end=np.array(ends, dtype=_offset_dtype(len(text))),
+            score=np.array(scores, dtype=np.float32),
+            reason=np.array(codes, dtype=_code_dtype(len(reason_codes))),
+            reasons=list(reason_codes),
+        )
+
+    @classmethod
+    def concat(cls, tables: Sequence["SegmentTable"]) -> "SegmentTable":
+        """Joins tables (e.g. one per article) into one, merging their reason codes."""
+        sources: List[str] = []
+        reason_codes = {}
+        docs, codes = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int64)]
+        for table in tables:
+            docs.append(table.doc.astype(np.int64) + len(sources))
+            sources.extend(table.sources)
+            remap = np.array([reason_codes.setdefault(r, len(reason_codes)) for r in table.reasons], dtype=np.int64)
+            codes.append(remap[table.reason] if len(table) else np.zeros(0, dtype=np.int64))
+        longest = max((len(source) for source in sources), default=0)
+        offsets = _offset_dtype(longest)
+        return cls(
+            sources=sources,
+            doc=np.concatenate(docs).astype(_code_dtype(len(sources))),
+            start=np.concatenate([np.zeros(0, offsets)] + [t.start.astype(offsets) for t in tables]),
+            end=np.concatenate([np.zeros(0, offsets)] + [t.end.astype(offsets) for t in tables]),
+            score=np.concatenate([np.zeros(0, np.float32)] + [t.score for t in tables]),
+            reason=np.concatenate(codes).astype(_code_dtype(len(reason_codes))),
+            reasons=list(reason_codes),
+        )
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def __iter__(self) -> Iterator[BiasSegment]:
+        for i in range(len(self)):
+            yield self._segment(i)
+
+    def __getitem__(self, key: Union[int, slice, np.ndarray, Sequence[int]]):
+        """An int returns one BiasSegment; a slice, mask or index array returns a new table."""
+        if isinstance(key, (int, np.integer)):
+            if key < 0:
+                key += len(self)
+            if not 0 <= key < len(self):
+                raise IndexError(key)
+            return self._segment(int(key))
+        return SegmentTable(self.sources, self.doc[key], self.start[key], self.end[key],
+                            self.score[key], self.reason[key], self.reasons)
+
+    def _segment(self, i: int) -> BiasSegment:
+        start, end = int(self.start[i]), int(self.end[i])
+        score = float(self.score[i])
+        return BiasSegment(
+            text=self.sources[self.doc[i]][start:end],
+            reason=self.reasons[self.reason[i]],
+            score=None if np.isnan(score) else round(score, 6),
+            start=start,
+            end=end,
+        )
+
+    def texts(self) -> List[str]:
+        return [self.sources[d][s:e] for d, s, e in zip(self.doc.tolist(), self.start.tolist(), self.end.tolist())]
+
+    def to_segments(self) -> List[BiasSegment]:
+        return list(self)
+
+    def filter(self, mask: np.ndarray) -> "SegmentTable":
+        return self[np.asarray(mask, dtype=bool)]
+
+    def where(self, min_score: Optional[float] = None, reason_prefix: Optional[str] = None) -> "SegmentTable":
+        """Segments with score >= `min_score` and/or whose reason starts with `reason_prefix`."""
+        mask = np.ones(len(self), dtype=bool)
+        if min_score is not None:
+            mask &= self.score >= min_score
+        if reason_prefix is not None:
+            matching = [i for i, reason in enumerate(self.reasons) if reason.startswith(reason_prefix)]
+            mask &= np.isin(self.reason, matching)
+        return self[mask]
+
+    def sort(self, by: str = "start", descending: bool = False) -> "SegmentTable":
+        """Sorted copy, by "start" (reading order, per source), "score" or "length"."""
+        if by == "start":
+            order = np.lexsort((self.start, self.doc))
+        elif by == "score":
+            order = np.argsort(self.score, kind="stable")
+        elif by == "length":
+            order = np.argsort(self.end - self.start, kind="stable")
+        else:
+            raise ValueError(f"Unknown sort key: {by}")
+        return self[order[::-1] if descending else order]
+
+    @property
+    def total_score(self) -> float:
+        return float(np.nansum(self.score, dtype=np.float64))
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the columns (the source texts are shared, not counted)."""
+        return sum(a.nbytes for a in (self.doc, self.start, self.end, self.score, self.reason))
+
+    def to_arrow(self, include_text: bool = True):
+        """
+        Exports the table as a pyarrow.Table, with the reasons dictionary-encoded.
+        Requires `pyarrow` (pip install 'clora[arrow]').
+        """
+        import pyarrow as pa
+
+        columns = {
+            "doc": pa.array(self.doc),
+            "start": pa.array(self.start),
+            "end": pa.array(self.end),
+            "score": pa.array(self.score, mask=np.isnan(self.score)),
+            "reason": pa.DictionaryArray.from_arrays(pa.array(self.reason), pa.array(self.reasons, pa.string())),
+        }
+        if include_text:
+            columns["text"] = pa.array(self.texts(), pa.string())
+        return pa.table(columns)
+
+    def to_parquet(self, path, include_text: bool = True):
+        import pyarrow.parquet as pq
+
+        pq.write_table(self.to_arrow(include_text=include_text), path)
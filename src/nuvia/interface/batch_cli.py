@@ -0,0 +1,190 @@
+# interface/batch_cli.py
+"""
+Análise em lote de vários artigos, sem passar pelo Streamlit.
+
+Exemplos:
+    nuvia-batch --titles "Artificial intelligence" "Machine learning" -o results.jsonl
+    nuvia-batch --titles-file titles.txt --workers 8
+    nuvia-batch --jsonl requests.jsonl --text-field body --id-field request_id
+    nuvia-batch --titles-file watchlist.txt --incremental -o nightly.jsonl
+    nuvia-batch --titles-file titles.txt --detector cascade --calibration cascade.json
+    nuvia-batch --titles-file titles.txt --index bias.sqlite -o results.jsonl
+    nuvia-batch --titles "Inteligência artificial" --language pt
+"""
+import argparse
+import functools
+import json
+import sys
+import time
+from typing import Iterator
+
+from nuvia.application.use_cases.batch_analysis_use_case import BatchAnalysisUseCase, BatchItem
+from nuvia.adapters.wikipedia.wikipedia_scraper import default_scraper
+from nuvia.adapters.nlp.languages import LANGUAGES
+from nuvia.adapters.nlp.resources import default_cache_dir
+from nuvia.interface.index_cli import index_records
+
+DETECTORS = ("hybrid", "nltk", "embedding", "cascade")
+
+
+def build_detector(kind: str = "hybrid", threshold: float = None, language: str = "en", **options):
+    """
+    Cria o detector dentro de cada worker (os imports pesados só acontecem lá).
+    Fora do inglês, modelo, léxicos e segmentação vêm do perfil do idioma.
+    """
+    kwargs = dict(options)
+    if threshold is not None:
+        kwargs["threshold"] = threshold
+    if language != "en":
+        if kind == "cascade":
+            # A triagem usa o léxico de opinião do NLTK, que só existe em inglês
+            raise ValueError(f"The 'cascade' detector has no screening lexicon for '{language}'")
+        from nuvia.adapters.nlp.detector_registry import create_language_detector
+        return create_language_detector(language, kind, **kwargs)
+    if kind == "hybrid":
+        from nuvia.adapters.nlp.hybrid_bias_detector import HybridBiasDetector
+        return HybridBiasDetector(**kwargs)
+    if kind == "nltk":
+        from nuvia.adapters.nlp.nltk_bias_detector import NltkBiasDetector
+        return NltkBiasDetector(**kwargs)
+    if kind == "embedding":
+        from nuvia.adapters.nlp.embedding_bias_detector import EmbeddingBiasDetector
+        return EmbeddingBiasDetector(**kwargs)
+    if kind == "cascade":
+        from nuvia.adapters.nlp.cascade_bias_detector import CascadeBiasDetector
+        from nuvia.adapters.nlp.hybrid_bias_detector import HybridBiasDetector
+        screen_threshold = kwargs.pop("screen_threshold", 0.0)
+        return CascadeBiasDetector(HybridBiasDetector(**kwargs), screen_threshold=screen_threshold)
+    raise ValueError(f"Unknown detector '{kind}'. Choose one of: {', '.join(DETECTORS)}")
+
+
+def open_snapshot_store(path: str):
+    from nuvia.adapters.cache.analysis_snapshot_store import AnalysisSnapshotStore
+    return AnalysisSnapshotStore(path)
+
+
+def open_index(path: str):
+    from nuvia.adapters.index.bias_index import BiasIndex
+    return BiasIndex(path)
+
+
+def fetch_article(title: str, language: str = "en"):
+    return default_scraper(language).fetch_article(title)
+
+
+def read_titles(titles, titles_file) -> Iterator[BatchItem]:
+    for i, title in enumerate(titles or []):
+        yield BatchItem(item_id=str(i), title=title)
+    if titles_file:
+        with open(titles_file, encoding="utf-8") as f:
+            for i, line in enumerate(f):
+                title = line.strip()
+                if title:
+                    yield BatchItem(item_id=f"{titles_file}:{i}", title=title)
+
+
+def read_jsonl(path, text_field, title_field, id_field) -> Iterator[BatchItem]:
+    with open(path, encoding="utf-8") as f:
+        for i, line in enumerate(f):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            yield BatchItem(
+                item_id=str(record.get(id_field, i)),
+                title=record.get(title_field) or f"Item {i}",
+                text=record[text_field],
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze many articles in parallel and write JSONL results.")
+    source = parser.add_argument_group("input")
+    source.add_argument("--titles", nargs="+", help="Wikipedia titles to fetch and analyze.")
+    source.add_argument("--titles-file", help="File with one Wikipedia title per line.")
+    source.add_argument("--jsonl", help="JSONL file with texts to analyze.")
+    source.add_argument("--text-field", default="text")
+    source.add_argument("--title-field", default="title")
+    source.add_argument("--id-field", default="id")
+    parser.add_argument("-o", "--output", help="Output JSONL file (default: stdout).")
+    parser.add_argument("--language", default="en", choices=list(LANGUAGES),
+                        help="Wikipedia edition and detector language (default: en).")
+    parser.add_argument("--detector", default="hybrid", choices=DETECTORS)
+    parser.add_argument("--threshold", type=float)
+    parser.add_argument("--backend", help="Inference backend for the hybrid detector.")
+    parser.add_argument("--long-sentences", choices=("window", "truncate"),
+                        help="Hybrid detector: how to score sentences longer than the model window.")
+    parser.add_argument("--max-tokens", type=int, help="Hybrid detector: model window in tokens (default: 512).")
+    parser.add_argument("--calibration", help="Cascade calibration JSON (see `python -m nuvia.benchmarks.cascade`).")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: number of CPUs).")
+    parser.add_argument("--threads-per-worker", type=int, default=1)
+    parser.add_argument("--fetch-workers", type=int, default=8)
+    parser.add_argument("--retries", type=int, default=2)
+    parser.add_argument("--incremental", action="store_true",
+                        help="Reuse the previous analysis of each article and only analyze changed sentences.")
+    parser.add_argument("--index", help="Also add the results to this bias index (see nuvia-index).")
+    parser.add_argument("--snapshots", help="Snapshot database for --incremental "
+                                            "(default: $NUVIA_CACHE_DIR/snapshots.sqlite).")
+    args = parser.parse_args()
+
+    if not (args.titles or args.titles_file or args.jsonl):
+        parser.error("one of --titles, --titles-file or --jsonl is required")
+    if args.max_tokens is not None and args.max_tokens < (3 if args.long_sentences == "truncate" else 5):
+        # 2 tokens são [CLS] e [SEP]; com janelas, o passo entre elas também precisa ser positivo
+        parser.error("--max-tokens must be at least 5 (at least 3 with --long-sentences truncate)")
+    if args.language != "en" and args.detector in ("cascade", "nltk"):
+        parser.error(f"--detector {args.detector} is only available for English")
+
+    options = {}
+    if args.detector in ("hybrid", "cascade"):
+        hybrid_options = {"backend": args.backend, "long_sentences": args.long_sentences, "max_tokens": args.max_tokens}
+        options = {name: value for name, value in hybrid_options.items() if value is not None}
+    if args.detector == "cascade" and args.calibration:
+        from nuvia.adapters.nlp.cascade_bias_detector import CascadeCalibration
+        options["screen_threshold"] = CascadeCalibration.load(args.calibration).screen_threshold
+    engine = BatchAnalysisUseCase(
+        detector_factory=functools.partial(build_detector, args.detector, args.threshold, args.language, **options),
+        fetcher=functools.partial(fetch_article, language=args.language),
+        workers=args.workers,
+        fetch_workers=args.fetch_workers,
+        max_retries=args.retries,
+        threads_per_worker=args.threads_per_worker,
+        snapshot_store_factory=functools.partial(
+            open_snapshot_store, args.snapshots or str(default_cache_dir() / "snapshots.sqlite")
+        ) if args.incremental else None,
+    )
+
+    if args.jsonl:
+        items = read_jsonl(args.jsonl, args.text_field, args.title_field, args.id_field)
+    else:
+        items = read_titles(args.titles, args.titles_file)
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    start = time.perf_counter()
+    ok = failed = 0
+    index, pending = (open_index(args.index), []) if args.index else (None, [])
+    try:
+        for record in engine.execute(items):
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+            if record["status"] == "ok":
+                ok += 1
+            else:
+                failed += 1
+            if index is not None:
+                pending.append(record)
+                if len(pending) >= 500:
+                    index_records(index, pending, args.detector)
+                    pending = []
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        if index is not None:
+            index_records(index, pending, args.detector)
+            index.close()
+    elapsed = time.perf_counter() - start
+    print(f"Analyzed {ok} articles ({failed} failed) in {elapsed:.1f}s "
+          f"({ok / elapsed if elapsed else 0:.2f} articles/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# interface/dump_cli.py
+"""
+Análise de um dump XML local da Wikipedia, sem acessar a API.
+
+A descompressão roda em um processo externo (lbzip2/pbzip2/bzip2, quando
+disponível), a leitura do XML em um processo próprio e a inferência no pool de
+workers do `nuvia-batch`. As páginas passam de uma etapa para a outra por filas
+limitadas, então a memória não depende do tamanho do dump.
+
+Exemplos:
+    nuvia-dump enwiki-latest-pages-articles.xml.bz2 --category "Artificial intelligence" -o ai.jsonl
+    nuvia-dump dump.xml.bz2 --title-regex "(?i)neural|machine learning" --checkpoint ai.ckpt -o ai.jsonl
+"""
+import argparse
+import functools
+import json
+import multiprocessing
+import sys
+import time
+from typing import Iterator
+
+from nuvia.application.use_cases.batch_analysis_use_case import BatchAnalysisUseCase, BatchItem
+from nuvia.adapters.wikipedia.dump_reader import DumpCheckpoint, DumpFilter, parse_dump_to_queue
+from nuvia.adapters.nlp.languages import LANGUAGES
+from nuvia.interface.batch_cli import DETECTORS, build_detector
+
+
+def read_pages(pages_queue, checkpoint: DumpCheckpoint, language: str) -> Iterator[BatchItem]:
+    while True:
+        entry = pages_queue.get()
+        if entry is None:
+            return
+        if isinstance(entry, str):
+            # Erro no processo de leitura: encerra a entrada; o que já foi enviado é concluído
+            print(entry, file=sys.stderr)
+            return
+        page_id, title, revision_id, text = entry
+        checkpoint.issued(page_id)
+        yield BatchItem(
+            item_id=str(page_id),
+            title=title,
+            text=text,
+            url=f"https://{language}.wikipedia.org/w/index.php?oldid={revision_id}" if revision_id else None,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze articles from a local Wikipedia XML dump.")
+    parser.add_argument("dump", help="pages-articles.xml.bz2 (or an uncompressed .xml) file.")
+    parser.add_argument("-o", "--output", help="Output JSONL file (default: stdout).")
+    parser.add_argument("--category", action="append", default=[],
+                        help="Only analyze pages in this category (repeatable).")
+    parser.add_argument("--title-regex", help="Only analyze pages whose title matches this regex.")
+    parser.add_argument("--checkpoint", help="Checkpoint file; an existing one resumes the run.")
+    parser.add_argument("--language", default="en", choices=list(LANGUAGES),
+                        help="Dump language (revision URLs and detector language).")
+    parser.add_argument("--decompressor", default="auto",
+                        help="auto, builtin, or an executable compatible with `bzip2 -dc`.")
+    parser.add_argument("--queue-size", type=int, default=256, help="Parsed pages waiting for analysis.")
+    parser.add_argument("--detector", default="hybrid", choices=DETECTORS)
+    parser.add_argument("--threshold", type=float)
+    parser.add_argument("--backend", help="Inference backend for the hybrid detector.")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: number of CPUs).")
+    parser.add_argument("--threads-per-worker", type=int, default=1)
+    parser.add_argument("--retries", type=int, default=2)
+    args = parser.parse_args()
+    if args.language != "en" and args.detector in ("cascade", "nltk"):
+        parser.error(f"--detector {args.detector} is only available for English")
+
+    checkpoint = DumpCheckpoint(args.checkpoint)
+    if checkpoint.last_page_id is not None:
+        print(f"Resuming after page {checkpoint.last_page_id} ({checkpoint.processed} already processed)",
+              file=sys.stderr)
+
+    ctx = multiprocessing.get_context("spawn")
+    pages_queue = ctx.Queue(maxsize=args.queue_size)
+    reader = ctx.Process(
+        target=parse_dump_to_queue,
+        args=(args.dump, pages_queue, DumpFilter(args.title_regex, args.category),
+              checkpoint.last_page_id, args.decompressor),
+        daemon=True,
+    )
+    reader.start()
+
+    options = {"backend": args.backend} if args.backend and args.detector == "hybrid" else {}
+    engine = BatchAnalysisUseCase(
+        detector_factory=functools.partial(build_detector, args.detector, args.threshold, language=args.language, **options),
+        workers=args.workers,
+        max_retries=args.retries,
+        threads_per_worker=args.threads_per_worker,
+    )
+
+    # Na retomada, os resultados novos são acrescentados ao arquivo existente
+    mode = "a" if checkpoint.last_page_id is not None else "w"
+    out = open(args.output, mode, encoding="utf-8") if args.output else sys.stdout
+    start = time.perf_counter()
+    ok = failed = 0
+    try:
+        for record in engine.execute(read_pages(pages_queue, checkpoint, args.language)):
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+            checkpoint.done(int(record["id"]))
+            if record["status"] == "ok":
+                ok += 1
+            else:
+                failed += 1
+    finally:
+        checkpoint.save()
+        if out is not sys.stdout:
+            out.close()
+        reader.kill()
+        reader.join()
+    elapsed = time.perf_counter() - start
+    print(f"Analyzed {ok} articles ({failed} failed) in {elapsed:.1f}s "
+          f"({ok / elapsed if elapsed else 0:.2f} articles/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
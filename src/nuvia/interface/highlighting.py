@@ -0,0 +1,136 @@
+# interface/highlighting.py
+"""
+Montagem do texto destacado (HTML) usado pela interface Streamlit e pelo relatório PDF.
+
+O texto é percorrido uma única vez, da esquerda para a direita, usando os offsets
+(start, end) dos segmentos: custo O(tamanho do texto + segmentos), sem cópias
+repetidas da string inteira, e sempre destacando a ocorrência correta de
+sentenças que se repetem no artigo.
+"""
+import html
+import re
+from typing import Callable, Iterable, Iterator, List, Tuple
+
+from nuvia.domain.value_objects.bias_segment import BiasSegment
+from nuvia.application.services.metrics import metrics
+
+Span = Tuple[int, int, BiasSegment]
+_LINE = re.compile(r"[^\n]+")
+
+
+def resolve_spans(text: str, segments: Iterable[BiasSegment]) -> List[Span]:
+    """
+    Retorna os trechos (start, end, segmento) ordenados e sem sobreposição.
+
+    Segmentos com offsets válidos são usados diretamente. Para segmentos sem
+    offsets (detectores antigos), o trecho é procurado a partir da posição do
+    segmento anterior, o que preserva a ordem de leitura em que os detectores
+    os emitem.
+    """
+    spans = []
+    cursor = 0
+    for seg in segments:
+        start, end = seg.start, seg.end
+        if start is None or end is None or text[start:end] != seg.text:
+            if not seg.text:
+                continue
+            start = text.find(seg.text, cursor)
+            if start < 0:
+                start = text.find(seg.text)
+            if start < 0:
+                continue
+            end = start + len(seg.text)
+        cursor = end
+        spans.append((start, end, seg))
+
+    spans.sort(key=lambda span: span[0])
+    resolved = []
+    last_end = 0
+    for start, end, seg in spans:
+        if start < last_end:
+            continue # Sobreposto a um trecho já destacado
+        resolved.append((start, end, seg))
+        last_end = end
+    return resolved
+
+
+def render_highlighted(text: str, segments: Iterable[BiasSegment],
+                       render_segment: Callable[[str, BiasSegment], str],
+                       escape: Callable[[str], str] = html.escape) -> str:
+    """
+    Monta o HTML do texto com os segmentos destacados em uma única passada.
+
+    Args:
+        text: O texto completo analisado.
+        segments: Os segmentos de viés encontrados.
+        render_segment: Recebe o trecho já escapado e o segmento e devolve o HTML do destaque.
+        escape: Função de escape aplicada a todo o texto.
+    """
+    with metrics.span("render.html"):
+        parts = []
+        position = 0
+        for start, end, seg in resolve_spans(text, segments):
+            parts.append(escape(text[position:start]))
+            parts.append(render_segment(escape(text[start:end]), seg))
+            position = end
+        parts.append(escape(text[position:]))
+        return "".join(parts)
+
+
+def render_highlighted_range(text: str, segments: Iterable[BiasSegment],
+                             render_segment: Callable[[str, BiasSegment], str],
+                             start: int, end: int, escape: Callable[[str], str] = html.escape) -> str:
+    """
+    Variante de `render_highlighted` que monta apenas `text[start:end]`, com os
+    destaques que caem nesse trecho. Usada na análise em blocos: cada bloco
+    novo é renderizado uma vez, sem refazer o HTML do que já foi exibido.
+    """
+    with metrics.span("render.html"):
+        parts = []
+        position = start
+        for span_start, span_end, seg in resolve_spans(text, segments):
+            span_start, span_end = max(span_start, position), min(span_end, end)
+            if span_start >= span_end:
+                continue
+            parts.append(escape(text[position:span_start]))
+            parts.append(render_segment(escape(text[span_start:span_end]), seg))
+            position = span_end
+        parts.append(escape(text[position:end]))
+        return "".join(parts)
+
+
+def highlighted_paragraphs(text: str, segments: Iterable[BiasSegment],
+                           render_segment: Callable[[str, BiasSegment], str],
+                           escape: Callable[[str], str] = html.escape) -> Iterator[str]:
+    """
+    Variante de `render_highlighted` que gera o HTML linha a linha (um parágrafo
+    por linha não vazia do texto), sem montar o documento inteiro em memória.
+    Um destaque que atravessa uma quebra de linha é dividido entre os parágrafos.
+    """
+    spans = resolve_spans(text, segments)
+    first = 0
+    for line in _LINE.finditer(text):
+        line_start, line_end = line.span()
+        while first < len(spans) and spans[first][1] <= line_start:
+            first += 1
+        parts = []
+        position = line_start
+        i = first
+        while i < len(spans) and spans[i][0] < line_end:
+            start, end, seg = spans[i]
+            start, end = max(start, line_start), min(end, line_end)
+            parts.append(escape(text[position:start]))
+            parts.append(render_segment(escape(text[start:end]), seg))
+            position = end
+            i += 1
+        parts.append(escape(text[position:line_end]))
+        yield "".join(parts)
+
+
+def score_color(score: float, alpha: float) -> str:
+    """Cor de fundo do destaque de acordo com o score do segmento."""
+    if score > 0.4:
+        return f"rgba(255, 76, 76, {alpha})" # Vermelho claro
+    elif score > 0.3:
+        return f"rgba(255, 165, 0, {alpha})" # Laranja claro
+    return "rgba(255, 255, 0, 0.4)" # Amarelo claro
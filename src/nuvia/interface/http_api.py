@@ -0,0 +1,305 @@
+# interface/http_api.py
+"""
+API HTTP (ASGI) de análise de viés, sem interface gráfica.
+
+Os modelos são carregados uma única vez, em um pool fixo de detectores
+compartilhado por todas as requisições. As sentenças de requisições
+simultâneas são agrupadas em micro-lotes (ver MicroBatchingDetector), então
+50 usuários ao mesmo tempo não significam 50 cópias do modelo em memória.
+O detector em inglês é carregado na partida; os dos outros idiomas, no
+primeiro pedido, por um DetectorRegistry (limitado a NUVIA_MODEL_MEMORY_MB).
+
+Endpoints (todos aceitam "language", no corpo ou na query; padrão: "en"):
+    GET  /health
+    GET  /info                          detector, versão, limiar e estatísticas dos lotes
+    GET  /metrics                       métricas do processo no formato texto do Prometheus
+    POST /detect                        {"sentences": [...]} -> segmentos por sentença
+    POST /summarize                     {"segments": [...]} -> resumo textual
+    POST /analyze                       {"text": "...", "title": "..."} -> AnalysisResult
+    GET  /analyze/wikipedia/{title}     ?language=en
+
+Exemplos:
+    nuvia-serve --port 8000 --pool-size 2
+    curl -X POST localhost:8000/analyze -d '{"text": "This is the best library ever."}'
+"""
+import argparse
+import asyncio
+import functools
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+from urllib.parse import parse_qs
+
+from nuvia.domain.entities.article import Article
+from nuvia.domain.value_objects.bias_segment import BiasSegment
+from nuvia.application.services.bias_detection_service import BiasDetectionService
+from nuvia.application.services.metrics import metrics
+from nuvia.application.use_cases.analyze_article_use_case import AnalysisResult
+from nuvia.application.use_cases.multilingual_analysis_use_case import MultilingualAnalyzeArticleUseCase
+from nuvia.adapters.nlp.languages import LANGUAGES
+from nuvia.adapters.serving.micro_batching_detector import MicroBatchingDetector
+from nuvia.adapters.wikipedia.wikipedia_scraper import default_scraper
+
+MAX_BODY_BYTES = 10 * 1024 * 1024
+PROMETHEUS_CONTENT_TYPE = b"text/plain; version=0.0.4; charset=utf-8"
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def segment_to_dict(seg: BiasSegment) -> Dict[str, Any]:
+    return {"text": seg.text, "reason": seg.reason, "score": seg.score, "start": seg.start, "end": seg.end}
+
+
+class AnalysisAPI:
+    """
+    Aplicação ASGI. Roda com qualquer servidor ASGI (ex.: `uvicorn`), em um único
+    processo: é isso que garante um único pool de modelos.
+    """
+    def __init__(self, detector: BiasDetectionService,
+                 scraper_factory: Callable[[str], Any] = default_scraper, max_threads: int = 64,
+                 language_detector: Optional[Callable[[str], BiasDetectionService]] = None):
+        """
+        Args:
+            detector: Detector compartilhado em inglês (normalmente um MicroBatchingDetector).
+            scraper_factory: Cria o scraper da Wikipedia para um idioma.
+            max_threads: Requisições analisadas ao mesmo tempo (as demais esperam).
+                As threads passam quase todo o tempo esperando o micro-lote, então
+                o valor pode ser bem maior que o número de núcleos.
+            language_detector: Detector dos outros idiomas (ex.: `DetectorRegistry.detector`).
+                Sem ele, pedidos em outro idioma são recusados.
+        """
+        self.detector = detector
+        self.language_detector = language_detector
+        self.use_case = MultilingualAnalyzeArticleUseCase(self.detector_for)
+        self.scraper_factory = scraper_factory
+        self.executor = ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix="request")
+        self.routes: Dict[Tuple[str, str], Callable] = {
+            ("GET", "/health"): self.health,
+            ("GET", "/info"): self.info,
+            ("GET", "/metrics"): self.prometheus_metrics,
+            ("POST", "/detect"): self.detect,
+            ("POST", "/summarize"): self.summarize,
+            ("POST", "/analyze"): self.analyze,
+        }
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        try:
+            status, payload = 200, await self._dispatch(scope, receive)
+        except HTTPError as e:
+            status, payload = e.status, {"error": e.message}
+        except Exception as e:
+            status, payload = 500, {"error": repr(e)}
+        if isinstance(payload, str):
+            body, content_type = payload.encode("utf-8"), PROMETHEUS_CONTENT_TYPE
+        else:
+            body, content_type = json.dumps(payload, ensure_ascii=False).encode("utf-8"), b"application/json"
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", content_type), (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def _dispatch(self, scope, receive) -> Union[Dict[str, Any], str]:
+        method, path = scope["method"], scope["path"].rstrip("/") or "/"
+        query = {k: v[0] for k, v in parse_qs(scope.get("query_string", b"").decode()).items()}
+
+        prefix = "/analyze/wikipedia/"
+        if path.startswith(prefix):
+            if method != "GET":
+                raise HTTPError(405, "Method not allowed")
+            return await self._run(self._analyze_wikipedia, path[len(prefix):], query.get("language", "en"))
+
+        handler = self.routes.get((method, path))
+        if handler is None:
+            if any(p == path for _, p in self.routes):
+                raise HTTPError(405, "Method not allowed")
+            raise HTTPError(404, f"Not found: {path}")
+        body = await self._read_json(receive) if method == "POST" else query
+        return await handler(body)
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args))
+
+    @staticmethod
+    async def _read_json(receive) -> Dict[str, Any]:
+        chunks, size = [], 0
+        while True:
+            message = await receive()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                raise HTTPError(413, "Request body too large")
+            chunks.append(chunk)
+            if not message.get("more_body"):
+                break
+        try:
+            body = json.loads(b"".join(chunks) or b"{}")
+        except ValueError:
+            raise HTTPError(400, "Body must be valid JSON")
+        if not isinstance(body, dict):
+            raise HTTPError(400, "Body must be a JSON object")
+        return body
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                # Carrega os modelos antes de aceitar requisições
+                if hasattr(self.detector, "warm_up"):
+                    await self._run(self.detector.warm_up)
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    # --- Endpoints ---
+
+    async def health(self, _body) -> Dict[str, Any]:
+        return {"status": "ok"}
+
+    def detector_for(self, language: str) -> BiasDetectionService:
+        if language == "en":
+            return self.detector
+        if language not in LANGUAGES or self.language_detector is None:
+            raise HTTPError(400, f"Unsupported language: {language}")
+        try:
+            return self.language_detector(language)
+        except ValueError as e:  # Ex.: o detector do servidor não existe nesse idioma
+            raise HTTPError(400, str(e))
+
+    async def _body_detector(self, body) -> BiasDetectionService:
+        """Detector do idioma pedido (carregá-lo pode demorar, então roda fora do event loop)."""
+        language = body.get("language") or "en"
+        if language == "en":
+            return self.detector
+        return await self._run(self.detector_for, language)
+
+    async def info(self, body) -> Dict[str, Any]:
+        detector = await self._body_detector(body)
+        info = {
+            "detector_id": detector.detector_id,
+            "model_version": detector.model_version,
+            "threshold": detector.threshold,
+        }
+        if isinstance(detector, MicroBatchingDetector):
+            stats = detector.stats
+            info.update(pool_size=len(detector.detectors), max_batch_size=detector.max_batch_size,
+                        batches=stats.batches, mean_batch_size=stats.mean_batch_size)
+        return info
+
+    async def prometheus_metrics(self, _body) -> str:
+        return metrics.to_prometheus()
+
+    async def detect(self, body) -> Dict[str, Any]:
+        sentences = body.get("sentences")
+        if not isinstance(sentences, list) or not all(isinstance(s, str) for s in sentences):
+            raise HTTPError(400, "'sentences' must be a list of strings")
+        detector = await self._body_detector(body)
+        found = await self._run(detector.detect_sentences, sentences)
+        return {"segments": [[segment_to_dict(seg) for seg in segments] for segments in found]}
+
+    async def summarize(self, body) -> Dict[str, Any]:
+        segments = [
+            BiasSegment(text=s.get("text", ""), reason=s.get("reason", ""), score=s.get("score"))
+            for s in body.get("segments", [])
+        ]
+        detector = await self._body_detector(body)
+        return {"summary": detector.summarize_bias(segments)}
+
+    async def analyze(self, body) -> Dict[str, Any]:
+        text = body.get("text")
+        if not isinstance(text, str) or not text.strip():
+            raise HTTPError(400, "'text' must be a non-empty string")
+        detector = await self._body_detector(body)
+        article = Article(title=body.get("title") or "Custom Text Analysis", content=text,
+                          language=body.get("language") or "en")
+        return self._result_to_dict(await self._run(self.use_case.execute, article), detector)
+
+    def _analyze_wikipedia(self, title: str, language: str) -> Dict[str, Any]:
+        detector = self.detector_for(language)  # Idioma sem detector: recusado antes de buscar o artigo
+        with metrics.timings() as fetch_timings:
+            content = self.scraper_factory(language).fetch_article(title)
+        if not content:
+            raise HTTPError(404, f"Article not found: {title}")
+        result = self.use_case.execute(Article(title=content["title"], content=content["text"], language=language))
+        payload = self._result_to_dict(result, detector)
+        payload.update(
+            text=content["text"], url=content.get("url"), revision_id=content.get("revision_id"),
+        )
+        payload["timings"] = {**fetch_timings.stages, **payload["timings"]}
+        return payload
+
+    def _result_to_dict(self, result: AnalysisResult, detector: BiasDetectionService) -> Dict[str, Any]:
+        return {
+            "title": result.article_title,
+            "overall_score": result.overall_score,
+            "summary": detector.summarize_bias(result.segments),
+            "segments": [segment_to_dict(seg) for seg in result.segments],
+            "timings": result.timings,
+        }
+
+
+def create_app(detector_kind: str = "hybrid", pool_size: int = 1, max_batch_size: int = 64,
+               max_wait: float = 0.01, max_threads: int = 64, **detector_options) -> AnalysisAPI:
+    from nuvia.adapters.nlp.detector_registry import DetectorRegistry, model_memory_budget
+    from nuvia.interface.batch_cli import build_detector
+
+    def pooled_detector(language: str, kind: str) -> MicroBatchingDetector:
+        return MicroBatchingDetector(
+            functools.partial(build_detector, kind, language=language, **detector_options),
+            pool_size=pool_size, max_batch_size=max_batch_size, max_wait=max_wait,
+        )
+
+    # O inglês fica sempre carregado; os outros idiomas entram e saem do registro conforme o uso
+    registry = DetectorRegistry(model_memory_budget(), factory=pooled_detector)
+    return AnalysisAPI(pooled_detector("en", detector_kind), max_threads=max_threads,
+                       language_detector=lambda language: registry.detector(language, detector_kind))
+
+
+def main():
+    from nuvia.interface.batch_cli import DETECTORS
+
+    parser = argparse.ArgumentParser(description="Serve bias analysis over HTTP with a shared model pool.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--detector", default="hybrid", choices=DETECTORS)
+    parser.add_argument("--threshold", type=float)
+    parser.add_argument("--backend", help="Inference backend for the hybrid detector.")
+    parser.add_argument("--pool-size", type=int, default=1, help="Model copies kept in memory.")
+    parser.add_argument("--max-batch-size", type=int, default=64, help="Sentences per micro-batch.")
+    parser.add_argument("--max-wait-ms", type=float, default=10.0,
+                        help="How long a request waits for others to share its micro-batch.")
+    parser.add_argument("--max-threads", type=int, default=64, help="Requests analyzed concurrently.")
+    args = parser.parse_args()
+
+    try:
+        import uvicorn
+    except ImportError:
+        parser.exit(1, "nuvia-serve needs an ASGI server: pip install 'clora[server]' (uvicorn)\n")
+
+    options = {}
+    if args.threshold is not None:
+        options["threshold"] = args.threshold
+    if args.backend and args.detector == "hybrid":
+        options["backend"] = args.backend
+    app = create_app(args.detector, pool_size=args.pool_size, max_batch_size=args.max_batch_size,
+                     max_wait=args.max_wait_ms / 1000, max_threads=args.max_threads, **options)
+    # Um único processo: vários workers do uvicorn significariam várias cópias dos modelos
+    uvicorn.run(app, host=args.host, port=args.port, workers=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# interface/index_cli.py
+"""
+Índice persistente dos resultados do `nuvia-batch`/`nuvia-dump` e consultas sobre ele.
+
+Exemplos:
+    nuvia-index add results.jsonl --db bias.sqlite --detector-key hybrid
+    nuvia-index articles --cue reportedly --limit 20
+    nuvia-index top -k 100 --about "machine learning"
+    nuvia-index above 5
+    nuvia-index optimize
+"""
+import argparse
+import json
+import sys
+import time
+from dataclasses import asdict
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from nuvia.adapters.index.bias_index import BiasIndex
+from nuvia.adapters.nlp.resources import default_cache_dir
+from nuvia.application.use_cases.analyze_article_use_case import AnalysisResult
+from nuvia.domain.value_objects.bias_segment import BiasSegment
+
+
+def default_index_path() -> str:
+    return str(default_cache_dir() / "bias_index.sqlite")
+
+
+def result_from_record(record: Dict[str, Any]) -> AnalysisResult:
+    """AnalysisResult de um registro "ok" do JSONL do nuvia-batch."""
+    return AnalysisResult(
+        segments=[
+            BiasSegment(text=seg["text"], reason=seg["reason"], score=seg.get("score"),
+                        start=seg.get("start"), end=seg.get("end"))
+            for seg in record["segments"]
+        ],
+        overall_score=record["overall_score"],
+        article_title=record["title"],
+    )
+
+
+def index_records(index: BiasIndex, records: Iterable[Dict[str, Any]], detector_key: str = "",
+                  batch_size: int = 500) -> int:
+    """Indexa os registros "ok" em lotes de `batch_size` artigos (um bloco de postings por lote)."""
+    pending: List[Tuple[str, AnalysisResult]] = []
+    indexed = 0
+    for record in records:
+        if record.get("status") != "ok":
+            continue
+        pending.append((record["title"], result_from_record(record)))
+        if len(pending) >= batch_size:
+            index.add_many(pending, detector_key)
+            indexed += len(pending)
+            pending = []
+    if pending:
+        index.add_many(pending, detector_key)
+        indexed += len(pending)
+    return indexed
+
+
+def read_records(paths: List[str]) -> Iterator[Dict[str, Any]]:
+    for path in paths:
+        with (sys.stdin if path == "-" else open(path, encoding="utf-8")) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and query the persistent bias index.")
+    parser.add_argument("--db", default=None, help="Index file (default: $NUVIA_CACHE_DIR/bias_index.sqlite).")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    add = commands.add_parser("add", help="Index nuvia-batch/nuvia-dump JSONL results.")
+    add.add_argument("inputs", nargs="+", help="JSONL files ('-' for stdin).")
+    add.add_argument("--detector-key", default="", help="Detector the results came from (e.g. 'hybrid').")
+    add.add_argument("--batch-size", type=int, default=500)
+    add.add_argument("--optimize", action="store_true", help="Merge posting blocks afterwards.")
+
+    filters = argparse.ArgumentParser(add_help=False)
+    filters.add_argument("--about", help="Only segments containing all these words.")
+    filters.add_argument("--category", help="e.g. 'Weasel Word', 'Peacock Term', 'Subjective Language'.")
+    filters.add_argument("--cue", help="The peacock/weasel word that flagged the segment (e.g. 'reportedly').")
+    filters.add_argument("--reason", help="Exact reason string.")
+
+    top = commands.add_parser("top", parents=[filters], help="Highest-scoring segments.")
+    top.add_argument("-k", type=int, default=100)
+    articles = commands.add_parser("articles", parents=[filters], help="Articles with the most matching segments.")
+    articles.add_argument("--limit", type=int, default=20)
+    above = commands.add_parser("above", help="Articles whose overall score exceeds a value.")
+    above.add_argument("min_score", type=float)
+    above.add_argument("--limit", type=int)
+    commands.add_parser("optimize", help="Merge posting blocks and compact the file.")
+    args = parser.parse_args()
+
+    index = BiasIndex(args.db or default_index_path())
+    start = time.perf_counter()
+    try:
+        if args.command == "add":
+            count = index_records(index, read_records(args.inputs), args.detector_key, args.batch_size)
+            if args.optimize:
+                index.optimize()
+            print(f"Indexed {count} articles in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+            return
+        if args.command == "optimize":
+            index.optimize()
+            return
+        if args.command == "above":
+            rows = [{"title": title, "overall_score": score}
+                    for title, score in index.articles_above(args.min_score, args.limit)]
+        else:
+            query = {"about": args.about, "category": args.category, "cue": args.cue, "reason": args.reason}
+            if args.command == "top":
+                rows = [asdict(segment) for segment in index.top_segments(args.k, **query)]
+            else:
+                rows = [{"title": title, "segments": count} for title, count in index.top_articles(args.limit, **query)]
+        for row in rows:
+            print(json.dumps(row, ensure_ascii=False))
+        print(f"{len(rows)} rows in {(time.perf_counter() - start) * 1000:.1f} ms", file=sys.stderr)
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+# interface/report.py
+"""
+Relatório PDF da análise de viés.
+
+- O HTML é gerado por um template Jinja2 em pedaços (`Template.generate`), um
+  parágrafo por vez, e gravado em um arquivo temporário que só vai para o disco
+  quando passa de alguns MB. Artigos enormes não viram uma única f-string.
+- O PDF (WeasyPrint, lento em artigos longos) é gerado em segundo plano por
+  `PdfReportService`, em um processo separado, apenas quando pedido. Os
+  relatórios ficam em cache pelo hash do resultado e do texto: abrir de novo um
+  artigo já analisado devolve o mesmo PDF na hora.
+"""
+import hashlib
+import json
+import multiprocessing
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from jinja2 import Environment
+from markupsafe import Markup
+
+from nuvia.application.services.metrics import metrics
+from nuvia.application.use_cases.analyze_article_use_case import AnalysisResult
+from nuvia.interface.highlighting import highlighted_paragraphs, score_color
+
+# Tamanho a partir do qual o HTML em construção vai para um arquivo em disco
+_SPOOL_BYTES = 4 * 1024 * 1024
+
+REPORT_TEMPLATE = """<html>
+<head>
+    <meta charset="UTF-8">
+    <style>
+        body { font-family: sans-serif; line-height: 1.6; color: #333; }
+        h1, h2, h3 { color: #000; }
+        hr { border: 0; border-top: 1px solid #ccc; }
+        .summary-box { border: 1px solid #ddd; padding: 15px; margin: 20px 0; border-radius: 5px; background-color: #f9f9f9; }
+        .score-label { font-weight: bold; }
+        .article-text p { margin: 0 0 0.6em 0; word-wrap: break-word; }
+        .highlight { padding: 1px 3px; border-radius: 3px; }
+    </style>
+</head>
+<body>
+    <h1>Bias Analysis Report</h1>
+    <h2>{{ result.article_title }}</h2>
+    {% if content_url %}<p><strong>Source:</strong> <a href="{{ content_url }}">{{ content_url }}</a></p>{% endif %}
+    <hr>
+
+    <div class="summary-box">
+        <h3>Analysis Summary</h3>
+        <p><span class="score-label">Overall Bias Score:</span> {{ "%.2f"|format(result.overall_score) }} (Score per 1000 words)</p>
+        <p><span class="score-label">Biased Segments Found:</span> {{ result.segments|length }}</p>
+    </div>
+
+    <h3>Article Text with Highlights</h3>
+    <div class="article-text">
+    {% for paragraph in paragraphs %}<p>{{ paragraph }}</p>
+    {% endfor %}
+    </div>
+</body>
+</html>
+"""
+
+_environment = Environment(autoescape=True)
+_template = _environment.from_string(REPORT_TEMPLATE)
+
+
+def _render_segment(text_html: str, seg) -> str:
+    return f'<span class="highlight" style="background-color: {score_color(seg.score, 0.3)};">{text_html}</span>'
+
+
+class _BytesWriter:
+    """Adaptador mínimo de escrita de texto sobre um arquivo binário (UTF-8)."""
+    def __init__(self, raw):
+        self.raw = raw
+
+    def write(self, text: str):
+        self.raw.write(text.encode("utf-8"))
+
+
+def write_report_html(result: AnalysisResult, article_text: str, out, content_url: Optional[str] = None):
+    """Escreve o HTML do relatório em `out` (um arquivo de texto), em pedaços."""
+    paragraphs = (
+        Markup(paragraph)  # Já escapado por highlighted_paragraphs
+        for paragraph in highlighted_paragraphs(article_text, result.segments, _render_segment)
+    )
+    for chunk in _template.generate(result=result, content_url=content_url, paragraphs=paragraphs):
+        out.write(chunk)
+
+
+def create_pdf_report(result: AnalysisResult, article_text: str, content_url: Optional[str] = None) -> bytes:
+    """
+    Gera o relatório em PDF a partir dos resultados da análise (de forma síncrona;
+    na interface, use `PdfReportService`).
+    """
+    # Import tardio: o WeasyPrint é pesado e só é necessário ao gerar o relatório
+    from weasyprint import HTML
+
+    with tempfile.SpooledTemporaryFile(max_size=_SPOOL_BYTES, mode="w+b") as spool:
+        with metrics.span("render.html"):
+            text_out = _BytesWriter(spool)
+            write_report_html(result, article_text, text_out, content_url)
+        spool.seek(0)
+        with metrics.span("render.pdf"):
+            return HTML(file_obj=spool, encoding="utf-8").write_pdf()
+
+
+def report_key(result: AnalysisResult, article_text: str, content_url: Optional[str] = None) -> str:
+    """Chave do cache: hash do resultado (título, score, segmentos, fonte) + hash do texto."""
+    payload = json.dumps(
+        [result.article_title, result.overall_score, content_url,
+         [[seg.text, seg.reason, seg.score, seg.start, seg.end] for seg in result.segments]],
+        ensure_ascii=False,
+    )
+    result_hash = hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+    text_hash = hashlib.blake2b(article_text.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{result_hash}:{text_hash}"
+
+
+class PdfReportService:
+    """
+    Gera relatórios PDF em segundo plano, com cache dos mais recentes.
+
+    `submit` devolve um Future; pedidos repetidos (mesmo resultado e texto)
+    recebem o mesmo Future, esteja ele pronto ou ainda em andamento. O padrão é
+    um processo separado (spawn): a diagramação do WeasyPrint é Python puro, e
+    em uma thread ela disputaria o GIL com a interface.
+    """
+    def __init__(self, max_workers: int = 1, max_entries: int = 16, executor: Optional[Executor] = None):
+        """
+        Args:
+            max_workers: Relatórios gerados ao mesmo tempo (ignorado com `executor`).
+            max_entries: Quantidade de relatórios mantidos em cache (os mais antigos saem).
+            executor: Executor alternativo (ex.: um ThreadPoolExecutor).
+        """
+        self.max_workers = max_workers
+        self.max_entries = max_entries
+        self._executor = executor
+        self._reports: "OrderedDict[str, Future]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                 mp_context=multiprocessing.get_context("spawn"))
+        return self._executor
+
+    def peek(self, result: AnalysisResult, article_text: str, content_url: Optional[str] = None) -> Optional[Future]:
+        """Future do relatório, se ele já foi pedido (sem disparar a geração)."""
+        key = report_key(result, article_text, content_url)
+        with self._lock:
+            future = self._reports.get(key)
+            if future is not None:
+                self._reports.move_to_end(key)
+            return future
+
+    def submit(self, result: AnalysisResult, article_text: str, content_url: Optional[str] = None) -> Future:
+        """Pede o relatório; reaproveita o do cache quando já existe."""
+        key = report_key(result, article_text, content_url)
+        with self._lock:
+            future = self._reports.get(key)
+            if future is not None and not (future.done() and future.exception() is not None):
+                self._reports.move_to_end(key)
+                metrics.increment("nuvia_cache_hits_total", cache="pdf")
+                return future
+            metrics.increment("nuvia_cache_misses_total", cache="pdf")
+            try:
+                future = self.executor.submit(create_pdf_report, result, article_text, content_url)
+            except BrokenProcessPool:
+                # Um worker morreu (ex.: sem memória no WeasyPrint): recria o pool uma vez
+                self._executor = None
+                future = self.executor.submit(create_pdf_report, result, article_text, content_url)
+            self._reports[key] = future
+            while len(self._reports) > self.max_entries:
+                self._reports.popitem(last=False)
+            return future
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_default_service: Optional[PdfReportService] = None
+_default_service_lock = threading.Lock()
+
+
+def default_report_service() -> PdfReportService:
+    """
+    Serviço de relatórios compartilhado pelo processo (e por todas as sessões da
+    interface, que rodam em threads diferentes: a criação é protegida por um lock
+    para que não surjam dois pools nem dois caches).
+    """
+    global _default_service
+    if _default_service is None:
+        with _default_service_lock:
+            if _default_service is None:
+                _default_service = PdfReportService()
+    return _default_service
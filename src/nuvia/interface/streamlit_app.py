@@ -2,112 +2,54 @@
 import os
 import subprocess
 import sys
+import html
+from typing import Dict, Optional
 import streamlit as st
-import re
-from weasyprint import HTML  # Importa a biblioteca para gerar PDF
 
 # --- Dependências do seu projeto ---
 from nuvia.domain.entities.article import Article
 # Importa a classe de resultado junto com o caso de uso
 from nuvia.application.use_cases.analyze_article_use_case import AnalyzeArticleUseCase, AnalysisResult
-from nuvia.adapters.nlp.hybrid_bias_detector import HybridBiasDetector
-from nuvia.adapters.wikipedia.wikipedia_scraper import WikipediaScraper
+from nuvia.application.use_cases.multilingual_analysis_use_case import MultilingualAnalyzeArticleUseCase
+from nuvia.application.services.bias_detection_service import BiasDetectionService
+from nuvia.application.services.metrics import Timings, metrics
+from nuvia.adapters.wikipedia.wikipedia_scraper import default_scraper
+from nuvia.adapters.cache.analysis_result_cache import AnalysisResultCache, analysis_cache_key, text_fingerprint
+from nuvia.adapters.nlp.detector_registry import DetectorRegistry, model_memory_budget
+from nuvia.adapters.nlp.languages import LANGUAGES
+from nuvia.interface.highlighting import render_highlighted, render_highlighted_range, score_color
+from nuvia.interface.report import default_report_service
 
 # ==============================================================================
 # FUNÇÕES AUXILIARES DE GERAÇÃO E EXIBIÇÃO
 # ==============================================================================
 
-def create_pdf_report(result: AnalysisResult, article_text: str, content_url: str = None):
-    """
-    Gera um relatório em PDF a partir dos resultados da análise.
-    """
-    # --- Monta o conteúdo HTML do relatório ---
-    sorted_segments = sorted(result.segments, key=lambda s: article_text.find(s.text))
-    display_text = article_text
-
-    for seg in reversed(sorted_segments):
-        if seg.text in display_text:
-            score = seg.score
-            if score > 0.4:
-                bg_color = "rgba(255, 76, 76, 0.3)"
-            elif score > 0.3:
-                bg_color = "rgba(255, 165, 0, 0.3)"
-            else:
-                bg_color = "rgba(255, 255, 0, 0.4)"
-
-            text_html = seg.text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-            replacement = f'<span style="background-color: {bg_color}; padding: 1px 3px; border-radius: 3px;">{text_html}</span>'
-            display_text = display_text.replace(seg.text, replacement, 1)
-
-    link_html = f'<p><strong>Source:</strong> <a href="{content_url}">{content_url}</a></p>' if content_url else ""
-
-    html_content = f"""
-    <html>
-        <head>
-            <meta charset="UTF-8">
-            <style>
-                body {{ font-family: sans-serif; line-height: 1.6; color: #333; }}
-                h1, h2, h3 {{ color: #000; }}
-                hr {{ border: 0; border-top: 1px solid #ccc; }}
-                .summary-box {{ border: 1px solid #ddd; padding: 15px; margin: 20px 0; border-radius: 5px; background-color: #f9f9f9; }}
-                .score-label {{ font-weight: bold; }}
-                .article-text {{ white-space: pre-wrap; word-wrap: break-word; }}
-            </style>
-        </head>
-        <body>
-            <h1>Bias Analysis Report</h1>
-            <h2>{result.article_title}</h2>
-            {link_html}
-            <hr>
-            
-            <div class="summary-box">
-                <h3>Analysis Summary</h3>
-                <p><span class="score-label">Overall Bias Score:</span> {result.overall_score:.2f} (Score per 1000 words)</p>
-                <p><span class="score-label">Biased Segments Found:</span> {len(result.segments)}</p>
-            </div>
-
-            <h3>Article Text with Highlights</h3>
-            <div class="article-text">{display_text.replace(chr(10), '<br>')}</div>
-        </body>
-    </html>
-    """
-    # --- Converte o HTML para PDF em memória ---
-    return HTML(string=html_content).write_pdf()
+HIGHLIGHT_STYLES = """
+<style>
+.tooltip { position: relative; display: inline-block; cursor: pointer; border-bottom: 1px dotted black; }
+.tooltip .tooltiptext { visibility: hidden; width: 250px; background-color: #555; color: #fff; text-align: center; border-radius: 6px; padding: 8px; position: absolute; z-index: 1; bottom: 125%; left: 50%; margin-left: -125px; opacity: 0; transition: opacity 0.3s; }
+.tooltip .tooltiptext::after { content: ""; position: absolute; top: 100%; left: 50%; margin-left: -5px; border-width: 5px; border-style: solid; border-color: #555 transparent transparent transparent; }
+.tooltip:hover .tooltiptext { visibility: visible; opacity: 1; }
+</style>
+"""
+
+def render_tooltip_segment(text_html: str, seg) -> str:
+    bg_color = score_color(seg.score, 0.4)
+    reason_html = html.escape(seg.reason or "")
+    return (f'<span class="tooltip" style="background-color: {bg_color}; padding: 2px 0; border-radius: 3px;">'
+            f'{text_html}'
+            f'<span class="tooltiptext"><b>Reason:</b> {reason_html}<br><b>Score:</b> {seg.score:.2f}</span>'
+            f'</span>')
 
 def display_highlighted_text(full_text: str, biased_segments: list):
     """
     Exibe o texto completo no Streamlit, destacando os segmentos tendenciosos.
     """
-    sorted_segments = sorted(biased_segments, key=lambda s: full_text.find(s.text))
-    
-    st.markdown("""
-    <style>
-    .tooltip { position: relative; display: inline-block; cursor: pointer; border-bottom: 1px dotted black; }
-    .tooltip .tooltiptext { visibility: hidden; width: 250px; background-color: #555; color: #fff; text-align: center; border-radius: 6px; padding: 8px; position: absolute; z-index: 1; bottom: 125%; left: 50%; margin-left: -125px; opacity: 0; transition: opacity 0.3s; }
-    .tooltip .tooltiptext::after { content: ""; position: absolute; top: 100%; left: 50%; margin-left: -5px; border-width: 5px; border-style: solid; border-color: #555 transparent transparent transparent; }
-    .tooltip:hover .tooltiptext { visibility: visible; opacity: 1; }
-    </style>
-    """, unsafe_allow_html=True)
-
-    display_text = full_text
-    for seg in reversed(sorted_segments):
-        if seg.text in display_text:
-            score = seg.score
-            bg_color = "rgba(255, 255, 0, 0.4)" # Amarelo claro
-            if score > 0.4: bg_color = "rgba(255, 76, 76, 0.4)" # Vermelho claro
-            elif score > 0.3: bg_color = "rgba(255, 165, 0, 0.4)" # Laranja claro
-            
-            reason_html = seg.reason.replace('"', '&quot;')
-            text_html = seg.text.replace('"', '&quot;')
-            replacement = (f'<span class="tooltip" style="background-color: {bg_color}; padding: 2px 0; border-radius: 3px;">'
-                           f'{text_html}'
-                           f'<span class="tooltiptext"><b>Reason:</b> {reason_html}<br><b>Score:</b> {score:.2f}</span>'
-                           f'</span>')
-            display_text = display_text.replace(seg.text, replacement, 1)
-
+    st.markdown(HIGHLIGHT_STYLES, unsafe_allow_html=True)
+    display_text = render_highlighted(full_text, biased_segments, render_tooltip_segment)
     st.markdown(f'<div style="line-height: 1.8;">{display_text}</div>', unsafe_allow_html=True)
 
-def display_analysis_results(result: AnalysisResult, original_text: str, detector: HybridBiasDetector, content_url: str = None):
+def display_analysis_results(result: AnalysisResult, original_text: str, detector: BiasDetectionService, content_url: str = None):
     """Função reutilizável para exibir todos os resultados da análise."""
     st.subheader("Bias Analysis Dashboard")
     col1, col2 = st.columns(2)
@@ -121,15 +63,150 @@ def display_analysis_results(result: AnalysisResult, original_text: str, detecto
     
     st.markdown(f'<div style="background-color: {color}; padding: 10px; border-radius: 5px; margin-bottom: 20px;"><strong>📊 Bias Summary:</strong> {summary}</div>', unsafe_allow_html=True)
 
-    st.subheader("Article Text with Bias Highlights")
-    st.info("Hover over a highlighted segment to see the reason for the flag.")
-    display_highlighted_text(original_text, result.segments)
+    # A renderização entra no detalhamento de tempos junto com as etapas da análise
+    timings = Timings(result.timings)
+    with metrics.timings(timings):
+        st.subheader("Article Text with Bias Highlights")
+        st.info("Hover over a highlighted segment to see the reason for the flag.")
+        display_highlighted_text(original_text, result.segments)
 
     st.divider()
     st.subheader("📄 Download Report")
-    pdf_bytes = create_pdf_report(result, original_text, content_url)
-    safe_title = "".join(c for c in result.article_title if c.isalnum() or c in (' ', '_')).rstrip()
-    st.download_button(label="📥 Download PDF Report", data=pdf_bytes, file_name=f"Bias_Report_{safe_title}.pdf", mime="application/pdf")
+    display_pdf_report(result, original_text, content_url)
+
+    if st.session_state.get("show_timings") and timings.stages:
+        display_timings(timings.stages)
+
+def display_pdf_report(result: AnalysisResult, original_text: str, content_url: str = None):
+    """
+    O PDF só é gerado quando pedido, em segundo plano (a página não espera por
+    ele), e fica em cache: num rerun do mesmo artigo o download aparece na hora.
+    """
+    reports = default_report_service()
+    future = reports.peek(result, original_text, content_url)
+    if future is None:
+        if not st.button("📄 Generate PDF Report"):
+            return
+        future = reports.submit(result, original_text, content_url)
+    if future.done():
+        show_pdf_download(future, result.article_title)
+    else:
+        wait_for_pdf(future, result.article_title)
+
+@st.fragment(run_every=1.0)
+def wait_for_pdf(future, article_title: str):
+    """Atualiza apenas este trecho da página, a cada segundo, até o PDF ficar pronto."""
+    if not future.done():
+        st.info("⏳ Generating the PDF report in the background...")
+        return
+    show_pdf_download(future, article_title)
+
+def show_pdf_download(future, article_title: str):
+    if future.exception() is not None:
+        st.error(f"Could not generate the PDF report: {future.exception()}")
+        return
+    safe_title = "".join(c for c in article_title if c.isalnum() or c in (' ', '_')).rstrip()
+    st.download_button(label="📥 Download PDF Report", data=future.result(), file_name=f"Bias_Report_{safe_title}.pdf", mime="application/pdf")
+
+def display_timings(stages: Dict[str, float]):
+    """Tabela com o tempo de cada etapa (as etapas aninhadas também aparecem em 'analysis')."""
+    with st.expander("⏱️ Timing breakdown", expanded=True):
+        rows = sorted(stages.items(), key=lambda item: item[1], reverse=True)
+        st.table([{"Stage": stage, "Time (ms)": f"{seconds * 1000:.1f}"} for stage, seconds in rows])
+
+def run_streaming_analysis(use_case: MultilingualAnalyzeArticleUseCase, article: Article,
+                           timings: Optional[Dict[str, float]] = None) -> AnalysisResult:
+    """
+    Executa a análise em blocos, atualizando a barra de progresso e os destaques
+    a cada bloco, e devolve o AnalysisResult completo ao final.
+    `timings` são etapas já medidas antes da análise (ex.: a busca do artigo).
+    """
+    progress_bar = st.progress(0.0, text="Analyzing article...")
+    preview = st.empty()
+    # Cada bloco acrescenta só o trecho recém-analisado à prévia (o texto já exibido não é reenviado)
+    preview_box = preview.container()
+    preview_box.markdown(HIGHLIGHT_STYLES, unsafe_allow_html=True)
+    rendered_until = 0
+    segments = []
+    overall_score = 0.0
+    stages = dict(timings or {})
+
+    for update in use_case.execute_stream(article):
+        segments.extend(update.segments)
+        overall_score = update.overall_score
+        stages.update(update.timings)
+        progress_bar.progress(
+            update.processed_sentences / max(update.total_sentences, 1),
+            text=f"Analyzed {update.processed_sentences}/{update.total_sentences} sentences "
+                 f"(running score: {overall_score:.2f})"
+        )
+        if update.processed_chars > rendered_until:
+            chunk_html = render_highlighted_range(article.content, update.segments, render_tooltip_segment,
+                                                  rendered_until, update.processed_chars)
+            preview_box.markdown(f'<div style="line-height: 1.8;">{chunk_html}</div>', unsafe_allow_html=True)
+            rendered_until = update.processed_chars
+
+    progress_bar.empty()
+    preview.empty()
+    return AnalysisResult(segments=segments, overall_score=overall_score, article_title=article.title,
+                          timings=stages)
+
+def analyze_article(use_case: MultilingualAnalyzeArticleUseCase, article: Article, cache_key: str,
+                    timings: Optional[Dict[str, float]] = None) -> AnalysisResult:
+    """
+    Devolve a análise do cache do processo (compartilhado entre reruns e sessões)
+    ou a executa com progresso e a guarda.
+    """
+    cache = load_result_cache()
+    result = cache.get(cache_key)
+    if result is not None:
+        st.caption("⚡ Served from the analysis cache.")
+        return result
+    result = run_streaming_analysis(use_case, article, timings)
+    # Em forma colunar no cache: referencia o texto do artigo em vez de copiar cada sentença
+    cache.put(cache_key, result.compact(article.content))
+    return result
+
+def create_detector(language: str = "en", kind: str = "hybrid") -> BiasDetectionService:
+    """
+    Com NUVIA_API_URL definido, a interface é só um cliente do `nuvia-serve`
+    (os modelos ficam no servidor, compartilhados por todas as sessões, e o
+    servidor escolhe o detector do idioma).
+    Sem ele, o processo carrega um detector por idioma, compartilhado
+    por todas as sessões através de um MicroBatchingDetector: as chamadas
+    simultâneas viram lotes em uma única thread, sem disputar o modelo.
+    """
+    api_url = os.environ.get("NUVIA_API_URL")
+    if api_url:
+        from nuvia.adapters.serving.remote_bias_detector import RemoteBiasDetector
+        return RemoteBiasDetector(api_url, language=language)
+    import functools
+    from nuvia.adapters.nlp.detector_registry import create_language_detector
+    from nuvia.adapters.serving.micro_batching_detector import MicroBatchingDetector
+    return MicroBatchingDetector(functools.partial(create_language_detector, language, kind), pool_size=1)
+
+@st.cache_resource
+def load_registry() -> DetectorRegistry:
+    """
+    Detectores do processo, um por idioma, carregados no primeiro uso e
+    reaproveitados por todas as sessões. Os idiomas menos usados são
+    descarregados quando a soma passa de NUVIA_MODEL_MEMORY_MB.
+    """
+    return DetectorRegistry(memory_budget_bytes=model_memory_budget(), factory=create_detector)
+
+def load_detector(language: str = "en") -> BiasDetectionService:
+    with st.spinner("Loading models..."):
+        return load_registry().detector(language)
+
+@st.cache_resource
+def load_result_cache() -> AnalysisResultCache:
+    max_mb = int(os.environ.get("NUVIA_RESULT_CACHE_MB", "256"))
+    return AnalysisResultCache(max_bytes=max_mb * 1024 * 1024)
+
+@st.cache_data(ttl=300, show_spinner="Fetching article...")
+def fetch_article(title: str, language: str = "en"):
+    """Artigo da Wikipedia, reaproveitado por 5 minutos entre reruns e sessões."""
+    return default_scraper(language).fetch_article(title)
 
 # ==============================================================================
 # FUNÇÃO PRINCIPAL DA APLICAÇÃO
@@ -138,21 +215,17 @@ def display_analysis_results(result: AnalysisResult, original_text: str, detecto
 def launch_app():
     st.set_page_config(page_title="Wikipedia Bias Analyzer", layout="wide")
     st.title("🧠 Wikipedia Bias Analyzer")
-    st.markdown("This app detects biased segments in English Wikipedia articles or custom text.")
-    with st.spinner("Loading Models"):
-        # --- Inicialização dos componentes ---
-        if 'detector' not in st.session_state:
-            st.session_state.detector = HybridBiasDetector()
-        if 'use_case' not in st.session_state:
-            st.session_state.use_case = AnalyzeArticleUseCase(st.session_state.detector)
-    
-    detector = st.session_state.detector
-    use_case = st.session_state.use_case
+    st.markdown("This app detects biased segments in Wikipedia articles or custom text.")
+    language = st.sidebar.selectbox("Language", list(LANGUAGES), key="language")
+    # --- Inicialização dos componentes (uma vez por processo e idioma) ---
+    detector = load_detector(language)
+    use_case = MultilingualAnalyzeArticleUseCase(load_detector)
+    st.sidebar.checkbox("Show timing breakdown", key="show_timings")
 
     mode = st.radio("Input mode", ["Search on Wikipedia", "Insert Text Manually"])
 
     if mode == "Search on Wikipedia":
-        wiki_scrap = WikipediaScraper()
+        wiki_scrap = default_scraper(language)
         title = st.text_input("🔍 Search for a topic (e.g., Artificial Intelligence):")
         
         if st.button("Search"):
@@ -165,12 +238,16 @@ def launch_app():
         if 'results' in st.session_state and st.session_state.results:
             selected_title = st.selectbox("Choose an article:", st.session_state.results)
             if selected_title:
-                with st.spinner("Fetching and analyzing article... Please wait."):
-                    content = wiki_scrap.fetch_article(selected_title)
-                    if content:
-                        article = Article(title=content['title'], content=content['text'])
-                        result: AnalysisResult = use_case.execute(article)
-                    else: result = None
+                with metrics.timings() as fetch_timings:
+                    content = fetch_article(selected_title, language)
+                if content:
+                    article = Article(title=content['title'], content=content['text'], language=language)
+                    cache_key = analysis_cache_key(
+                        detector, "wikipedia", wiki_scrap.language, content['title'],
+                        content.get('revision_id') or text_fingerprint(content['text']),
+                    )
+                    result: AnalysisResult = analyze_article(use_case, article, cache_key, fetch_timings.stages)
+                else: result = None
                 
                 if content and result:
                     display_analysis_results(result, content['text'], detector, content['url'])
@@ -184,14 +261,20 @@ def launch_app():
         text_area = st.text_area("Paste the text you want to analyze here:", height=250)
         if st.button("Analyze Text"):
             if text_area:
-                with st.spinner("Analyzing text..."):
-                    article = Article(title="Custom Text Analysis", content=text_area)
-                    result: AnalysisResult = use_case.execute(article)
+                article = Article(title="Custom Text Analysis", content=text_area, language=language)
+                cache_key = analysis_cache_key(detector, "text", language, text_fingerprint(text_area))
+                result: AnalysisResult = analyze_article(use_case, article, cache_key)
+                # Guardado na sessão: os reruns seguintes (ex.: o botão do PDF) não passam pelo "Analyze Text"
+                st.session_state.text_analysis = (result, text_area)
                 st.success("Analysis complete!")
-                display_analysis_results(result, text_area, detector)
             else:
+                st.session_state.pop("text_analysis", None)
                 st.warning("Please paste some text to analyze.")
 
+        if "text_analysis" in st.session_state:
+            result, analyzed_text = st.session_state.text_analysis
+            display_analysis_results(result, analyzed_text, detector)
+
 def main():
     file_path = os.path.abspath(__file__)
     subprocess.run(["streamlit", "run", file_path] + sys.argv[1:])
@@ -0,0 +1,74 @@
+# interface/warmup_cli.py
+"""
+Baixa e serializa de antemão todos os artefatos usados pelos detectores
+(corpora do NLTK, modelos do Hugging Face, artefatos dos backends otimizados e
+embeddings de referência) em um diretório de cache local, para todos os
+idiomas de `languages.LANGUAGES` (ou só os de `--languages`).
+
+Depois disso a aplicação pode rodar com NUVIA_OFFLINE=1, sem acessar a rede.
+
+Exemplos:
+    nuvia-warmup
+    nuvia-warmup --cache-dir /opt/nuvia_cache --backends pytorch onnx
+    nuvia-warmup --languages en pt
+"""
+import argparse
+import os
+import time
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-fetch and cache all NLP artifacts used by nuvia.")
+    parser.add_argument("--cache-dir", help="Cache directory (default: $NUVIA_CACHE_DIR or ~/.cache/nuvia).")
+    parser.add_argument("--backends", nargs="+", default=["pytorch"],
+                        help="Subjectivity model backends to prepare (pytorch, onnx, onnx-int8, torch-int8).")
+    parser.add_argument("--skip-embedding", action="store_true", help="Skip the sentence-transformers models.")
+    parser.add_argument("--languages", nargs="+", help="Languages to prepare (default: all supported).")
+    args = parser.parse_args()
+
+    if args.cache_dir:
+        os.environ["NUVIA_CACHE_DIR"] = args.cache_dir
+    # O warm-up precisa da rede, mesmo que o ambiente esteja configurado como offline
+    os.environ.pop("NUVIA_OFFLINE", None)
+
+    # Imports depois de configurar o ambiente: os caminhos de cache são lidos na carga
+    from nuvia.adapters.nlp.resources import NLTK_RESOURCES, configure_model_cache, default_cache_dir, ensure_nltk_resource
+    from nuvia.adapters.nlp.languages import LANGUAGES
+    from nuvia.adapters.nlp.subjectivity_backends import load_subjectivity_pipeline
+    from nuvia.adapters.nlp.tokenizers import PunktTokenizer
+
+    unknown = set(args.languages or ()) - set(LANGUAGES)
+    if unknown:
+        parser.error(f"unsupported languages: {', '.join(sorted(unknown))} (choose from {', '.join(LANGUAGES)})")
+    profiles = [LANGUAGES[code] for code in args.languages or LANGUAGES]
+
+    configure_model_cache()
+    print(f"Cache directory: {default_cache_dir()}")
+
+    start = time.perf_counter()
+    for name in NLTK_RESOURCES:
+        ensure_nltk_resource(name)
+    for profile in profiles:
+        PunktTokenizer(profile.nltk_name).span_tokenize("Warm-up.")  # Carrega o modelo Punkt do idioma
+    print(f"NLTK resources ready ({time.perf_counter() - start:.1f}s)")
+
+    # A mesma ordem dos perfis, sem repetir modelos compartilhados entre idiomas
+    subjectivity_models = list(dict.fromkeys(p.subjectivity_model for p in profiles if p.subjectivity_model))
+    for model_name in subjectivity_models:
+        for backend in args.backends:
+            start = time.perf_counter()
+            load_subjectivity_pipeline(backend, model_name)
+            print(f"Subjectivity model '{model_name}' ready for backend '{backend}' "
+                  f"({time.perf_counter() - start:.1f}s)")
+
+    if not args.skip_embedding:
+        from nuvia.adapters.nlp.embedding_bias_detector import EmbeddingBiasDetector
+        for model_name in dict.fromkeys(p.embedding_model for p in profiles):
+            start = time.perf_counter()
+            EmbeddingBiasDetector(model_name=model_name).warm_up()
+            print(f"Embedding model '{model_name}' and reference embeddings ready "
+                  f"({time.perf_counter() - start:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
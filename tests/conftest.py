@@ -0,0 +1,36 @@
+# tests/conftest.py
+"""
+Fixtures compartilhadas. Os modelos e os léxicos do NLTK são substituídos pelos
+stubs determinísticos de `nuvia.benchmarks.fixtures`, e a segmentação usa o
+RegexTokenizer: a suíte roda offline, sem baixar nada.
+"""
+import pytest
+
+from nuvia.adapters.nlp.hybrid_bias_detector import HybridBiasDetector
+from nuvia.adapters.nlp.tokenizers import RegexTokenizer
+from nuvia.benchmarks.fixtures import StubSubjectivityPipeline
+
+
+def segment_tuples(segments):
+    return [(seg.text, seg.reason, seg.score, seg.start, seg.end) for seg in segments]
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Nenhum teste escreve no cache do usuário."""
+    monkeypatch.setenv("NUVIA_CACHE_DIR", str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def make_detector():
+    def make(**options) -> HybridBiasDetector:
+        options.setdefault("subjectivity_model", StubSubjectivityPipeline())
+        options.setdefault("tokenizer", RegexTokenizer())
+        return HybridBiasDetector(**options)
+    return make
+
+
+@pytest.fixture
+def detector(make_detector) -> HybridBiasDetector:
+    return make_detector()
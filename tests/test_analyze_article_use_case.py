@@ -0,0 +1,31 @@
+# tests/test_analyze_article_use_case.py
+import pytest
+from conftest import segment_tuples
+
+from nuvia.application.use_cases.analyze_article_use_case import AnalyzeArticleUseCase
+from nuvia.benchmarks.fixtures import synthetic_article
+from nuvia.domain.entities.article import Article
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 32, 10_000])
+def test_stream_matches_execute(detector, chunk_size):
+    article = Article("Synthetic", synthetic_article("medium"))
+    full = AnalyzeArticleUseCase(detector).execute(article)
+
+    progress = list(AnalyzeArticleUseCase(detector).execute_stream(article, chunk_size=chunk_size))
+
+    streamed = [seg for item in progress for seg in item.segments]
+    assert segment_tuples(streamed) == segment_tuples(full.segments)
+    assert progress[-1].done
+    assert progress[-1].overall_score == full.overall_score
+    assert progress[-1].processed_chars == len(article.content)
+    chars = [item.processed_chars for item in progress]
+    assert chars == sorted(chars)
+    for item in progress:
+        assert all(seg.end <= item.processed_chars for seg in item.segments)
+
+
+def test_stream_of_an_empty_article(detector):
+    progress = list(AnalyzeArticleUseCase(detector).execute_stream(Article("Empty", "")))
+
+    assert len(progress) == 1 and progress[0].done and progress[0].segments == []
@@ -0,0 +1,55 @@
+# tests/test_batch_analysis.py
+import os
+
+from conftest import segment_tuples
+
+from nuvia.adapters.nlp.hybrid_bias_detector import HybridBiasDetector
+from nuvia.adapters.nlp.tokenizers import RegexTokenizer
+from nuvia.application.use_cases.analyze_article_use_case import AnalyzeArticleUseCase
+from nuvia.application.use_cases.batch_analysis_use_case import BatchAnalysisUseCase, BatchItem
+from nuvia.benchmarks.fixtures import StubSubjectivityPipeline, synthetic_article
+from nuvia.domain.entities.article import Article
+
+
+def stub_detector() -> HybridBiasDetector:
+    return HybridBiasDetector(subjectivity_model=StubSubjectivityPipeline(), tokenizer=RegexTokenizer())
+
+
+class PoisonedDetector(HybridBiasDetector):
+    """Derruba o processo do worker ao encontrar a palavra POISON."""
+    def __init__(self):
+        super().__init__(subjectivity_model=StubSubjectivityPipeline(), tokenizer=RegexTokenizer())
+
+    def detect_sentences(self, sentences, words=None):
+        if any("POISON" in sentence for sentence in sentences):
+            os._exit(1)
+        return super().detect_sentences(sentences, words=words)
+
+
+def test_batch_records_match_single_analysis():
+    texts = {f"a{i}": synthetic_article("small") + f" Closing sentence {i}." for i in range(6)}
+    use_case = BatchAnalysisUseCase(stub_detector, workers=2)
+
+    records = {record["id"]: record for record in use_case.execute(
+        BatchItem(item_id, item_id, text=text) for item_id, text in texts.items())}
+
+    reference = AnalyzeArticleUseCase(stub_detector())
+    for item_id, text in texts.items():
+        expected = reference.execute(Article(item_id, text))
+        record = records[item_id]
+        assert record["status"] == "ok" and record["attempts"] == 1
+        assert record["overall_score"] == expected.overall_score
+        assert [tuple(seg.values()) for seg in record["segments"]] == segment_tuples(expected.segments)
+
+
+def test_worker_crash_is_charged_only_to_the_poisoned_item():
+    items = [BatchItem(f"a{i}", f"Article {i}", text=f"A plain sentence number {i}.") for i in range(6)]
+    items.insert(2, BatchItem("poison", "Poison", text="This sentence is POISON."))
+    use_case = BatchAnalysisUseCase(PoisonedDetector, workers=2, max_retries=2)
+
+    records = {record["id"]: record for record in use_case.execute(items)}
+
+    assert records["poison"]["status"] == "error"
+    assert records["poison"]["attempts"] == 3
+    assert all(records[f"a{i}"]["status"] == "ok" for i in range(6))
+    assert all(records[f"a{i}"]["attempts"] == 1 for i in range(6))
@@ -0,0 +1,42 @@
+# tests/test_cascade_bias_detector.py
+import pytest
+from conftest import segment_tuples
+
+from nuvia.adapters.nlp.cascade_bias_detector import CascadeBiasDetector, CascadeCalibration
+from nuvia.benchmarks.fixtures import FIXTURE_ARTICLE, StubSubjectivityPipeline, stub_lexicons, synthetic_article
+from nuvia.interface.batch_cli import build_detector
+
+
+def test_cascade_without_screening_matches_the_wrapped_detector(make_detector):
+    lexicons = stub_lexicons()
+    detector = make_detector()
+    cascade = CascadeBiasDetector(detector, screen_threshold=0.0, lexicons=lexicons)
+    text = synthetic_article("medium")
+
+    assert segment_tuples(cascade.detect(text)) == segment_tuples(detector.detect(text))
+
+
+def test_cascade_calibration_meets_the_target_recall(make_detector):
+    lexicons = stub_lexicons()
+    model = StubSubjectivityPipeline(cue_words=lexicons.positive_words | lexicons.negative_words)
+    cascade = CascadeBiasDetector(make_detector(subjectivity_model=model), lexicons=lexicons)
+    held_out = [synthetic_article("medium"), FIXTURE_ARTICLE]
+
+    calibration = cascade.calibrate(held_out, target_recall=0.9)
+
+    assert calibration.positives > 0
+    assert calibration.recall >= 0.9
+    assert cascade.screen_threshold == calibration.screen_threshold
+
+
+def test_calibration_round_trips_through_json(make_detector, tmp_path):
+    cascade = CascadeBiasDetector(make_detector(), lexicons=stub_lexicons())
+    calibration = cascade.calibrate([FIXTURE_ARTICLE], target_recall=0.8)
+    calibration.save(tmp_path / "cascade.json")
+
+    assert CascadeCalibration.load(tmp_path / "cascade.json") == calibration
+
+
+def test_cascade_is_rejected_outside_english():
+    with pytest.raises(ValueError, match="no screening lexicon"):
+        build_detector("cascade", language="pt")
@@ -0,0 +1,124 @@
+# tests/test_detector_registry.py
+import gc
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from conftest import segment_tuples
+
+from nuvia.adapters.nlp import detector_registry
+from nuvia.adapters.nlp.detector_registry import DetectorRegistry
+from nuvia.adapters.serving.micro_batching_detector import MicroBatchingDetector
+from nuvia.application.use_cases.analyze_article_use_case import AnalyzeArticleUseCase
+from nuvia.application.use_cases.multilingual_analysis_use_case import MultilingualAnalyzeArticleUseCase
+from nuvia.benchmarks.fixtures import synthetic_article
+from nuvia.domain.entities.article import Article
+
+MODEL_BYTES = 100
+
+
+@pytest.fixture
+def fake_memory(monkeypatch):
+    """Cada detector criado "ocupa" MODEL_BYTES na memória medida pelo registro."""
+    memory = {"rss": 0}
+    monkeypatch.setattr(detector_registry, "current_rss_bytes", lambda: memory["rss"])
+    return memory
+
+
+@pytest.fixture
+def registry_factory(make_detector, fake_memory):
+    def make(budget: int, pooled: bool = False) -> DetectorRegistry:
+        def factory(language, kind):
+            fake_memory["rss"] += MODEL_BYTES
+            if pooled:
+                return MicroBatchingDetector(make_detector, max_wait=0.001)
+            return make_detector()
+        return DetectorRegistry(memory_budget_bytes=budget, factory=factory)
+    return make
+
+
+def test_least_recently_used_detector_is_evicted(registry_factory):
+    registry = registry_factory(budget=2 * MODEL_BYTES)
+    en = registry.detector("en")
+    registry.detector("pt")
+    assert registry.detector("en") is en  # "en" passa a ser o mais recente
+
+    registry.detector("es")
+
+    assert list(registry.loaded()) == [("en", "hybrid"), ("es", "hybrid")]
+    assert registry.stats.loads == 3 and registry.stats.evictions == 1 and registry.stats.hits == 1
+    assert registry.used_bytes == 2 * MODEL_BYTES
+
+
+def test_last_loaded_detector_stays_over_budget(registry_factory):
+    registry = registry_factory(budget=MODEL_BYTES // 2)
+    registry.detector("en")
+    pt = registry.detector("pt")
+
+    assert list(registry.loaded()) == [("pt", "hybrid")]
+    assert registry.detector("pt") is pt
+
+
+def test_evicted_detector_keeps_serving_its_users(registry_factory):
+    registry = registry_factory(budget=MODEL_BYTES, pooled=True)
+    en = registry.detector("en")
+    registry.detector("pt")
+
+    assert ("en", "hybrid") not in registry.loaded()
+    sentences = ["It is widely considered the best design.", "The file has ten lines."]
+    assert len(en.detect_sentences(sentences)) == 2
+
+
+def test_dropped_micro_batching_detector_stops_its_threads(registry_factory):
+    registry = registry_factory(budget=MODEL_BYTES, pooled=True)
+    threads = registry.detector("en")._threads
+
+    registry.detector("pt")
+    gc.collect()
+
+    for thread in threads:
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+
+
+def test_explicit_evict(registry_factory):
+    registry = registry_factory(budget=10 * MODEL_BYTES)
+    registry.detector("en")
+    registry.detector("pt")
+
+    registry.evict("en")
+
+    assert list(registry.loaded()) == [("pt", "hybrid")]
+
+
+def test_concurrent_requests_load_each_detector_once(registry_factory):
+    registry = registry_factory(budget=10 * MODEL_BYTES)
+    barrier = threading.Barrier(8)
+
+    def resolve(_):
+        barrier.wait()
+        return registry.detector("en")
+
+    with ThreadPoolExecutor(8) as pool:
+        detectors = list(pool.map(resolve, range(8)))
+
+    assert registry.stats.loads == 1
+    assert all(detector is detectors[0] for detector in detectors)
+
+
+def test_multilingual_use_case_routes_by_article_language(make_detector):
+    detectors = {"en": make_detector(), "pt": make_detector(threshold=0.9)}
+    requested = []
+
+    def detector_for(language):
+        requested.append(language)
+        return detectors[language]
+
+    use_case = MultilingualAnalyzeArticleUseCase(detector_for)
+    text = synthetic_article("small")
+    results = {lang: use_case.execute(Article("Routed", text, language=lang)) for lang in ("pt", "en")}
+
+    assert requested == ["pt", "en"]
+    for lang, result in results.items():
+        expected = AnalyzeArticleUseCase(detectors[lang]).execute(Article("Routed", text))
+        assert segment_tuples(result.segments) == segment_tuples(expected.segments)
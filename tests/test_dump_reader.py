@@ -0,0 +1,83 @@
+# tests/test_dump_reader.py
+import pytest
+
+from nuvia.adapters.wikipedia.dump_reader import DumpCheckpoint, DumpFilter, iter_dump_pages, open_dump
+from nuvia.benchmarks.synthetic_dump import write_synthetic_dump
+
+PAGES = 30
+
+
+@pytest.fixture(params=[".xml", ".xml.bz2"])
+def dump_path(request, tmp_path):
+    return write_synthetic_dump(tmp_path / f"dump{request.param}", pages=PAGES, ai_every=5, sentences=6)
+
+
+def read_pages(path, **options):
+    with open_dump(path, decompressor="builtin") as stream:
+        return list(iter_dump_pages(stream, **options))
+
+
+def test_dump_yields_only_articles(dump_path):
+    pages = read_pages(dump_path)
+
+    assert [page.title for page in pages] == [f"Article {i}" for i in range(PAGES)]
+    ids = [page.page_id for page in pages]
+    assert ids == sorted(ids)
+    assert all(page.revision_id == page.page_id * 10 for page in pages)
+
+
+def test_dump_text_is_plain_text(dump_path):
+    page = read_pages(dump_path)[0]
+
+    assert page.text.startswith("Article 0 is about learning machines.")
+    assert "[[" not in page.text and "{{" not in page.text and "<ref>" not in page.text
+    assert page.categories == ["Artificial intelligence"]
+
+
+def test_redirects_and_other_namespaces_are_opt_in(dump_path):
+    pages = read_pages(dump_path, namespaces=(0, 14), skip_redirects=False)
+
+    assert sum(page.title.startswith("Redirect") for page in pages) == 3
+    assert sum(page.title.startswith("Category:") for page in pages) == 3
+
+
+def test_filter_by_category_or_title(dump_path):
+    pages = read_pages(dump_path)
+
+    by_category = [page.title for page in pages if DumpFilter(categories=["artificial_intelligence"]).matches(page)]
+    by_either = [page for page in pages if DumpFilter(title_pattern=r"^Article 1\d$",
+                                                      categories=["Artificial intelligence"]).matches(page)]
+
+    assert by_category == [f"Article {i}" for i in range(0, PAGES, 5)]
+    assert len(by_either) == len(by_category) + 8  # Article 10..19, menos 10 e 15 (já na categoria)
+
+
+def test_checkpoint_waits_for_earlier_pages(tmp_path):
+    checkpoint = DumpCheckpoint(tmp_path / "checkpoint.json", save_every=100)
+    for page_id in (1, 2, 3):
+        checkpoint.issued(page_id)
+
+    checkpoint.done(2)
+    assert checkpoint.last_page_id is None
+    checkpoint.done(1)
+    assert checkpoint.last_page_id == 2
+    checkpoint.done(3)
+    assert checkpoint.last_page_id == 3
+
+
+def test_checkpoint_resume_skips_processed_pages(dump_path, tmp_path):
+    path = tmp_path / "checkpoint.json"
+    pages = read_pages(dump_path)
+    checkpoint = DumpCheckpoint(path, save_every=4)
+    for page in pages[:10]:
+        checkpoint.issued(page.page_id)
+        checkpoint.done(page.page_id)
+    # Só as 8 primeiras páginas chegaram ao arquivo (save_every=4)
+    assert checkpoint.last_page_id == pages[9].page_id
+
+    resumed = DumpCheckpoint(path)
+    remaining = read_pages(dump_path, after_page_id=resumed.last_page_id)
+
+    assert resumed.processed == 8
+    assert resumed.last_page_id == pages[7].page_id
+    assert [page.title for page in remaining] == [page.title for page in pages[8:]]
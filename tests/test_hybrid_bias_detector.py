@@ -0,0 +1,117 @@
+# tests/test_hybrid_bias_detector.py
+import re
+
+import pytest
+from conftest import segment_tuples
+
+from nuvia.adapters.nlp.tokenizers import PunktTokenizer
+from nuvia.benchmarks.fixtures import FIXTURE_ARTICLE, synthetic_article
+
+
+class FixedScorePipeline:
+    """Pipeline que dá o mesmo score de subjetividade a todas as entradas."""
+    def __init__(self, subjective: float):
+        self.subjective = subjective
+
+    def __call__(self, inputs, batch_size: int = 1, **kwargs):
+        labels = [{"label": "SUBJECTIVE", "score": self.subjective},
+                  {"label": "OBJECTIVE", "score": 1 - self.subjective}]
+        outputs = [sorted(labels, key=lambda d: d["score"], reverse=True)
+                   for _ in ([inputs] if isinstance(inputs, str) else inputs)]
+        return outputs
+
+
+def test_batched_inference_matches_sentence_by_sentence(make_detector):
+    text = synthetic_article("medium") + "\n\n" + FIXTURE_ARTICLE
+    batched = make_detector(batch_size=16)
+    single = make_detector(batch_size=1, sort_by_length=False)
+
+    assert segment_tuples(batched.detect(text)) == segment_tuples(single.detect(text))
+
+
+def unbatched_detect(detector, text):
+    """O laço original do detector: uma chamada ao modelo e um conjunto de tokens por sentença."""
+    document = detector.as_document(text)
+    found = []
+    for (start, end), sent in zip(document.spans, document.sentences):
+        output = detector.subjectivity_model(sent)[0][0]
+        if output["label"] == "SUBJECTIVE" and output["score"] > detector.threshold:
+            score = round(output["score"], 2)
+            found.append((sent, f"Subjective Language (Model Confidence: {score})", score, start, end, None))
+            continue
+        tokens = {word.lower() for word in detector.tokenizer.word_tokenize(sent)}
+        for category, words, score in (("Peacock Term", detector.peacock_words, 0.75),
+                                       ("Weasel Word", detector.weasel_words, 0.70)):
+            if tokens & words:
+                found.append((sent, category, score, start, end, tokens & words))
+                break
+    return found
+
+
+def test_batched_output_matches_the_unbatched_path(make_detector):
+    # Pontuação final colada às palavras do léxico ("best.", "disaster!", "perhaps?")
+    text = (FIXTURE_ARTICLE + "\n\nThe result was the best. Critics called it a disaster! "
+            "Was it perhaps? Some say it is remarkable.")
+    detector = make_detector(batch_size=16)
+
+    expected = unbatched_detect(detector, text)
+    found = detector.detect(text)
+
+    assert [seg.text for seg in found] == [item[0] for item in expected]
+    for seg, (_, reason, score, start, end, candidates) in zip(found, expected):
+        assert (seg.score, seg.start, seg.end) == (score, start, end)
+        if candidates is None:
+            assert seg.reason == reason
+        else:
+            # O original escolhia com set.pop() (ordem arbitrária); aqui vale o primeiro termo do texto
+            assert seg.reason.startswith(f"Use of '{reason}'")
+            assert seg.reason.split("': '")[1].rstrip("'") in candidates
+
+
+def test_punkt_word_tokens_match_nltk_word_tokenize():
+    nltk = pytest.importorskip("nltk")
+    try:
+        nltk.data.find("tokenizers/punkt_tab")
+    except LookupError:
+        pytest.skip("NLTK punkt_tab data is not installed")
+    sentence = "It was widely considered the best."
+
+    assert PunktTokenizer().word_tokenize(sentence) == nltk.word_tokenize(sentence)
+
+
+def test_long_sentences_use_the_detector_threshold(make_detector):
+    detector = make_detector(subjectivity_model=FixedScorePipeline(0.45), max_tokens=32, threshold=0.4)
+    sentence = " ".join(["word"] * 100) + "."
+
+    found = detector.detect_sentences([sentence])
+
+    assert detector.long_stats.windowed == 1
+    assert len(found[0]) == 1 and found[0][0].score == 0.45
+
+
+@pytest.mark.parametrize("max_tokens", [3, 5, 64])
+def test_every_token_is_covered_by_a_window(make_detector, max_tokens):
+    detector = make_detector(max_tokens=max_tokens, window_overlap=max(0, max_tokens // 2 - 1))
+    sentence = " ".join(f"w{i}" for i in range(200)) + "."
+
+    windows = list(detector._windows(sentence))
+
+    tokens = [token for window in windows for token in re.findall(r"\w+|[^\w\s]", window)]
+    assert set(tokens) == set(re.findall(r"\w+|[^\w\s]", sentence))
+    assert all(len(re.findall(r"\w+|[^\w\s]", window)) <= detector.max_tokens - 2 for window in windows)
+
+
+@pytest.mark.parametrize("options", [
+    {"max_tokens": 2},
+    {"max_tokens": 4},
+    {"max_tokens": 64, "window_overlap": -1},
+])
+def test_window_budgets_that_cannot_advance_are_rejected(make_detector, options):
+    with pytest.raises(ValueError, match="max_tokens"):
+        make_detector(**options)
+
+
+def test_truncation_accepts_the_smallest_window(make_detector):
+    detector = make_detector(max_tokens=3, long_sentences="truncate")
+
+    assert len(detector.detect_sentences(["one two three four five."])) == 1
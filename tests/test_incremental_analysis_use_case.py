@@ -0,0 +1,70 @@
+# tests/test_incremental_analysis_use_case.py
+import random
+
+from conftest import segment_tuples
+
+from nuvia.adapters.cache.analysis_snapshot_store import AnalysisSnapshotStore
+from nuvia.application.use_cases.analyze_article_use_case import AnalyzeArticleUseCase
+from nuvia.application.use_cases.incremental_analysis_use_case import IncrementalAnalyzeArticleUseCase
+from nuvia.benchmarks.corpus import SAMPLE_SENTENCES
+from nuvia.benchmarks.fixtures import FIXTURE_ARTICLE, synthetic_article
+from nuvia.domain.entities.article import Article
+
+
+def _edit(text: str, rng: random.Random) -> str:
+    """Troca, insere ou remove uma sentença de um parágrafo aleatório."""
+    paragraphs = text.split("\n\n")
+    p = rng.randrange(len(paragraphs))
+    sentences = paragraphs[p].split(". ")
+    i = rng.randrange(len(sentences))
+    action = rng.choice(["replace", "insert", "delete"])
+    new_sentence = rng.choice(SAMPLE_SENTENCES)[:-1]
+    if action == "replace":
+        sentences[i] = new_sentence
+    elif action == "insert":
+        sentences.insert(i, new_sentence)
+    elif len(sentences) > 1:
+        del sentences[i]
+    paragraphs[p] = ". ".join(sentences)
+    return "\n\n".join(paragraphs)
+
+
+def test_incremental_matches_full_analysis_across_edits(detector):
+    rng = random.Random(0)
+    full = AnalyzeArticleUseCase(detector)
+    incremental = IncrementalAnalyzeArticleUseCase(detector)
+    text = synthetic_article("medium") + "\n\n" + FIXTURE_ARTICLE
+
+    for _ in range(20):
+        article = Article("Edited", text)
+        expected = full.execute(article)
+        result = incremental.execute(article, previous=incremental.last_snapshot)
+
+        assert segment_tuples(result.segments) == segment_tuples(expected.segments)
+        assert result.overall_score == expected.overall_score
+        text = _edit(text, rng)
+
+
+def test_incremental_reuses_unchanged_sentences(detector):
+    incremental = IncrementalAnalyzeArticleUseCase(detector)
+    text = synthetic_article("medium")
+    incremental.execute(Article("Edited", text))
+
+    incremental.execute(Article("Edited", text + "\n\nA new closing paragraph."),
+                        previous=incremental.last_snapshot)
+
+    assert incremental.last_stats.analyzed_sentences == 1
+
+
+def test_snapshots_round_trip_through_the_store(detector, tmp_path):
+    store = AnalysisSnapshotStore(tmp_path / "snapshots.sqlite")
+    text = synthetic_article("medium")
+    IncrementalAnalyzeArticleUseCase(detector, store).execute(Article("Stored", text))
+
+    reloaded = IncrementalAnalyzeArticleUseCase(detector, store)
+    result = reloaded.execute(Article("Stored", text))
+
+    assert reloaded.last_stats.analyzed_sentences == 0
+    assert segment_tuples(result.segments) == segment_tuples(
+        AnalyzeArticleUseCase(detector).execute(Article("Stored", text)).segments)
+    store.close()
@@ -0,0 +1,26 @@
+# tests/test_lexicon_scorer.py
+from nuvia.adapters.nlp.lexicon_scorer import LexiconScorer
+from nuvia.adapters.nlp.tokenizers import RegexTokenizer
+from nuvia.benchmarks.fixtures import FIXTURE_ARTICLE, stub_lexicons
+from nuvia.benchmarks.lexicon_scoring import build_corpus, legacy_score
+
+
+def test_lexicon_scorer_matches_legacy_scoring():
+    lexicons = stub_lexicons()
+    scorer = LexiconScorer(*lexicons)
+    tokenizer = RegexTokenizer()
+    document_words = [tokenizer.word_tokenize(FIXTURE_ARTICLE[start:end])
+                      for start, end in tokenizer.span_tokenize(FIXTURE_ARTICLE)]
+
+    scores = scorer.score_sentences(document_words).tolist()
+
+    assert scores == [legacy_score(words, lexicons) for words in document_words]
+
+
+def test_lexicon_scorer_matches_legacy_scoring_on_a_large_vocabulary():
+    lexicons = stub_lexicons()
+    scorer = LexiconScorer(*lexicons)
+    corpus = build_corpus(20_000, vocabulary=2_000)
+
+    assert scorer.score_sentences(corpus).tolist() == [legacy_score(tokens, lexicons) for tokens in corpus]
+    assert [scorer.score(tokens) for tokens in corpus[:20]] == [legacy_score(t, lexicons) for t in corpus[:20]]
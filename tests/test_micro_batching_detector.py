@@ -0,0 +1,31 @@
+# tests/test_micro_batching_detector.py
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from conftest import segment_tuples
+
+from nuvia.adapters.serving.micro_batching_detector import MicroBatchingDetector
+from nuvia.benchmarks.fixtures import synthetic_article
+
+
+def test_micro_batching_matches_the_wrapped_detector(make_detector):
+    reference = make_detector()
+    pooled = MicroBatchingDetector(make_detector, pool_size=2, max_batch_size=16, max_wait=0.005)
+    texts = [synthetic_article("small") + f" Extra sentence {i}." for i in range(6)]
+
+    with ThreadPoolExecutor(6) as pool:
+        results = list(pool.map(pooled.detect, texts))
+    pooled.close()
+
+    for text, found in zip(texts, results):
+        assert segment_tuples(found) == segment_tuples(reference.detect(text))
+    assert pooled.stats.sentences == sum(len(reference.as_document(text)) for text in texts)
+
+
+def test_closed_micro_batching_detector_rejects_requests(make_detector):
+    pooled = MicroBatchingDetector(make_detector)
+    pooled.close()
+    pooled.close()  # Idempotente
+
+    with pytest.raises(RuntimeError):
+        pooled.detect_sentences(["Any sentence."])
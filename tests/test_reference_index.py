@@ -0,0 +1,33 @@
+# tests/test_reference_index.py
+import sys
+
+import numpy as np
+
+from nuvia.adapters.nlp.reference_index import ReferenceIndex
+from nuvia.benchmarks.corpus import SAMPLE_SENTENCES
+from nuvia.benchmarks.fixtures import StubSentenceEncoder
+
+
+def test_blockwise_search_matches_a_full_matrix_product():
+    encoder = StubSentenceEncoder(dimension=64)
+    references = encoder.encode(SAMPLE_SENTENCES)
+    queries = encoder.encode([f"Query {i}." for i in range(10)] + SAMPLE_SENTENCES[:3])
+
+    index = ReferenceIndex(references, block_size=4)
+
+    np.testing.assert_allclose(index.max_similarity(queries), (queries @ references.T).max(axis=1), rtol=1e-5)
+    np.testing.assert_allclose(index.max_similarity(queries[-3:]), 1.0, rtol=1e-5)
+
+
+def test_saved_ann_index_without_faiss_falls_back_to_exact_search(tmp_path, monkeypatch):
+    encoder = StubSentenceEncoder(dimension=64)
+    path = tmp_path / "references.npy"
+    ReferenceIndex(encoder.encode(SAMPLE_SENTENCES)).save(path)
+    # Índice aproximado gravado em uma máquina com o faiss instalado
+    path.with_suffix(".hnsw").write_bytes(b"written by faiss elsewhere")
+    monkeypatch.setitem(sys.modules, "faiss", None)  # "import faiss" levanta ImportError
+
+    index = ReferenceIndex.load(path, use_ann=True)
+
+    queries = encoder.encode(SAMPLE_SENTENCES[:2])
+    np.testing.assert_allclose(index.max_similarity(queries), 1.0, rtol=1e-5)
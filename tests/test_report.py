@@ -0,0 +1,20 @@
+# tests/test_report.py
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from nuvia.interface import report
+
+
+def test_sessions_share_a_single_report_service(monkeypatch):
+    monkeypatch.setattr(report, "_default_service", None)
+    barrier = threading.Barrier(8)
+
+    def first_call(_):
+        barrier.wait()
+        return report.default_report_service()
+
+    with ThreadPoolExecutor(8) as pool:
+        services = list(pool.map(first_call, range(8)))
+
+    assert all(service is services[0] for service in services)
+    services[0].shutdown()
@@ -0,0 +1,100 @@
+# tests/test_sentence_cache.py
+import sqlite3
+
+from conftest import segment_tuples
+
+from nuvia.adapters.cache.cached_bias_detector import CachedBiasDetector
+from nuvia.adapters.cache.sentence_result_cache import SentenceResultCache
+from nuvia.adapters.nlp import hybrid_bias_detector
+from nuvia.benchmarks.fixtures import synthetic_article
+
+
+def test_batch_reads_and_writes(tmp_path):
+    cache = SentenceResultCache(max_entries=10, db_path=tmp_path / "sentences.sqlite")
+    cache.put_many((f"k{i}", [i]) for i in range(5))
+
+    assert cache.get_many(["k1", "k3", "missing", "k1"]) == {"k1": [1], "k3": [3]}
+    assert cache.stats.hits == 2 and cache.stats.misses == 1
+
+
+def test_disk_level_survives_a_restart(tmp_path):
+    path = tmp_path / "sentences.sqlite"
+    cache = SentenceResultCache(max_entries=2, db_path=path)
+    cache.put_many((f"k{i}", {"value": i}) for i in range(5))
+    cache.close()
+
+    reopened = SentenceResultCache(max_entries=2, db_path=path)
+
+    assert reopened.get_many([f"k{i}" for i in range(5)]) == {f"k{i}": {"value": i} for i in range(5)}
+    assert reopened.stats.disk_hits == 5
+    assert len(reopened) == 2  # Só os 2 mais recentes ficam em memória
+
+
+def test_disk_limit_is_enforced_in_batches(tmp_path):
+    cache = SentenceResultCache(max_entries=1, db_path=tmp_path / "sentences.sqlite", max_disk_entries=100)
+    cache.put_many((f"k{i}", i) for i in range(250))
+
+    kept = cache.get_many(f"k{i}" for i in range(250))
+
+    assert len(kept) <= 100
+    assert "k249" in kept and "k0" not in kept
+
+
+def test_cached_detector_matches_the_wrapped_detector(detector, tmp_path):
+    cache = SentenceResultCache(db_path=tmp_path / "sentences.sqlite")
+    cached = CachedBiasDetector(detector, cache)
+    text = synthetic_article("medium")
+
+    first = cached.detect(text)
+    second = cached.detect(text)
+
+    assert segment_tuples(first) == segment_tuples(second) == segment_tuples(detector.detect(text))
+    assert cache.stats.hits == len(detector.as_document(text))
+
+
+class FailingPipeline:
+    """Pipeline que falha em toda chamada (ex.: um erro transitório de inferência)."""
+    def __call__(self, inputs, **kwargs):
+        raise RuntimeError("inference failed")
+
+    @staticmethod
+    def fail_to_load():
+        raise ImportError("No module named 'torch'")
+
+
+def disk_rows(path):
+    with sqlite3.connect(str(path)) as db:
+        return db.execute("SELECT COUNT(*) FROM sentence_results").fetchone()[0]
+
+
+def test_failed_model_load_leaves_the_disk_tier_empty(make_detector, monkeypatch, tmp_path):
+    path = tmp_path / "sentences.sqlite"
+    detector = make_detector(subjectivity_model=None)
+    monkeypatch.setattr(hybrid_bias_detector, "load_subjectivity_pipeline",
+                        lambda *args, **kwargs: FailingPipeline.fail_to_load())
+    cached = CachedBiasDetector(detector, SentenceResultCache(db_path=path))
+
+    assert cached.detect(synthetic_article("small")) == []
+    assert disk_rows(path) == 0
+
+
+def test_sentences_the_model_failed_on_are_not_cached(make_detector, tmp_path):
+    path = tmp_path / "sentences.sqlite"
+    cached = CachedBiasDetector(make_detector(subjectivity_model=FailingPipeline()),
+                                SentenceResultCache(db_path=path))
+
+    found = cached.detect("It is the best design. The file has ten lines.")
+
+    # A etapa de léxicos ainda responde, mas o resultado não vai para o cache
+    assert [seg.reason for seg in found] == ["Use of 'Peacock Term': 'best'"]
+    assert disk_rows(path) == 0
+
+
+def test_lexicon_only_detector_results_are_cached(make_detector, tmp_path):
+    path = tmp_path / "sentences.sqlite"
+    cached = CachedBiasDetector(make_detector(model_name=None, subjectivity_model=None),
+                                SentenceResultCache(db_path=path))
+
+    cached.detect("It is the best design. The file has ten lines.")
+
+    assert disk_rows(path) == 2
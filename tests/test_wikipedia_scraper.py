@@ -0,0 +1,140 @@
+# tests/test_wikipedia_scraper.py
+import threading
+
+import pytest
+import requests
+
+from nuvia.adapters.wikipedia.article_store import ArticleStore
+from nuvia.adapters.wikipedia.wikipedia_scraper import SOURCE_EXTRACT, SOURCE_WIKITEXT, WikipediaScraper
+from nuvia.benchmarks.mock_mediawiki import MockMediaWiki
+
+PAGES = {
+    "Python": "Python is a language.\n\n== History ==\nCreated in 1991.",
+    "Rust": "Rust is a language.\n\n== History ==\nFirst released in 2015.",
+    "Go": {"text": "Go is a language.", "wikitext": "'''Go''' is a [[programming language|language]]."},
+}
+
+
+@pytest.fixture
+def wiki():
+    with MockMediaWiki(PAGES, redirects={"Golang": "Go"}) as wiki:
+        yield wiki
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ArticleStore(tmp_path / "articles.sqlite")
+    yield store
+    store.close()
+
+
+def content(article):
+    """O artigo sem `fetched_at` (o store registra o próprio horário de gravação)."""
+    return {key: value for key, value in article.items() if key != "fetched_at"}
+
+
+def scraper_for(wiki, store, **options) -> WikipediaScraper:
+    return WikipediaScraper(store=store, api_url=wiki.api_url, session=requests.Session(), **options)
+
+
+def test_fresh_articles_are_served_from_the_store(wiki, store):
+    scraper = scraper_for(wiki, store)
+    first = scraper.fetch_article("Python")
+
+    second = scraper.fetch_article("Python")
+
+    assert wiki.requests == {"extracts|info": 1}
+    assert content(second) == content(first)
+    assert second["text"].startswith("Python is a language.")
+    assert second["source"] == SOURCE_EXTRACT
+
+
+def test_expired_article_is_revalidated_by_revision_id(wiki, store):
+    scraper = scraper_for(wiki, store, ttl=0)
+    first = scraper.fetch_article("Python")
+
+    second = scraper.fetch_article("Python")
+
+    assert wiki.requests == {"extracts|info": 1, "info": 1}
+    assert second["revision_id"] == first["revision_id"]
+    assert second["text"] == first["text"]
+
+
+def test_edited_article_is_downloaded_again(wiki, store):
+    scraper = scraper_for(wiki, store, ttl=0)
+    first = scraper.fetch_article("Python")
+    wiki.edit("Python", "Python is a popular language.")
+
+    second = scraper.fetch_article("Python")
+
+    assert wiki.requests == {"extracts|info": 2, "info": 1}
+    assert second["revision_id"] == first["revision_id"] + 1
+    assert second["text"] == "Python is a popular language."
+    assert store.get("Python")["revision_id"] == second["revision_id"]
+
+
+def test_offline_scraper_never_touches_the_network(wiki, store):
+    scraper_for(wiki, store).fetch_article("Python")
+    offline = scraper_for(wiki, store, ttl=0, offline=True)
+
+    assert offline.fetch_article("Python")["text"].startswith("Python is a language.")
+    assert offline.fetch_article("Rust") is None
+    assert wiki.request_count == 1
+
+
+def test_bulk_fetch_revalidates_in_batches(wiki, store):
+    scraper = scraper_for(wiki, store, ttl=0)
+    first = scraper.fetch_articles(["Python", "Rust", "Golang", "Missing"])
+    wiki.edit("Rust", "Rust is a systems language.")
+
+    second = scraper.fetch_articles(["Python", "Rust", "Golang", "Missing"])
+
+    assert first["Missing"] is None and second["Missing"] is None
+    assert first["Golang"]["title"] == "Go"
+    assert first["Golang"]["text"] == "Go is a language."  # do wikitext, sem a marcação
+    assert second["Rust"]["text"] == "Rust is a systems language."
+    assert content(second["Python"]) == content(first["Python"])
+    # Na segunda vez: 1 revalidação dos guardados, "Rust" baixado de novo e
+    # "Missing" (que não fica no store) pedido outra vez em um lote à parte
+    assert wiki.requests == {"revisions|info": 3, "info": 1}
+
+
+def test_single_and_bulk_paths_keep_their_own_text(wiki, store):
+    scraper = scraper_for(wiki, store)
+    single = scraper.fetch_article("Go")
+    bulk = scraper.fetch_articles(["Go"])["Go"]
+
+    assert single["source"] == SOURCE_EXTRACT and bulk["source"] == SOURCE_WIKITEXT
+    # Cada caminho volta a servir o texto que ele mesmo guardou
+    assert content(scraper.fetch_article("Go")) == content(single)
+    assert content(scraper.fetch_articles(["Go"])["Go"]) == content(bulk)
+    assert wiki.requests == {"extracts|info": 1, "revisions|info": 1}
+
+
+def test_bulk_fetch_follows_continuations(store):
+    pages = {f"Page {i}": f"Text of page {i}." for i in range(12)}
+    with MockMediaWiki(pages, content_limit=5) as wiki:
+        articles = scraper_for(wiki, store).fetch_articles(pages)
+
+    assert {title: article["text"] for title, article in articles.items()} == pages
+    assert wiki.requests == {"revisions|info": 3}
+
+
+def test_bulk_fetch_keeps_store_io_off_the_event_loop(wiki, store, monkeypatch):
+    loop_thread = threading.get_ident()
+    calls = []
+    for name in ("get", "put_many", "touch_many"):
+        original = getattr(store, name)
+
+        def spy(*args, _original=original, _name=name, **kwargs):
+            calls.append((_name, threading.get_ident() != loop_thread))
+            return _original(*args, **kwargs)
+        monkeypatch.setattr(store, name, spy)
+    scraper = scraper_for(wiki, store, ttl=0)
+
+    scraper.fetch_articles(["Python", "Rust"])
+    scraper.fetch_articles(["Python", "Rust"])
+
+    assert {name for name, _ in calls} == {"get", "put_many", "touch_many"}
+    assert all(off_loop for _, off_loop in calls)
+    assert calls.count(("put_many", True)) == 1  # Um commit para o lote inteiro